@@ -0,0 +1,73 @@
+"""Microbenchmarks for the compact game core.
+
+Measures retained memory per dealt game, suspicion resolution (finding
+the disprover, without the Deduction updates) on the standard deck and on
+a large variant, and the cost of building the pydantic view that API
+responses use.
+
+    python benchmarks/bench_core.py
+"""
+import os
+import sys
+import random
+import timeit
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.clue.game_logic import ClueGame
+
+GAMES = 1000
+ROUNDS = 20000
+LARGE_SUSPECTS, LARGE_WEAPONS, LARGE_ROOMS, LARGE_PLAYERS = 40, 40, 60, 8
+
+
+def time_resolve(label, game):
+    rng = random.Random(0)
+    categories = game.deck.categories
+    num_players = len(game.state.players)
+    suspicions = [
+        (rng.choice(categories["suspect"]), rng.choice(categories["weapon"]), rng.choice(categories["room"]), rng.randrange(num_players))
+        for _ in range(ROUNDS)
+    ]
+    # Only finding the disprover, not the deduction or log work handle_suspicion also does
+    game.deductions = []
+    game.add_log = lambda message: None
+
+    def resolve():
+        for suspect, weapon, room, player in suspicions:
+            game.handle_suspicion(suspect, weapon, room, player)
+
+    resolve_time = timeit.timeit(resolve, number=1)
+    print(f"{label}: {resolve_time / ROUNDS * 1e6:8.2f} us")
+
+
+def run():
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    games = []
+    for seed in range(GAMES):
+        game = ClueGame()
+        game.initialize_game("Miss Scarlet", seed=seed)
+        games.append(game)
+    per_game = (tracemalloc.get_traced_memory()[0] - before) / GAMES
+    tracemalloc.stop()
+    print(f"memory per dealt game: {per_game / 1024:8.1f} KiB")
+
+    time_resolve("resolve suspicion (21 cards, 4 players)", games[0])
+
+    rooms = [f"Room {i}" for i in range(LARGE_ROOMS)]
+    large = ClueGame()
+    large.initialize_game(
+        None, num_ai_players=LARGE_PLAYERS, seed=0, hand_size=None,
+        categories={"suspect": [f"Suspect {i}" for i in range(LARGE_SUSPECTS)], "weapon": [f"Weapon {i}" for i in range(LARGE_WEAPONS)]},
+        board={room: [rooms[i - 1], rooms[(i + 1) % LARGE_ROOMS]] for i, room in enumerate(rooms)},
+    )
+    time_resolve(f"resolve suspicion ({len(large.deck)} cards, {LARGE_PLAYERS} players)", large)
+
+    view_time = timeit.timeit(games[1].view, number=ROUNDS // 10)
+    print(f"build pydantic view: {view_time / (ROUNDS // 10) * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,63 @@
+"""Microbenchmarks for the bitset deduction engine.
+
+Measures the cost of applying one suspicion outcome (including propagation
+to a fixed point) and of the queries decide_accusation makes.
+
+    python benchmarks/bench_deduction.py
+"""
+import os
+import sys
+import random
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.clue.deduction import Deduction
+from src.clue.game_logic import CATEGORIES, SUSPECTS, WEAPONS, ROOMS
+
+NUM_PLAYERS = 4
+ROUNDS = 20000
+
+
+def fresh():
+    deduction = Deduction(CATEGORIES, [4] * NUM_PLAYERS)
+    deduction.see_hand(0, ["Miss Scarlet", "Dagger", "Kitchen", "Hall"])
+    return deduction
+
+
+def random_outcome(rng):
+    cards = [rng.choice(SUSPECTS), rng.choice(WEAPONS), rng.choice(ROOMS)]
+    suspector = rng.randrange(NUM_PLAYERS)
+    others = [(suspector + i) % NUM_PLAYERS for i in range(1, NUM_PLAYERS)]
+    cut = rng.randrange(len(others) + 1)
+    shower = others[cut] if cut < len(others) else None
+    return suspector, cards, others[:cut], shower
+
+
+def run():
+    rng = random.Random(0)
+    outcomes = [random_outcome(rng) for _ in range(ROUNDS)]
+
+    # Reset every 40 suspicions so we measure a realistic game-sized state,
+    # not a fully solved one where propagation is trivially cheap.
+    def update():
+        deduction = fresh()
+        for i, (suspector, cards, passed, shower) in enumerate(outcomes):
+            if i % 40 == 0:
+                deduction = fresh()
+            deduction.observe_suspicion(suspector, cards, passed, shower)
+
+    setup_time = timeit.timeit(lambda: [fresh() for _ in range(ROUNDS // 40 + 1)], number=1)
+    update_time = timeit.timeit(update, number=1) - setup_time
+    print(f"update (observe + propagate): {update_time / ROUNDS * 1e6:8.2f} us")
+
+    deduction = fresh()
+    for suspector, cards, passed, shower in outcomes[:20]:
+        deduction.observe_suspicion(suspector, cards, passed, shower)
+    query = lambda: (deduction.candidates("suspect"), deduction.candidates("weapon"), deduction.candidates("room"))
+    query_time = timeit.timeit(query, number=ROUNDS)
+    print(f"query (three candidate lists): {query_time / ROUNDS * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,80 @@
+"""Load test of the LLM path against the local stub server.
+
+CALLERS threads (think: tables with an AI turn in flight) each make CALLS
+model calls through one shared LLMPool, with the stub answering after a
+log-normal latency, stalling a few requests and failing a few more. Reports latency
+percentiles and throughput without and with hedging, under the pool's
+capacity (where hedges have spare slots and cut the tail) and over it
+(where callers queue and hedging mostly stands aside).
+
+    python benchmarks/bench_llm.py [callers] [median_seconds]
+"""
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.clue.llm import ChatCompletionsClient, LLMError, LLMPool
+from src.clue.llm_stub import StubLLMServer
+
+CALLERS = 32
+CALLS = 8
+MEDIAN = 0.2
+SIGMA = 0.6
+ERROR_RATE = 0.02
+STALL_RATE = 0.03  # each stall adds 10x the median
+MAX_CONCURRENCY = 8
+MESSAGES = [{"role": "user", "content": "You rolled a 7 and can move to: Kitchen, Ballroom, Hall. Return ONLY the room."}]
+
+
+def load(pool, callers, calls):
+    latencies, failures = [], []
+    lock = threading.Lock()
+
+    def caller():
+        for _ in range(calls):
+            start = time.perf_counter()
+            try:
+                pool.complete(MESSAGES)
+            except LLMError as e:
+                with lock:
+                    failures.append(e)
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=caller) for _ in range(callers)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies, failures, time.perf_counter() - start
+
+
+def run(callers=CALLERS, median=MEDIAN):
+    for load_callers in (MAX_CONCURRENCY // 2, callers):
+        print(f"{load_callers} callers, {MAX_CONCURRENCY} slots:")
+        run_load(load_callers, median)
+
+
+def run_load(callers, median):
+    for hedge_after in (None, median * 2):
+        server = StubLLMServer(median=median, sigma=SIGMA, error_rate=ERROR_RATE, seed=0,
+                               stall_rate=STALL_RATE, stall_seconds=median * 10).start()
+        pool = LLMPool(ChatCompletionsClient(server.base_url, "stub", max_connections=MAX_CONCURRENCY),
+                       max_concurrency=MAX_CONCURRENCY, deadline=median * 50, backoff=median / 2, hedge_after=hedge_after)
+        latencies, failures, elapsed = load(pool, callers, max(CALLS, 128 // callers))
+        pool.close()
+        server.stop()
+        q = statistics.quantiles(latencies, n=100)
+        label = "no hedging" if hedge_after is None else f"hedge after {hedge_after:.2f}s"
+        print(f"{label:>18}: p50 {q[49]:6.2f}s  p95 {q[94]:6.2f}s  p99 {q[98]:6.2f}s  "
+              f"{len(latencies) / elapsed:6.1f} calls/s  {len(failures)} failed  {server.requests} requests to the stub")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else CALLERS, float(sys.argv[2]) if len(sys.argv) > 2 else MEDIAN)
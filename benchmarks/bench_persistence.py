@@ -0,0 +1,67 @@
+"""Benchmark for event-log persistence.
+
+Plays GAMES short random games with an EventStore attached, then measures
+what recording costs on the request path and how long restoring every game
+from a fresh store takes.
+
+    python benchmarks/bench_persistence.py [games]
+"""
+import os
+import sys
+import random
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.clue.game_logic import ClueGame
+from src.clue.persistence import EventStore
+from src.clue.policies import RandomPolicy
+from src.clue.turns import play_turn
+
+GAMES = 10000
+TURNS = 12
+SNAPSHOT_EVERY = 50  # Low enough that restore exercises both snapshots and replay
+
+
+def play(store, games):
+    policy = RandomPolicy(random.Random(0))
+    for i in range(games):
+        game = ClueGame()
+        if store is not None:
+            store.attach(f"game-{i}", game)
+        game.initialize_game(None, num_ai_players=4, seed=i)
+        for _ in range(TURNS):
+            play_turn(game, policy)
+
+
+def run(games=GAMES):
+    start = time.perf_counter()
+    play(None, games)
+    baseline = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "games.db")
+        store = EventStore(path, snapshot_every=SNAPSHOT_EVERY)
+        start = time.perf_counter()
+        play(store, games)
+        recorded = time.perf_counter() - start
+        store.flush()
+        drained = time.perf_counter() - start
+        events = sum(store._seq.values())
+        store.close()
+        print(f"{events} events from {games} games")
+        print(f"record overhead on the game thread: {(recorded - baseline) / events * 1e6:8.2f} us/event")
+        print(f"writer caught up after:             {drained:8.2f} s (games alone: {baseline:.2f} s)")
+        print(f"store size:                         {os.path.getsize(path) / 2 ** 20:8.1f} MiB")
+
+        store = EventStore(path)
+        start = time.perf_counter()
+        restored = store.restore()
+        elapsed = time.perf_counter() - start
+        store.close()
+        print(f"restore {len(restored)} games:              {elapsed:8.2f} s ({elapsed / len(restored) * 1e3:.2f} ms/game)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else GAMES)
@@ -0,0 +1,54 @@
+"""Throughput of the vectorized Monte Carlo solution estimator.
+
+Reports raw deals sampled per second, accepted (consistent) deals per
+second and the wall time of one decide_accusation-sized estimate at
+several points of a game.
+
+    python benchmarks/bench_probability.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.clue.game_logic import ClueGame, SUSPECTS, WEAPONS, ROOMS
+from src.clue.probability import SolutionEstimator
+
+CHECKPOINTS = [0, 8, 16, 32]
+BATCH = 4096
+ROUNDS = 50
+
+
+def run():
+    rng = np.random.default_rng(0)
+    game = ClueGame()
+    state = game.initialize_game("Miss Scarlet")
+    played = 0
+    print(f"{'suspicions':>10} {'drawn/s':>12} {'accepted/s':>12} {'estimate (ms)':>14}")
+    for checkpoint in CHECKPOINTS:
+        while played < checkpoint:
+            game.handle_suspicion(SUSPECTS[rng.integers(6)], WEAPONS[rng.integers(6)], ROOMS[rng.integers(9)], state.current_player_index)
+            game.next_turn()
+            played += 1
+
+        estimator = SolutionEstimator(game.deductions[1])
+        if not estimator.free_categories:
+            print(f"{checkpoint:>10} solved")
+            continue
+        accepted = 0
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            accepted += int(estimator.sample(rng, BATCH)[1].sum())
+        elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        estimator.estimate(rng)
+        estimate_ms = (time.perf_counter() - start) * 1000
+        print(f"{checkpoint:>10} {ROUNDS * BATCH / elapsed:>12,.0f} {accepted / elapsed:>12,.0f} {estimate_ms:>14.2f}")
+
+
+if __name__ == "__main__":
+    run()
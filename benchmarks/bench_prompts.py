@@ -0,0 +1,150 @@
+"""Compact prompts (prompts.PromptBuilder) against the original ClueAI prompts.
+
+Plays a few turns so notebooks are non-trivial, then sends every AI seat's
+move and suspicion prompt, in both styles, through an LLMPool to the local
+stub model. The stub charges per prompt token, so prompt size shows up in
+latency the way it does with a hosted model; the answer (a room, or a
+suspect and a weapon) is the same size in both styles and is folded into
+the base latency. The original
+prompts are rebuilt here as they were (raw notebook dict, hand list and the
+full backstory) and sent without CrewAI's own scaffolding, so the
+comparison understates what they cost in production.
+
+    python benchmarks/bench_prompts.py [turns]
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from textwrap import dedent
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.clue.game_logic import ClueGame
+from src.clue.llm import ChatCompletionsClient, LLMPool
+from src.clue.llm_stub import StubLLMServer
+from src.clue.policies import RandomPolicy
+from src.clue.prompts import PromptBuilder, estimate_tokens
+from src.clue.turns import play_turn
+
+TURNS = 12
+PREFILL_PER_TOKEN = 0.001  # ~1k prompt tokens/s, including queueing at the provider
+BASE_LATENCY = 0.3         # connection, first token and a ~8 token answer
+
+BACKSTORIES = {
+    "Miss Scarlet": "Cunning, charming, and deceptive. You are a femme fatale who uses her wits to get what she wants.",
+    "Colonel Mustard": "A dignified, dapper military man. You are pompous and somewhat blustery.",
+    "Mrs. White": "A frazzled and intrusive housekeeper. You know all the secrets but try to appear innocent.",
+    "Mr. Green": "A slick, smooth-talking businessman. You are always looking for an angle.",
+    "Mrs. Peacock": "An elegant, socialite widow. You are proper, but have a sharp tongue.",
+    "Professor Plum": "A quick-witted academic. You are arrogant and intellectual.",
+}
+
+
+def legacy_system(player):
+    return dedent(f"""
+        You are playing a game of Clue.
+        {BACKSTORIES.get(player.character_name, "A mysterious guest at the mansion.")}
+        Your objective is to figure out the solution cards (Room, Weapon, Suspect) held by the manager.
+        You have a hand of cards and a notebook of information.
+        Make logical deductions and try to mislead opponents if necessary.
+    """)
+
+
+def legacy_move(player, valid_moves):
+    return dedent(f"""
+        It is your turn to move.
+        You are currently in {player.position}.
+        You rolled the dice and can move to the following rooms: {', '.join(valid_moves)}.
+
+        Your hand: {[c.name for c in player.hand]}
+        Your notebook (known info): {player.notebook}
+
+        Choose the best room to move to.
+        Consider:
+        1. Rooms you haven't visited or need to investigate.
+        2. Making a suspicion in a room to gather info.
+
+        Return ONLY the name of the room you want to move to.
+    """)
+
+
+def legacy_suspicion(player, room, suspects, weapons):
+    return dedent(f"""
+        You are in the {room}.
+        You need to make a suspicion to gather information.
+        A suspicion consists of a Suspect and a Weapon. The Room is fixed to your current location ({room}).
+
+        Your hand: {[c.name for c in player.hand]}
+        Your notebook (known info): {player.notebook}
+
+        Choose a Suspect and a Weapon to suspect.
+        Strategy:
+        - Don't suspect cards you hold in your hand (unless bluffing, but usually better to ask about unknowns).
+        - Try to narrow down possibilities.
+
+        Available Suspects: {', '.join(suspects)}
+        Available Weapons: {', '.join(weapons)}
+
+        Return your choice in the format: "Suspect: [Name], Weapon: [Name]"
+    """)
+
+
+def prompts(game):
+    """(legacy messages, compact messages) for every AI seat's move and suspicion."""
+    builder = PromptBuilder()
+    suspects, weapons = game.deck.categories["suspect"], game.deck.categories["weapon"]
+    pairs = []
+    for index, player in enumerate(game.state.players):
+        if player.is_human:
+            continue
+        knowledge = game.deductions[index]
+        valid_moves = game.get_valid_moves(player.position, 7)
+        system = legacy_system(player)
+        pairs.append((
+            [{"role": "system", "content": system}, {"role": "user", "content": legacy_move(player, valid_moves)}],
+            builder.move(player, valid_moves, knowledge).messages(),
+        ))
+        pairs.append((
+            [{"role": "system", "content": system}, {"role": "user", "content": legacy_suspicion(player, player.position, suspects, weapons)}],
+            builder.suspicion(player, player.position, suspects, weapons, knowledge).messages(),
+        ))
+    return pairs
+
+
+def run(turns=TURNS):
+    game = ClueGame()
+    game.initialize_game("Miss Scarlet", num_ai_players=3, seed=7)
+    policy = RandomPolicy(random.Random(0))
+    for _ in range(turns):
+        if game.state.players[game.state.current_player_index].is_human:
+            game.next_turn()
+        play_turn(game, policy)
+    pairs = prompts(game)
+
+    builder = PromptBuilder()
+    player = game.state.players[1]
+    start = time.perf_counter()
+    for _ in range(1000):
+        builder.move(player, ["Kitchen", "Hall", "Lounge"], game.deductions[1])
+    print(f"building a compact move prompt: {(time.perf_counter() - start) * 1e3:.1f} us")
+
+    server = StubLLMServer(median=BASE_LATENCY, sigma=0.0, prefill_per_token=PREFILL_PER_TOKEN).start()
+    pool = LLMPool(ChatCompletionsClient(server.base_url, "stub"))
+    for label, column in (("original", 0), ("compact", 1)):
+        latencies, prompt_tokens = [], []
+        for pair in pairs:
+            start = time.perf_counter()
+            completion = pool.complete(pair[column])
+            latencies.append(time.perf_counter() - start)
+            prompt_tokens.append(completion.prompt_tokens)
+        local = statistics.mean(sum(estimate_tokens(m["content"]) for m in pair[column]) for pair in pairs)
+        print(f"{label:>9}: {statistics.mean(latencies) * 1e3:7.1f} ms/call  "
+              f"{statistics.mean(prompt_tokens):6.1f} prompt tokens (estimated {local:.1f})  over {len(pairs)} prompts")
+    pool.close()
+    server.stop()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else TURNS)
@@ -0,0 +1,53 @@
+"""Per-request latency of game-scoped endpoints as the number of live sessions grows.
+
+Runs in-process against the ASGI app, so it measures the registry and
+game logic rather than the network stack.
+
+    python benchmarks/bench_sessions.py
+"""
+import os
+import sys
+import time
+import random
+import statistics
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi.testclient import TestClient
+from src.clue.server import app, sessions
+
+SESSION_COUNTS = [10, 100, 1000, 10000]
+REQUESTS_PER_STEP = 500
+
+
+def grow_to(client, game_ids, target):
+    while len(game_ids) < target:
+        response = client.post("/game/start", json={"human_character": "Miss Scarlet"})
+        game_ids.append(response.json()["game_id"])
+
+
+def measure(client, game_ids):
+    samples = []
+    for _ in range(REQUESTS_PER_STEP):
+        game_id = random.choice(game_ids)
+        start = time.perf_counter()
+        response = client.get(f"/game/{game_id}/state")
+        samples.append(time.perf_counter() - start)
+        assert response.status_code == 200
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def run():
+    sessions.max_sessions = max(SESSION_COUNTS)
+    client = TestClient(app)
+    game_ids = []
+    print(f"{'sessions':>10} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    for count in SESSION_COUNTS:
+        grow_to(client, game_ids, count)
+        p50, p99 = measure(client, game_ids)
+        print(f"{len(sessions):>10} {p50 * 1000:>10.3f} {p99 * 1000:>10.3f}")
+
+
+if __name__ == "__main__":
+    run()
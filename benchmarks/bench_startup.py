@@ -0,0 +1,33 @@
+"""Startup-time budget for the API server.
+
+Imports the server in fresh interpreters (as uvicorn does on every start
+and reload) and fails if the median import time exceeds the budget.
+
+    python benchmarks/bench_startup.py [budget_seconds]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+DEFAULT_BUDGET = 2.0
+RUNS = 5
+
+
+def run(budget=DEFAULT_BUDGET):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import src.clue.server"], cwd=ROOT, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    print(f"server import: median {median:.2f}s, min {min(times):.2f}s over {RUNS} runs (budget {budget:.2f}s)")
+    return median <= budget
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run(float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET) else 1)
@@ -0,0 +1,78 @@
+"""Suspicion quality and latency of the information-gain optimizer vs. simple policies.
+
+Every seat suspects in a random room each turn using the policy under test.
+After a fixed number of suspicions we report how many solution combinations
+each seat's deduction engine still considers possible (log2, lower is
+better). The two undealt cards usually keep a full solve out of reach, so
+this is a better yardstick than turns-to-certainty. Each decision is timed.
+
+    python benchmarks/bench_strategy.py
+"""
+import os
+import sys
+import time
+import statistics
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.clue.game_logic import ClueGame, SUSPECTS, WEAPONS, ROOMS
+from src.clue.strategy import choose_suspicion
+
+GAMES = 40
+SUSPICIONS = 40
+
+
+def first_cards(game, index, room, rng):
+    # What decide_suspicion falls back to when the LLM reply cannot be parsed
+    return {"suspect": SUSPECTS[0], "weapon": WEAPONS[0], "room": room}
+
+
+def random_cards(game, index, room, rng):
+    return {"suspect": SUSPECTS[rng.integers(len(SUSPECTS))], "weapon": WEAPONS[rng.integers(len(WEAPONS))], "room": room}
+
+
+def optimizer(game, index, room, rng):
+    return choose_suspicion(game.deductions[index], index, room, rng)
+
+
+POLICIES = {"first": first_cards, "random": random_cards, "optimizer": optimizer}
+
+
+def remaining_bits(deduction):
+    combinations = 1
+    for category in ("suspect", "weapon", "room"):
+        combinations *= len(deduction.candidates(category))
+    return float(np.log2(combinations))
+
+
+def play(policy, seed):
+    rng = np.random.default_rng(seed)
+    game = ClueGame()
+    state = game.initialize_game("Miss Scarlet")
+    timings = []
+    for _ in range(SUSPICIONS):
+        index = state.current_player_index
+        room = ROOMS[rng.integers(len(ROOMS))]
+        start = time.perf_counter()
+        choice = policy(game, index, room, rng)
+        timings.append(time.perf_counter() - start)
+        game.handle_suspicion(choice["suspect"], choice["weapon"], choice["room"], index)
+        game.next_turn()
+    return [remaining_bits(d) for d in game.deductions], timings
+
+
+def run():
+    print(f"{'policy':>10} {'bits left':>10} {'ms / decision':>14}")
+    for name, policy in POLICIES.items():
+        bits, timings = [], []
+        for seed in range(GAMES):
+            b, t = play(policy, seed)
+            bits.extend(b)
+            timings.extend(t)
+        print(f"{name:>10} {statistics.mean(bits):>10.2f} {statistics.mean(timings) * 1000:>14.3f}")
+
+
+if __name__ == "__main__":
+    run()
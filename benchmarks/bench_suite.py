@@ -0,0 +1,170 @@
+"""Regression benchmarks for the game-logic and API hot paths.
+
+Runs in-process: game logic is called directly and the API goes through
+the ASGI app with a stubbed ClueAI, so no server, network or model is
+involved. Each case reports the best of several repeats in microseconds
+per operation and is compared with baseline.json next to this file; a
+case fails when it is slower than baseline * threshold.
+
+    python benchmarks/bench_suite.py                   # compare, exit 1 on regressions
+    python benchmarks/bench_suite.py --update-baseline # record this machine's numbers
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+# Loose by default: the point is catching step changes, not 10% noise
+DEFAULT_THRESHOLD = 1.5
+REPEATS = 5
+
+# No model backend and no warm-up, whatever the environment says
+os.environ["CLUE_AI_BACKEND"] = "heuristic"
+
+from fastapi.testclient import TestClient
+
+from src.clue import server
+from src.clue.ai_backend import LazyAIBackend
+from src.clue.game_logic import ClueGame
+
+
+class StubClueAI:
+    """Answers like ClueAI instantly and deterministically, so API timings exclude the model."""
+
+    batches_moves = False
+
+    def decide_move(self, player, valid_moves, game_state, knowledge=None, planner=None):
+        return valid_moves[0] if valid_moves else None
+
+    def decide_suspicion(self, player, current_room, game_state, all_suspects, all_weapons, knowledge=None):
+        return {"suspect": all_suspects[0], "weapon": all_weapons[0], "room": current_room}
+
+    def decide_accusation(self, player, game_state, knowledge=None):
+        return None
+
+
+def per_op(fn, number):
+    """Best-of-REPEATS microseconds per call."""
+    return min(timeit.repeat(fn, number=number, repeat=REPEATS)) / number * 1e6
+
+
+def new_game(seed=1):
+    game = ClueGame()
+    game.initialize_game("Miss Scarlet", seed=seed)
+    return game
+
+
+def bench_initialize_game():
+    return per_op(new_game, 500)
+
+
+def bench_get_valid_moves():
+    game = new_game()
+    return per_op(lambda: game.get_valid_moves("Kitchen", 8), 20000)
+
+
+def bench_handle_suspicion():
+    game = new_game()
+    return per_op(lambda: game.handle_suspicion("Mr. Green", "Rope", "Hall", 1), 2000)
+
+
+def bench_next_turn():
+    game = new_game()
+    return per_op(game.next_turn, 5000)
+
+
+def bench_state_view():
+    game = new_game()
+    return per_op(game.view, 2000)
+
+
+def bench_state_json():
+    game = new_game()
+    return per_op(lambda: game.view().model_dump_json(), 2000)
+
+
+def _client():
+    server.ai_backend = LazyAIBackend(StubClueAI)
+    return TestClient(server.app)
+
+
+def bench_api_get_state():
+    client = _client()
+    game_id = client.post("/game/start", json={"human_character": "Miss Scarlet", "seed": 1}).json()["game_id"]
+    return per_op(lambda: client.get(f"/game/{game_id}/state"), 200)
+
+
+def bench_api_ai_turn():
+    """One AI turn end to end: submit the job, then poll until it has finished."""
+    client = _client()
+    game_id = client.post("/game/start", json={"human_character": "Miss Scarlet", "seed": 1}).json()["game_id"]
+    client.post(f"/game/{game_id}/pass")
+
+    def ai_turn():
+        state = client.get(f"/game/{game_id}/state").json()
+        if state["players"][state["current_player_index"]]["is_human"]:
+            client.post(f"/game/{game_id}/pass")
+        job = client.post(f"/game/{game_id}/ai-turn").json()
+        while client.get(f"/game/{game_id}/ai-turn/{job['job_id']}").json()["status"] in ("pending", "running"):
+            time.sleep(0)
+
+    return per_op(ai_turn, 50)
+
+
+CASES = {
+    "initialize_game": bench_initialize_game,
+    "get_valid_moves": bench_get_valid_moves,
+    "handle_suspicion": bench_handle_suspicion,
+    "next_turn": bench_next_turn,
+    "state_view": bench_state_view,
+    "state_json": bench_state_json,
+    "api_get_state": bench_api_get_state,
+    "api_ai_turn": bench_api_ai_turn,
+}
+
+
+def run(update_baseline=False, only=None):
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+
+    results, regressions = {}, []
+    for name, case in CASES.items():
+        if only and name not in only:
+            continue
+        us = case()
+        results[name] = us
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{name:>18}: {us:10.2f} us   (no baseline)")
+            continue
+        limit = reference["us"] * reference.get("threshold", DEFAULT_THRESHOLD)
+        status = "ok" if us <= limit else "REGRESSION"
+        if us > limit:
+            regressions.append(name)
+        print(f"{name:>18}: {us:10.2f} us   baseline {reference['us']:10.2f}   x{us / reference['us']:5.2f}  {status}")
+
+    if update_baseline:
+        for name, us in results.items():
+            threshold = baseline.get(name, {}).get("threshold", DEFAULT_THRESHOLD)
+            baseline[name] = {"us": round(us, 2), "threshold": threshold}
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+        return True
+    return not regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("cases", nargs="*", help=f"Subset of: {', '.join(CASES)}")
+    args = parser.parse_args()
+    sys.exit(0 if run(args.update_baseline, set(args.cases)) else 1)
@@ -16,6 +16,7 @@ function App() {
     const [gameStarted, setGameStarted] = useState(false);
     const [loading, setLoading] = useState(false);
     const [showRules, setShowRules] = useState(false);
+    const [logs, setLogs] = useState([]);
     const logsEndRef = useRef(null);
 
     const scrollToBottom = () => {
@@ -24,7 +25,17 @@ function App() {
 
     useEffect(() => {
         scrollToBottom();
-    }, [gameState?.logs]);
+    }, [logs]);
+
+    // The state only carries a cursor; fetch the log lines we have not seen yet
+    useEffect(() => {
+        if (!gameState) return;
+        const lastSeen = logs.length ? logs[logs.length - 1].seq : 0;
+        if (gameState.log_cursor <= lastSeen) return;
+        api.getLogs(lastSeen)
+            .then(res => setLogs(prev => [...prev, ...res.data.entries.filter(e => e.seq > lastSeen)]))
+            .catch(err => console.error("Failed to get logs", err));
+    }, [gameState?.log_cursor]);
 
     useEffect(() => {
         api.getConstants().then(res => setConstants(res.data));
@@ -34,6 +45,7 @@ function App() {
         setLoading(true);
         try {
             const res = await api.startGame(character);
+            setLogs([]);
             setGameState(res.data);
             setHumanCharacter(character);
             setGameStarted(true);
@@ -59,15 +71,29 @@ function App() {
         const currentPlayer = gameState.players[gameState.current_player_index];
         if (!currentPlayer.is_human && !gameState.winner) {
             // AI Turn
+            let cancelled = false;
             const timer = setTimeout(async () => {
                 try {
-                    const res = await api.playAiTurn();
-                    setGameState(res.data);
+                    // Every AI turn up to ours runs as one background job; poll until it settles
+                    let job = (await api.playAiRound()).data;
+                    while (!cancelled && (job.status === 'pending' || job.status === 'running')) {
+                        await new Promise(resolve => setTimeout(resolve, 500));
+                        job = (await api.getAiTurn(job.job_id)).data;
+                    }
+                    if (cancelled) return;
+                    if (job.state) {
+                        setGameState(job.state);
+                    } else {
+                        console.error("AI turn did not complete", job);
+                    }
                 } catch (err) {
                     console.error("AI turn failed", err);
                 }
             }, 2000); // Delay for visual effect
-            return () => clearTimeout(timer);
+            return () => {
+                cancelled = true;
+                clearTimeout(timer);
+            };
         }
     }, [gameState, gameStarted]);
 
@@ -100,8 +126,8 @@ function App() {
                         <h3>Game Log</h3>
                         <h4>Because I'm a backend developer</h4>
                         <div className="logs">
-                            {gameState.logs.map((log, i) => (
-                                <div key={i} className="log-entry">{log}</div>
+                            {logs.map(log => (
+                                <div key={log.seq} className="log-entry">{log.message}</div>
                             ))}
                             <div ref={logsEndRef} />
                         </div>
@@ -2,14 +2,25 @@ import axios from 'axios';
 
 const API_URL = import.meta.env.PROD ? '/clue/api' : 'http://localhost:8001';
 
+// Every table lives in its own server-side session; remember which one is ours.
+let gameId = null;
+const gameUrl = (path) => `${API_URL}/game/${gameId}/${path}`;
+
 export const api = {
-    startGame: (humanCharacter) => axios.post(`${API_URL}/game/start`, { human_character: humanCharacter }),
-    getState: () => axios.get(`${API_URL}/game/state`),
-    rollDice: () => axios.post(`${API_URL}/game/roll`),
-    move: (destination) => axios.post(`${API_URL}/game/move`, { destination_room: destination }),
-    suspect: (suspect, weapon, room) => axios.post(`${API_URL}/game/suspect`, { suspect, weapon, room }),
-    accuse: (suspect, weapon, room) => axios.post(`${API_URL}/game/accuse`, { suspect, weapon, room }),
-    passTurn: () => axios.post(`${API_URL}/game/pass`),
-    playAiTurn: () => axios.post(`${API_URL}/game/ai-turn`),
+    startGame: (humanCharacter) => axios.post(`${API_URL}/game/start`, { human_character: humanCharacter })
+        .then(res => {
+            gameId = res.data.game_id;
+            return res;
+        }),
+    getState: () => axios.get(gameUrl('state')),
+    getLogs: (after, limit = 1000) => axios.get(gameUrl('logs'), { params: { after, limit } }),
+    rollDice: () => axios.post(gameUrl('roll')),
+    move: (destination) => axios.post(gameUrl('move'), { destination_room: destination }),
+    suspect: (suspect, weapon, room) => axios.post(gameUrl('suspect'), { suspect, weapon, room }),
+    accuse: (suspect, weapon, room) => axios.post(gameUrl('accuse'), { suspect, weapon, room }),
+    passTurn: () => axios.post(gameUrl('pass')),
+    playAiTurn: () => axios.post(gameUrl('ai-turn')),
+    playAiRound: () => axios.post(gameUrl('ai-run')),
+    getAiTurn: (jobId) => axios.get(gameUrl(`ai-turn/${jobId}`)),
     getConstants: () => axios.get(`${API_URL}/game/constants`),
 };
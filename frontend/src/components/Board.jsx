@@ -14,8 +14,8 @@ function Board({ gameState, onMove }) {
 
     const currentPlayer = gameState.players[gameState.current_player_index];
     const isHumanTurn = currentPlayer.is_human;
-    // Only show available moves if dice have been rolled (and there are moves)
-    const availableMoves = (gameState.dice_rolled && gameState.available_moves) ? gameState.available_moves : [];
+    // Only show available moves if we have rolled (and there are moves); AI seats' rolls are not ours to click
+    const availableMoves = (isHumanTurn && gameState.dice_rolled && gameState.available_moves) ? gameState.available_moves : [];
 
     const handleRoomClick = async (roomName) => {
         if (isHumanTurn && availableMoves.includes(roomName)) {
@@ -0,0 +1,82 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List
+
+# Idle agents kept for reuse, per kind (character persona) ...
+DEFAULT_MAX_IDLE_PER_KIND = 8
+# ... and games holding agents at once; past this the least recently used
+# game's agents are released even if it never reported its end.
+DEFAULT_MAX_GAMES = 1024
+
+
+class AgentPool:
+    """Model-side agents scoped to a game, reused through a bounded idle pool.
+
+    checkout() hands a game's seat the agent it already has, an idle agent
+    of the same kind (agents of one kind are interchangeable between
+    games), or a new one from `factory`. release() returns a finished or
+    evicted game's agents to the idle pool, keeping at most
+    `max_idle_per_kind` of each kind. Memory is bounded by the number of
+    live games, never by the number of games played.
+    """
+
+    def __init__(self, max_idle_per_kind: int = DEFAULT_MAX_IDLE_PER_KIND, max_games: int = DEFAULT_MAX_GAMES):
+        self.max_idle_per_kind = max_idle_per_kind
+        self.max_games = max_games
+        self.created = 0
+        self.reused = 0
+        self._games: "OrderedDict[Hashable, Dict[Hashable, tuple]]" = OrderedDict()  # game -> seat -> (kind, agent)
+        self._idle: Dict[Hashable, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def checkout(self, game_id: Hashable, seat: Hashable, kind: Hashable, factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            seats = self._games.get(game_id)
+            if seats is None:
+                seats = self._games[game_id] = {}
+                while len(self._games) > self.max_games:
+                    _, oldest = self._games.popitem(last=False)
+                    self._return_locked(oldest)
+            else:
+                self._games.move_to_end(game_id)
+            held = seats.get(seat)
+            if held is not None and held[0] == kind:
+                return held[1]
+            if held is not None:
+                # The seat changed character (a new game reusing the id): give back the old agent
+                self._return_locked({seat: held})
+            idle = self._idle.get(kind)
+            agent = idle.pop() if idle else None
+            if agent is not None:
+                self.reused += 1
+        if agent is None:
+            # Built outside the lock: constructing an agent can be slow
+            agent = factory()
+            with self._lock:
+                self.created += 1
+        with self._lock:
+            self._games.setdefault(game_id, {})[seat] = (kind, agent)
+        return agent
+
+    def release(self, game_id: Hashable):
+        """Returns the game's agents to the idle pool. Safe to call more than once."""
+        with self._lock:
+            seats = self._games.pop(game_id, None)
+            if seats:
+                self._return_locked(seats)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "games": len(self._games),
+                "in_use": sum(len(seats) for seats in self._games.values()),
+                "idle": sum(len(agents) for agents in self._idle.values()),
+                "created": self.created,
+                "reused": self.reused,
+            }
+
+    def _return_locked(self, seats: Dict[Hashable, tuple]):
+        for kind, agent in seats.values():
+            idle = self._idle.setdefault(kind, [])
+            if len(idle) < self.max_idle_per_kind:
+                idle.append(agent)
@@ -1,137 +1,217 @@
 import os
-from textwrap import dedent
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from crewai import Agent, Task, Crew, Process
 from src.clue.models import Player, GameState, Card
+from src.clue.deduction import Deduction
+from src.clue.strategy import DEFAULT_ACCUSATION_CONFIDENCE, choose_accusation, choose_suspicion
+from src.clue.planner import MovePlanner
+from src.clue.decision_cache import DecisionCache
+from src.clue.agent_pool import AgentPool
+from src.clue.llm import LLMPool
+from src.clue.metrics import AI_DECISION_SECONDS, DECISION_CACHE_LOOKUPS, FALLBACK_PARSES, LLM_CALL_SECONDS, LLM_CALLS, LLM_TOKENS
+from src.clue.prompts import DEFAULT_PROMPT_BUDGET, Prompt, PromptBuilder, persona
 
 # Set OpenAI API Key from env if not already set (though it should be loaded)
-# os.environ["OPENAI_API_KEY"] = ... 
+# os.environ["OPENAI_API_KEY"] = ...
+
+# How suspicions are chosen: "llm" asks the model, "optimizer" uses the local
+# information-gain search in strategy.py (the model is then only used for flavor text).
+SUSPICION_MODES = ("llm", "optimizer")
+# How moves are chosen: "llm" asks the model, "planner" uses the table-driven MovePlanner.
+MOVE_MODES = ("llm", "planner")
 
 class ClueAI:
-    def __init__(self):
-        self.agents_map = {}
-
-    def create_agent(self, player: Player) -> Agent:
-        if player.name in self.agents_map:
-            return self.agents_map[player.name]
-
-        # Define personality based on character
-        personalities = {
-            "Miss Scarlet": "Cunning, charming, and deceptive. You are a femme fatale who uses her wits to get what she wants.",
-            "Colonel Mustard": "A dignified, dapper military man. You are pompous and somewhat blustery.",
-            "Mrs. White": "A frazzled and intrusive housekeeper. You know all the secrets but try to appear innocent.",
-            "Mr. Green": "A slick, smooth-talking businessman. You are always looking for an angle.",
-            "Mrs. Peacock": "An elegant, socialite widow. You are proper, but have a sharp tongue.",
-            "Professor Plum": "A quick-witted academic. You are arrogant and intellectual."
-        }
-        
-        backstory = personalities.get(player.character_name, "A mysterious guest at the mansion.")
+    def __init__(self, accusation_confidence: float = DEFAULT_ACCUSATION_CONFIDENCE, suspicion_mode: str = "llm", flavor_text: bool = False, move_mode: str = "llm", decision_cache: Optional[DecisionCache] = None, llm_pool: Optional[LLMPool] = None, prompt_budget: int = DEFAULT_PROMPT_BUDGET, agent_pool: Optional[AgentPool] = None, verbose: bool = False):
+        if suspicion_mode not in SUSPICION_MODES:
+            raise ValueError(f"Unknown suspicion mode: {suspicion_mode}")
+        if move_mode not in MOVE_MODES:
+            raise ValueError(f"Unknown move mode: {move_mode}")
+        # CrewAI agents per game and seat, released when the game ends (see release_game)
+        self.agent_pool = agent_pool if agent_pool is not None else AgentPool()
+        self.verbose = verbose
+        self.accusation_confidence = accusation_confidence
+        self.suspicion_mode = suspicion_mode
+        self.flavor_text = flavor_text
+        self.move_mode = move_mode
+        # Shared by every game and worker thread using this ClueAI
+        self.decision_cache = decision_cache if decision_cache is not None else DecisionCache()
+        # With a pool client, prompts go straight to the model; otherwise through CrewAI's
+        # default model, still bounded by the pool's concurrency cap and deadline
+        self.llm_pool = llm_pool if llm_pool is not None else LLMPool()
+        self.prompts = PromptBuilder(prompt_budget)
+
+    @property
+    def speculative_decisions(self) -> Tuple[str, ...]:
+        """Decisions that may be worked out ahead of the turn (see speculation.py): only planner moves.
 
-        agent = Agent(
+        Optimizer suspicions skip the model too, but they sample worlds for a
+        wall-clock time budget, so working them out early could change them.
+        """
+        return ("move",) if self.move_mode == "planner" else ()
+
+    @property
+    def batches_moves(self) -> bool:
+        """Whether a round of moves should be decided together (see decide_moves)."""
+        return self.move_mode == "llm"
+
+    def create_agent(self, player: Player, game_id: Optional[str] = None) -> Agent:
+        """The agent playing `player` in this game. Agents only differ by character, so idle ones are reused."""
+        return self.agent_pool.checkout(game_id, player.name, player.character_name, lambda: Agent(
             role=f"{player.character_name} (Clue Player)",
             goal="Win the game of Clue by deducing the murderer, weapon, and room.",
-            backstory=dedent(f"""
-                You are playing a game of Clue. 
-                {backstory}
-                Your objective is to figure out the solution cards (Room, Weapon, Suspect) held by the manager.
-                You have a hand of cards and a notebook of information.
-                Make logical deductions and try to mislead opponents if necessary.
-            """),
-            verbose=True,
+            # Sent with every call, so kept to one line (see prompts.PERSONAS)
+            backstory=persona(player),
+            verbose=self.verbose,
             allow_delegation=False,
             # llm=... # Uses default OpenAI model from env
-        )
-        self.agents_map[player.name] = agent
-        return agent
+        ))
+
+    def release_game(self, game_id: Optional[str]):
+        """Hands the game's agents back for reuse. Call when a game ends or is evicted."""
+        self.agent_pool.release(game_id)
 
-    def decide_move(self, player: Player, valid_moves: List[str], game_state: GameState) -> str:
+    def _ask(self, prompt: Prompt, decision: str, game_state: GameState, player: Optional[Player] = None) -> str:
+        """One model round-trip for `prompt`, counted and timed, with its token usage recorded.
+
+        Through the LLM pool's client the compact prompt is the whole request.
+        CrewAI wraps it in its own agent and task scaffolding, so there the
+        prompt budget only bounds our part. Either way the call takes a pool
+        slot and raises LLMDeadlineExceeded past the pool's deadline.
+        """
+        LLM_CALLS.inc(decision=decision)
+        if self.llm_pool.client is not None:
+            with LLM_CALL_SECONDS.time(decision=decision):
+                completion = self.llm_pool.complete(prompt.messages())
+            LLM_TOKENS.inc(completion.prompt_tokens, decision=decision, kind="prompt")
+            LLM_TOKENS.inc(completion.completion_tokens, decision=decision, kind="completion")
+            return completion.text
+
+        game_id = game_state.game_id
+        agent = self.create_agent(player, game_id) if player is not None else self._table_agent(game_id)
+        task = Task(description=prompt.user, agent=agent, expected_output=prompt.expected_output)
+        crew = Crew(agents=[agent], tasks=[task], process=Process.sequential, verbose=self.verbose)
+        with LLM_CALL_SECONDS.time(decision=decision):
+            result = self.llm_pool.run(crew.kickoff)
+        usage = getattr(result, "token_usage", None)
+        if usage is not None:
+            LLM_TOKENS.inc(getattr(usage, "prompt_tokens", 0) or 0, decision=decision, kind="prompt")
+            LLM_TOKENS.inc(getattr(usage, "completion_tokens", 0) or 0, decision=decision, kind="completion")
+        return str(result)
+
+    def _cached(self, decision: str, cache_key: str) -> Any:
+        cached = self.decision_cache.get(cache_key)
+        DECISION_CACHE_LOOKUPS.inc(decision=decision, result="miss" if cached is None else "hit")
+        return cached
+
+    @AI_DECISION_SECONDS.time(decision="move")
+    def decide_move(self, player: Player, valid_moves: List[str], game_state: GameState, knowledge: Optional[Deduction] = None, planner: Optional[MovePlanner] = None) -> str:
         if not valid_moves:
             return None
-        
+
         if len(valid_moves) == 1:
             return valid_moves[0]
 
-        agent = self.create_agent(player)
-        
-        task_desc = dedent(f"""
-            It is your turn to move.
-            You are currently in {player.position}.
-            You rolled the dice and can move to the following rooms: {', '.join(valid_moves)}.
-            
-            Your hand: {[c.name for c in player.hand]}
-            Your notebook (known info): {player.notebook}
-            
-            Choose the best room to move to. 
-            Consider:
-            1. Rooms you haven't visited or need to investigate.
-            2. Making a suspicion in a room to gather info.
-            
-            Return ONLY the name of the room you want to move to.
-        """)
-
-        task = Task(
-            description=task_desc,
-            agent=agent,
-            expected_output="The name of the room to move to."
-        )
-
-        crew = Crew(
-            agents=[agent],
-            tasks=[task],
-            process=Process.sequential
-        )
-
-        result = crew.kickoff()
-        
-        # Simple parsing to ensure valid room
-        chosen_room = str(result).strip()
+        if self.move_mode == "planner" and planner is not None:
+            return planner.choose(valid_moves, knowledge)
+
+        prompt = self.prompts.move(player, valid_moves, knowledge)
+        cache_key = self._prompt_cache_key("move", prompt)
+        cached = self._cached("move", cache_key)
+        if cached in valid_moves:
+            return cached
+
+        chosen_room = self._ask(prompt, "move", game_state, player).strip()
         # Fallback if LLM is chatty
         for room in valid_moves:
             if room in chosen_room:
+                self.decision_cache.put(cache_key, room)
                 return room
-        return valid_moves[0] # Fallback to first valid move
+        FALLBACK_PARSES.inc(decision="move")
+        return valid_moves[0] # Fallback to first valid move (not cached, so we ask again next time)
+
+    @AI_DECISION_SECONDS.time(decision="moves")
+    def decide_moves(self, requests: List[Tuple[Player, List[str], Optional[Deduction]]], game_state: GameState) -> Dict[str, str]:
+        """Decides the moves of several AI players with a single model call.
+
+        `requests` are (player, valid moves, the player's Deduction). Used
+        when a whole round of AI turns is played at once. Players with zero
+        or one option, or with a cached decision, never reach the model.
+        Returns player name -> room; players whose answer could not be parsed
+        are left out so the caller can fall back to decide_move.
+        """
+        choices = {}
+        pending = []
+        for player, valid_moves, knowledge in requests:
+            if not valid_moves:
+                continue
+            if len(valid_moves) == 1:
+                choices[player.name] = valid_moves[0]
+                continue
+            # Keyed like decide_move, so batched and single answers are shared
+            cache_key = self._prompt_cache_key("move", self.prompts.move(player, valid_moves, knowledge))
+            cached = self._cached("moves", cache_key)
+            if cached in valid_moves:
+                choices[player.name] = cached
+            else:
+                pending.append((player, valid_moves, knowledge, cache_key))
+
+        if not pending:
+            return choices
+        if len(pending) == 1:
+            player, valid_moves, knowledge, _ = pending[0]
+            choices[player.name] = self.decide_move(player, valid_moves, game_state, knowledge)
+            return choices
+
+        prompt = self.prompts.moves([(player, valid_moves, knowledge) for player, valid_moves, knowledge, _ in pending])
+        result_str = self._ask(prompt, "moves", game_state)
+
+        for line in result_str.splitlines():
+            for player, valid_moves, _, cache_key in pending:
+                if player.name not in choices and line.strip().startswith(player.name):
+                    for room in valid_moves:
+                        if room in line:
+                            choices[player.name] = room
+                            self.decision_cache.put(cache_key, room)
+                            break
+        missing = sum(1 for player, _, _, _ in pending if player.name not in choices)
+        if missing:
+            # The caller decides these players one by one instead
+            FALLBACK_PARSES.inc(missing, decision="moves")
+        return choices
+
+    def _prompt_cache_key(self, decision: str, prompt: Prompt) -> str:
+        """Answers are cached by the exact prompt: the same question from the same knowledge gets the same answer."""
+        return self.decision_cache.key(decision, system=prompt.system, user=prompt.user)
+
+    def _table_agent(self, game_id: Optional[str]) -> Agent:
+        return self.agent_pool.checkout(game_id, "__table__", "__table__", lambda: Agent(
+            role="Clue Strategist",
+            goal="Choose good moves for several Clue players at once.",
+            backstory=persona(None),
+            verbose=self.verbose,
+            allow_delegation=False,
+        ))
+
+    @AI_DECISION_SECONDS.time(decision="suspicion")
+    def decide_suspicion(self, player: Player, current_room: str, game_state: GameState, all_suspects: List[str], all_weapons: List[str], knowledge: Optional[Deduction] = None) -> Dict[str, str]:
+        if self.suspicion_mode == "optimizer" and knowledge is not None:
+            suspicion = choose_suspicion(knowledge, game_state.current_player_index, current_room)
+            if self.flavor_text:
+                suspicion["flavor"] = self.suspicion_flavor(player, suspicion, game_state)
+            return suspicion
+
+        prompt = self.prompts.suspicion(player, current_room, all_suspects, all_weapons, knowledge)
+        cache_key = self._prompt_cache_key("suspicion", prompt)
+        cached = self._cached("suspicion", cache_key)
+        if cached:
+            return {"suspect": cached["suspect"], "weapon": cached["weapon"], "room": current_room}
+
+        result_str = self._ask(prompt, "suspicion", game_state, player)
 
-    def decide_suspicion(self, player: Player, current_room: str, game_state: GameState, all_suspects: List[str], all_weapons: List[str]) -> Dict[str, str]:
-        agent = self.create_agent(player)
-        
-        task_desc = dedent(f"""
-            You are in the {current_room}.
-            You need to make a suspicion to gather information.
-            A suspicion consists of a Suspect and a Weapon. The Room is fixed to your current location ({current_room}).
-            
-            Your hand: {[c.name for c in player.hand]}
-            Your notebook (known info): {player.notebook}
-            
-            Choose a Suspect and a Weapon to suspect.
-            Strategy:
-            - Don't suspect cards you hold in your hand (unless bluffing, but usually better to ask about unknowns).
-            - Try to narrow down possibilities.
-            
-            Available Suspects: {', '.join(all_suspects)}
-            Available Weapons: {', '.join(all_weapons)}
-            
-            Return your choice in the format: "Suspect: [Name], Weapon: [Name]"
-        """)
-
-        task = Task(
-            description=task_desc,
-            agent=agent,
-            expected_output="String in format 'Suspect: [Name], Weapon: [Name]'"
-        )
-
-        crew = Crew(
-            agents=[agent],
-            tasks=[task],
-            process=Process.sequential
-        )
-
-        result = crew.kickoff()
-        result_str = str(result)
-        
         # Parse result
         chosen_suspect = None
         chosen_weapon = None
-        
+
         for s in all_suspects:
             if s in result_str:
                 chosen_suspect = s
@@ -140,22 +220,38 @@ class ClueAI:
             if w in result_str:
                 chosen_weapon = w
                 break
-                
+
+        if chosen_suspect and chosen_weapon:
+            self.decision_cache.put(cache_key, {"suspect": chosen_suspect, "weapon": chosen_weapon})
+
         # Fallbacks
+        if not (chosen_suspect and chosen_weapon):
+            FALLBACK_PARSES.inc(decision="suspicion")
         if not chosen_suspect: chosen_suspect = all_suspects[0]
         if not chosen_weapon: chosen_weapon = all_weapons[0]
-        
+
         return {"suspect": chosen_suspect, "weapon": chosen_weapon, "room": current_room}
 
-    def decide_accusation(self, player: Player, game_state: GameState) -> Dict[str, str]:
+    def suspicion_flavor(self, player: Player, suspicion: Dict[str, str], game_state: GameState) -> str:
+        """One in-character line announcing a suspicion that was chosen without the model."""
+        return self._ask(self.prompts.flavor(player, suspicion), "flavor", game_state, player).strip()
+
+    @AI_DECISION_SECONDS.time(decision="accusation")
+    def decide_accusation(self, player: Player, game_state: GameState, knowledge: Optional[Deduction] = None) -> Dict[str, str]:
         # Deterministic Logic: Check notebook for elimination
         # If only 1 suspect, 1 weapon, and 1 room are unknown (not in notebook), ACCUSE!
         
         from src.clue.game_logic import SUSPECTS, WEAPONS, ROOMS
         
-        unknown_suspects = [s for s in SUSPECTS if s not in player.notebook]
-        unknown_weapons = [w for w in WEAPONS if w not in player.notebook]
-        unknown_rooms = [r for r in ROOMS if r not in player.notebook]
+        if knowledge is not None:
+            # The deduction engine also uses passes and who showed cards to whom
+            unknown_suspects = knowledge.candidates("suspect")
+            unknown_weapons = knowledge.candidates("weapon")
+            unknown_rooms = knowledge.candidates("room")
+        else:
+            unknown_suspects = [s for s in SUSPECTS if s not in player.notebook]
+            unknown_weapons = [w for w in WEAPONS if w not in player.notebook]
+            unknown_rooms = [r for r in ROOMS if r not in player.notebook]
         
         # Risk Taker Logic:
         # If the number of unknown combinations is small (e.g., <= 3), take a guess.
@@ -170,6 +266,13 @@ class ClueAI:
             print(f"AI {player.name} is CERTAIN! Accusing: {suspect}, {weapon}, {room}")
             return {"suspect": suspect, "weapon": weapon, "room": room}
             
+        elif knowledge is not None:
+            # Weigh the remaining combinations by how many consistent deals back each one,
+            # and only accuse once one is likely enough.
+            accusation = choose_accusation(knowledge, self.accusation_confidence)
+            if accusation:
+                return accusation
+            
         elif combinations <= 3:
             import random
             suspect = random.choice(unknown_suspects) if unknown_suspects else SUSPECTS[0] # Fallback shouldn't happen if combinations > 0
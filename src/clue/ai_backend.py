@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Any, Callable, Optional
+
+# Lifecycle of the model backend, as reported by the server's /ready endpoint
+COLD = "cold"          # not imported yet
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"      # import or construction raised; AI seats use the heuristics
+DISABLED = "disabled"  # heuristic-only deployment, never imported
+
+
+class LazyAIBackend:
+    """Builds the model backend the first time an AI decision needs it.
+
+    `factory` does the expensive part (importing crewai through agents.py and
+    constructing ClueAI), so the server can start and serve everything else
+    without paying for it. get() blocks until the backend is built and is
+    meant for AI worker threads; warm() builds it in the background.
+    """
+
+    def __init__(self, factory: Callable[[], Any], enabled: bool = True):
+        self._factory = factory
+        self.status = COLD if enabled else DISABLED
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self._backend = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[Any]:
+        """The backend, or None when disabled or it failed to load."""
+        if self.status in (READY, FAILED, DISABLED):
+            return self._backend
+        with self._lock:
+            if self.status in (COLD, LOADING):
+                self._load_locked()
+        return self._backend
+
+    def loaded(self) -> Optional[Any]:
+        """The backend if it is already built; never starts or waits for a load."""
+        return self._backend if self.status == READY else None
+
+    def warm(self):
+        """Starts loading in the background if nobody has yet. Returns immediately."""
+        if self.status != COLD:
+            return
+        with self._lock:
+            if self.status != COLD:
+                return
+            self.status = LOADING
+        threading.Thread(target=self.get, name="clue-ai-warmup", daemon=True).start()
+
+    def to_dict(self) -> dict:
+        return {"status": self.status, "load_seconds": self.load_seconds, "error": self.error}
+
+    def _load_locked(self):
+        self.status = LOADING
+        start = time.perf_counter()
+        try:
+            self._backend = self._factory()
+            self.status = READY
+            print("AI Interface initialized successfully", flush=True)
+        except Exception as e:
+            self.error = str(e)
+            self.status = FAILED
+            print(f"FAILED to initialize AI Interface: {e}", flush=True)
+        self.load_seconds = time.perf_counter() - start
@@ -0,0 +1,119 @@
+import heapq
+import json
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Sequence, Tuple, Union
+
+from src.clue.planner import MovePlanner
+
+# Steps between adjacent rooms when a board lists neighbours without weights
+DEFAULT_EDGE_STEPS = 4
+MAX_ROLL = 12  # 2d6
+UNREACHABLE = math.inf
+# Distinct boards kept for sharing. Games bring their own boards, so this is
+# an LRU: a game keeps using its Board after it drops out, it is just no
+# longer shared with new games.
+DEFAULT_MAX_BOARDS = 64
+
+# Room -> neighbours, either a list (DEFAULT_EDGE_STEPS each) or {neighbour: steps}
+BoardGraph = Mapping[str, Union[Sequence[str], Mapping[str, int]]]
+
+
+class Board:
+    """Read-only movement tables for one board definition.
+
+    Built once per distinct board and shared by every game on it:
+      distances[a][b]  shortest path in steps (Dijkstra from every room),
+      moves[a][roll]   rooms reachable from a with that roll, precomputed for
+                       every 2d6 total so a roll is a single lookup.
+    Edges are directed as written; list both directions for a two-way door.
+    """
+
+    _cache: "OrderedDict[tuple, Board]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    max_cached = DEFAULT_MAX_BOARDS
+
+    def __init__(self, graph: BoardGraph):
+        self.graph: Dict[str, Dict[str, int]] = {}
+        for room, neighbors in graph.items():
+            if isinstance(neighbors, Mapping):
+                edges = {n: int(steps) for n, steps in neighbors.items()}
+            else:
+                edges = {n: DEFAULT_EDGE_STEPS for n in neighbors}
+            unknown = [n for n in edges if n not in graph]
+            if unknown:
+                raise ValueError(f"{room} leads to unknown rooms: {unknown}")
+            if any(steps <= 0 for steps in edges.values()):
+                raise ValueError(f"{room} has a non-positive edge weight")
+            self.graph[room] = edges
+        if not self.graph:
+            raise ValueError("A board needs at least one room")
+
+        self.rooms: List[str] = list(self.graph)
+        self.distances: Dict[str, Dict[str, float]] = {room: self._dijkstra(room) for room in self.rooms}
+        self.moves: Dict[str, List[Tuple[str, ...]]] = {
+            room: [tuple(r for r, d in self.distances[room].items() if 0 < d <= roll) for roll in range(MAX_ROLL + 1)]
+            for room in self.rooms
+        }
+        self._planner = None
+
+    def _dijkstra(self, source: str) -> Dict[str, float]:
+        dist = {room: UNREACHABLE for room in self.rooms}
+        dist[source] = 0
+        heap = [(0, source)]
+        while heap:
+            d, room = heapq.heappop(heap)
+            if d > dist[room]:
+                continue
+            for neighbor, steps in self.graph[room].items():
+                if d + steps < dist[neighbor]:
+                    dist[neighbor] = d + steps
+                    heapq.heappush(heap, (d + steps, neighbor))
+        return dist
+
+    @classmethod
+    def for_graph(cls, graph: BoardGraph) -> "Board":
+        """The shared Board for this definition, building it on first use."""
+        key = cls._key(graph)
+        with cls._cache_lock:
+            board = cls._cache.get(key)
+            if board is not None:
+                cls._cache.move_to_end(key)
+                return board
+        board = cls(graph)
+        with cls._cache_lock:
+            board = cls._cache.setdefault(key, board)
+            cls._cache.move_to_end(key)
+            while len(cls._cache) > cls.max_cached:
+                cls._cache.popitem(last=False)
+        return board
+
+    @classmethod
+    def load(cls, path: str) -> "Board":
+        """Loads a JSON board file: {"rooms": {room: [neighbours] or {neighbour: steps}}}."""
+        with open(path) as f:
+            data = json.load(f)
+        return cls.for_graph(data["rooms"])
+
+    @staticmethod
+    def _key(graph: BoardGraph) -> tuple:
+        rows = []
+        for room, neighbors in graph.items():
+            if isinstance(neighbors, Mapping):
+                rows.append((room, tuple(sorted((n, int(s)) for n, s in neighbors.items()))))
+            else:
+                rows.append((room, tuple(sorted((n, DEFAULT_EDGE_STEPS) for n in neighbors))))
+        # Room order matters: it is the order of the room cards and of valid moves
+        return tuple(rows)
+
+    @property
+    def planner(self) -> MovePlanner:
+        if self._planner is None:
+            self._planner = MovePlanner.for_board(self.distances)
+        return self._planner
+
+    def valid_moves(self, room: str, roll: int) -> List[str]:
+        if roll > MAX_ROLL:
+            return [r for r, d in self.distances[room].items() if 0 < d <= roll]
+        return list(self.moves[room][roll])
@@ -0,0 +1,185 @@
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from src.clue.models import Card, CardType, GamePhase, GameState, Player
+
+# Compact in-memory game state. Cards are interned as small integer ids by a
+# Deck (in the same order Deduction numbers them), hands and seen cards are bitmasks,
+# and players and the table use __slots__. The pydantic models in models.py
+# are only built at the API boundary, see TableCore.view().
+
+ROOMS = [
+    "Kitchen", "Ballroom", "Conservatory",
+    "Dining Room", "Billiard Room", "Library",
+    "Lounge", "Hall", "Study"
+]
+
+WEAPONS = [
+    "Candlestick", "Dagger", "Lead Pipe",
+    "Revolver", "Rope", "Wrench"
+]
+
+SUSPECTS = [
+    "Miss Scarlet", "Colonel Mustard", "Mrs. White",
+    "Mr. Green", "Mrs. Peacock", "Professor Plum"
+]
+
+CATEGORIES = {
+    "suspect": SUSPECTS,
+    "weapon": WEAPONS,
+    "room": ROOMS
+}
+
+
+
+def card_ids(mask: int) -> List[int]:
+    ids = []
+    while mask:
+        low = mask & -mask
+        ids.append(low.bit_length() - 1)
+        mask ^= low
+    return ids
+
+
+class Deck:
+    """The cards of one game variant, interned as ids in category order.
+
+    Deduction numbers cards the same way, so masks pass between the two as-is.
+    """
+
+    def __init__(self, categories: Dict[str, Sequence[str]]):
+        if [c for c in categories] != list(CATEGORIES) or not all(categories.values()):
+            raise ValueError("A deck needs at least one suspect, weapon and room, in that order")
+        self.categories = {category: list(names) for category, names in categories.items()}
+        self.names: List[str] = [name for names in self.categories.values() for name in names]
+        if len(set(self.names)) != len(self.names):
+            raise ValueError("Card names must be unique across categories")
+        self.types: List[CardType] = [CardType(c) for c, names in self.categories.items() for _ in names]
+        self.ids: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        # Card models are immutable in practice, so one instance per card is shared by every view
+        self.models = [Card(name=name, type=card_type) for name, card_type in zip(self.names, self.types)]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def mask(self, names: Iterable[str]) -> int:
+        mask = 0
+        for name in names:
+            mask |= 1 << self.ids[name]
+        return mask
+
+    def names_of(self, mask: int) -> List[str]:
+        return [self.names[i] for i in card_ids(mask)]
+
+
+STANDARD_DECK = Deck(CATEGORIES)
+
+
+class PlayerCore:
+    """One seat. Attribute names match models.Player so callers can use either."""
+
+    __slots__ = ("deck", "name", "character_name", "position", "is_human", "is_eliminated",
+                 "hand_mask", "seen_mask", "undisproved_suspicions")
+
+    def __init__(self, name: str, character_name: str, position: str, is_human: bool = False,
+                 deck: Deck = STANDARD_DECK):
+        self.deck = deck
+        self.name = name
+        self.character_name = character_name
+        self.position = position
+        self.is_human = is_human
+        self.is_eliminated = False
+        self.hand_mask = 0
+        self.seen_mask = 0  # Cards shown to this player
+        self.undisproved_suspicions: List[Dict[str, str]] = []
+
+    @property
+    def hand(self) -> List[Card]:
+        return [self.deck.models[i] for i in card_ids(self.hand_mask)]
+
+    @property
+    def seen_cards(self) -> List[str]:
+        return self.deck.names_of(self.seen_mask)
+
+    @property
+    def notebook(self) -> Dict[str, str]:
+        notebook = {name: "HAND" for name in self.deck.names_of(self.hand_mask)}
+        for name in self.deck.names_of(self.seen_mask & ~self.hand_mask):
+            notebook[name] = "SEEN"
+        return notebook
+
+    def view(self) -> Player:
+        return Player(
+            name=self.name,
+            character_name=self.character_name,
+            hand=self.hand,
+            position=self.position,
+            is_human=self.is_human,
+            is_eliminated=self.is_eliminated,
+            notebook=self.notebook,
+            seen_cards=self.seen_cards,
+            undisproved_suspicions=[dict(s) for s in self.undisproved_suspicions],
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "character_name": self.character_name,
+            "hand": [{"name": self.deck.names[i], "type": self.deck.types[i].value} for i in card_ids(self.hand_mask)],
+            "position": self.position,
+            "is_human": self.is_human,
+            "is_eliminated": self.is_eliminated,
+            "notebook": self.notebook,
+            "seen_cards": self.seen_cards,
+            "undisproved_suspicions": [dict(s) for s in self.undisproved_suspicions],
+        }
+
+
+class TableCore:
+    """The mutable state of one game. Attribute names match models.GameState."""
+
+    __slots__ = ("game_id", "players", "current_player_index", "phase", "winner",
+                 "seed", "log_cursor", "available_moves", "dice_rolled", "version")
+
+    def __init__(self, players: List[PlayerCore], seed: Optional[int] = None):
+        self.game_id: Optional[str] = None
+        self.players = players
+        self.current_player_index = 0
+        self.phase = GamePhase.PLAYER_TURN_MOVE
+        self.winner: Optional[str] = None
+        self.seed = seed
+        self.log_cursor = 0
+        self.available_moves: List[str] = []
+        self.dice_rolled = False
+        self.version = 0  # Kept equal to ClueGame.version
+
+    def view(self) -> GameState:
+        return GameState(
+            game_id=self.game_id,
+            players=[p.view() for p in self.players],
+            current_player_index=self.current_player_index,
+            phase=self.phase,
+            winner=self.winner,
+            seed=self.seed,
+            log_cursor=self.log_cursor,
+            available_moves=list(self.available_moves),
+            dice_rolled=self.dice_rolled,
+            version=self.version,
+        )
+
+    def model_dump(self, mode: str = "json") -> dict:
+        """What view().model_dump(mode="json") returns, without building the pydantic models.
+
+        StateFeed diffs this on every publish, so it skips validation.
+        """
+        return {
+            "game_id": self.game_id,
+            "players": [p.to_dict() for p in self.players],
+            "current_player_index": self.current_player_index,
+            "phase": self.phase.value,
+            "winner": self.winner,
+            "seed": self.seed,
+            "log_cursor": self.log_cursor,
+            "available_moves": list(self.available_moves),
+            "dice_rolled": self.dice_rolled,
+            "version": self.version,
+        }
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+# How long a write waits for another process holding the SQLite file (e.g. simulate workers sharing --cache-path)
+DB_BUSY_TIMEOUT = 30.0
+
+_MISSING = object()
+
+
+class DecisionCache:
+    """Thread-safe LRU + TTL cache for LLM decisions, optionally backed by SQLite.
+
+    Keys are canonical encodings of everything that goes into a prompt, so two
+    calls with the same inputs share one model round-trip no matter which game
+    or worker thread they come from. The on-disk store survives restarts and
+    is only consulted on an in-memory miss. Several processes may share one
+    store: it runs in WAL mode and writers wait their turn.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL_SECONDS, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (stored_at, value)
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, timeout=DB_BUSY_TIMEOUT, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS decisions (key TEXT PRIMARY KEY, value TEXT, stored_at REAL)")
+            self._db.commit()
+
+    @staticmethod
+    def key(kind: str, **inputs: Any) -> str:
+        """Canonical key: order-insensitive for collections, so equal prompts hash equally."""
+        def canonical(value):
+            if isinstance(value, dict):
+                return sorted((str(k), canonical(v)) for k, v in value.items())
+            if isinstance(value, (list, tuple, set)):
+                return sorted(canonical(v) for v in value)
+            return value
+        encoded = json.dumps([kind, canonical(inputs)], sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Returns the cached value or None."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if now - stored_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            value = self._load(key, now)
+            if value is _MISSING:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any):
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO decisions VALUES (?, ?, ?)", (key, json.dumps(value), now))
+                self._db.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _remember(self, key: str, stored_at: float, value: Any):
+        self._entries[key] = (stored_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str, now: float) -> Any:
+        if self._db is None:
+            return _MISSING
+        row = self._db.execute("SELECT value, stored_at FROM decisions WHERE key = ?", (key,)).fetchone()
+        if row is None or now - row[1] > self.ttl:
+            return _MISSING
+        value = json.loads(row[0])
+        self._remember(key, row[1], value)
+        return value
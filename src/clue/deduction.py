@@ -0,0 +1,189 @@
+from typing import Dict, List, Optional, Sequence
+
+# Card ownership is tracked as bitsets: bit i of a mask is card i of the deck.
+# Every holder (each player, the solution envelope and the undealt pile) has
+#   maybe[h] - cards it may still hold
+#   has[h]   - cards it is known to hold (always a subset of maybe[h])
+# so one row of the cards x holders matrix is a single Python int and every
+# propagation rule is a handful of bitwise ops per holder.
+
+
+def _bits(mask: int):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class Deduction:
+    """One player's knowledge of who holds which card.
+
+    Feed it what the player sees (own hand, passes, shown cards) and it
+    propagates the consequences to a fixed point after every update.
+    """
+
+    def __init__(self, categories: Dict[str, Sequence[str]], hand_sizes: Sequence[int]):
+        self.categories = list(categories)
+        self.cards: List[str] = [card for cards in categories.values() for card in cards]
+        self.index = {card: i for i, card in enumerate(self.cards)}
+        self.category_masks: Dict[str, int] = {}
+        for category, cards in categories.items():
+            self.category_masks[category] = self.mask(cards)
+
+        self.num_players = len(hand_sizes)
+        self.solution = self.num_players
+        self.undealt = self.num_players + 1
+        num_solution = len(self.categories)
+        self.sizes = list(hand_sizes) + [num_solution, len(self.cards) - sum(hand_sizes) - num_solution]
+
+        full = (1 << len(self.cards)) - 1
+        self.maybe = [full] * len(self.sizes)
+        self.has = [0] * len(self.sizes)
+        # Disjunctions from suspicions we did not see the answer to:
+        # (holder, mask) means the holder has at least one card of mask.
+        self.clauses: List[tuple] = []
+        self.contradiction = False
+        # Bumped whenever an observation changes what is known, so work derived
+        # from this knowledge can tell whether it is still current
+        self.version = 0
+
+    def mask(self, cards: Sequence[str]) -> int:
+        m = 0
+        for card in cards:
+            m |= 1 << self.index[card]
+        return m
+
+    # --- Persistence --------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            "hand_sizes": self.sizes[:self.num_players],
+            "has": self.has,
+            "maybe": self.maybe,
+            "clauses": [list(clause) for clause in self.clauses],
+            "contradiction": self.contradiction,
+        }
+
+    @classmethod
+    def from_dict(cls, categories: Dict[str, Sequence[str]], data: dict) -> "Deduction":
+        deduction = cls(categories, data["hand_sizes"])
+        deduction.has = list(data["has"])
+        deduction.maybe = list(data["maybe"])
+        deduction.clauses = [tuple(clause) for clause in data["clauses"]]
+        deduction.contradiction = data["contradiction"]
+        return deduction
+
+    # --- Observations -------------------------------------------------------
+
+    def see_hand(self, player: int, cards: Sequence[str]):
+        before = self._fingerprint()
+        m = self.mask(cards)
+        self.has[player] |= m
+        self.maybe[player] = m
+        self.propagate()
+        if self._fingerprint() != before:
+            self.version += 1
+
+    def observe_suspicion(self, suspector: int, cards: Sequence[str], passed: Sequence[int],
+                          shower: Optional[int] = None, shown: Optional[str] = None):
+        """Applies the public outcome of a suspicion, plus the shown card if we saw it."""
+        before = self._fingerprint()
+        m = self.mask(cards)
+        for player in passed:
+            self.maybe[player] &= ~m
+        if shower is not None:
+            if shown is not None:
+                self.has[shower] |= 1 << self.index[shown]
+            else:
+                self.clauses.append((shower, m))
+        self.propagate()
+        if self._fingerprint() != before:
+            self.version += 1
+
+    def _fingerprint(self) -> tuple:
+        return tuple(self.maybe), tuple(self.has), tuple(self.clauses)
+
+    # --- Propagation --------------------------------------------------------
+
+    def propagate(self):
+        maybe, has, sizes = self.maybe, self.has, self.sizes
+        holders = range(len(sizes))
+        while True:
+            before = (tuple(maybe), tuple(has), len(self.clauses))
+
+            # A card somebody is known to hold cannot be anywhere else
+            owned = 0
+            for h in holders:
+                owned |= has[h]
+            for h in holders:
+                maybe[h] &= ~owned | has[h]
+
+            # A card only one holder may have must be theirs
+            once = twice = 0
+            for h in holders:
+                twice |= once & maybe[h]
+                once |= maybe[h]
+            single = once & ~twice
+            for h in holders:
+                has[h] |= maybe[h] & single
+
+            # Hand sizes: full hands exclude everything else, exact fits include everything
+            for h in holders:
+                known = has[h].bit_count()
+                if known == sizes[h]:
+                    maybe[h] = has[h]
+                elif maybe[h].bit_count() == sizes[h]:
+                    has[h] = maybe[h]
+
+            # The solution holds exactly one card of every category
+            sol = self.solution
+            for cat_mask in self.category_masks.values():
+                if has[sol] & cat_mask:
+                    maybe[sol] &= ~cat_mask | has[sol]
+                elif (maybe[sol] & cat_mask).bit_count() == 1:
+                    has[sol] |= maybe[sol] & cat_mask
+
+            # Disjunctions: drop satisfied and repeated ones, resolve those down to one card
+            remaining = {}
+            for holder, m in self.clauses:
+                if has[holder] & m:
+                    continue
+                options = maybe[holder] & m
+                if options == 0:
+                    self.contradiction = True
+                elif options & (options - 1) == 0:
+                    has[holder] |= options
+                else:
+                    remaining[(holder, options)] = None
+            self.clauses = list(remaining)
+
+            if (tuple(maybe), tuple(has), len(self.clauses)) == before:
+                return
+
+    # --- Queries ------------------------------------------------------------
+
+    def candidates(self, category: str) -> List[str]:
+        """Cards of `category` that may still be in the solution."""
+        m = self.maybe[self.solution] & self.category_masks[category]
+        return [self.cards[i] for i in _bits(m)]
+
+    def known_solution(self) -> Optional[Dict[str, str]]:
+        solution = {}
+        for category, cat_mask in self.category_masks.items():
+            m = self.has[self.solution] & cat_mask
+            if not m:
+                return None
+            solution[category] = self.cards[m.bit_length() - 1]
+        return solution
+
+    def holder_of(self, card: str) -> Optional[int]:
+        """Known holder index of a card (a player, self.solution or self.undealt), if deduced."""
+        bit = 1 << self.index[card]
+        for h, m in enumerate(self.has):
+            if m & bit:
+                return h
+        return None
+
+    def possible_holders(self, card: str) -> List[int]:
+        bit = 1 << self.index[card]
+        return [h for h, m in enumerate(self.maybe) if m & bit]
@@ -0,0 +1,100 @@
+import json
+import os
+import threading
+from collections import deque
+from typing import List, Optional
+
+from src.clue.models import LogEntry
+
+# Lines kept in memory per game. Long AI-vs-AI games produce a few lines per
+# turn, so this covers well over a hundred turns of history.
+DEFAULT_LOG_CAPACITY = 500
+DEFAULT_PAGE_SIZE = 100
+
+
+class GameLog:
+    """Append-only game log with monotonically increasing sequence numbers.
+
+    Only the newest `capacity` entries are kept in memory. Older entries are
+    either dropped or, when `spill_path` is set, appended to a JSONL file so
+    they can still be paged through.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_LOG_CAPACITY, spill_path: Optional[str] = None):
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.last_seq = 0
+        self._entries: deque = deque()  # (seq, message)
+        self._lock = threading.Lock()
+
+    def append(self, message: str) -> int:
+        with self._lock:
+            self.last_seq += 1
+            self._entries.append((self.last_seq, message))
+            if len(self._entries) > self.capacity:
+                self._spill(self._entries.popleft())
+            return self.last_seq
+
+    @property
+    def first_seq(self) -> int:
+        """Oldest sequence number still available (in memory or on disk)."""
+        with self._lock:
+            if self.spill_path and os.path.exists(self.spill_path):
+                return 1
+            return self._entries[0][0] if self._entries else self.last_seq + 1
+
+    def read(self, after: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> List[LogEntry]:
+        """Entries with seq > after, oldest first, at most `limit` of them."""
+        with self._lock:
+            entries = list(self._entries)
+        if limit <= 0:
+            return []
+        page = []
+        oldest_in_memory = entries[0][0] if entries else self.last_seq + 1
+        if after + 1 < oldest_in_memory and self.spill_path:
+            page.extend(self._read_spilled(after, limit))
+        for seq, message in entries:
+            if len(page) >= limit:
+                break
+            if seq > after and (not page or seq > page[-1].seq):
+                page.append(LogEntry(seq=seq, message=message))
+        return page
+
+    def tail(self, count: int) -> List[str]:
+        with self._lock:
+            entries = list(self._entries)[-count:]
+        return [message for _, message in entries]
+
+    def snapshot(self) -> dict:
+        """The in-memory entries and sequence counter (spilled lines stay in their file)."""
+        with self._lock:
+            return {"last_seq": self.last_seq, "entries": [list(entry) for entry in self._entries]}
+
+    def restore(self, snapshot: dict):
+        with self._lock:
+            self.last_seq = snapshot["last_seq"]
+            self._entries = deque((seq, message) for seq, message in snapshot["entries"])
+
+    def close(self):
+        if self.spill_path and os.path.exists(self.spill_path):
+            os.remove(self.spill_path)
+
+    def _spill(self, entry):
+        if not self.spill_path:
+            return
+        seq, message = entry
+        with open(self.spill_path, "a") as f:
+            f.write(json.dumps({"seq": seq, "message": message}) + "\n")
+
+    def _read_spilled(self, after: int, limit: int) -> List[LogEntry]:
+        page = []
+        if not os.path.exists(self.spill_path):
+            return page
+        with open(self.spill_path) as f:
+            for line in f:
+                record = json.loads(line)
+                if record["seq"] > after:
+                    page.append(LogEntry(**record))
+                    if len(page) >= limit:
+                        break
+        return page
@@ -1,23 +1,16 @@
+import array
+import base64
+import functools
+import inspect
+import threading
 import random
-from typing import List, Dict, Tuple, Optional
-from src.clue.models import Card, CardType, GameState, Player, GamePhase
-
-# Constants
-ROOMS = [
-    "Kitchen", "Ballroom", "Conservatory",
-    "Dining Room", "Billiard Room", "Library",
-    "Lounge", "Hall", "Study"
-]
-
-WEAPONS = [
-    "Candlestick", "Dagger", "Lead Pipe",
-    "Revolver", "Rope", "Wrench"
-]
-
-SUSPECTS = [
-    "Miss Scarlet", "Colonel Mustard", "Mrs. White",
-    "Mr. Green", "Mrs. Peacock", "Professor Plum"
-]
+from typing import List, Dict, Tuple, Optional, Union
+from src.clue.models import GameState, GamePhase
+from src.clue.game_log import GameLog
+from src.clue.deduction import Deduction
+from src.clue.board import Board, BoardGraph
+# Card constants live in core.py next to their interned ids; re-exported here
+from src.clue.core import ROOMS, WEAPONS, SUSPECTS, CATEGORIES, STANDARD_DECK, Deck, PlayerCore, TableCore
 
 # Simple adjacency for now (can be expanded with distances)
 # This is a simplified map where rooms connect to neighbors.
@@ -36,150 +29,333 @@ BOARD_GRAPH = {
     "Study": ["Library", "Hall", "Kitchen"] # Kitchen via secret passage
 }
 
-# Distances between rooms (simplified for the sake of the example, 
-# in a real grid board we'd calculate steps. Here we can assign arbitrary step costs)
-# For now, let's say adjacent rooms are 3-4 steps away, others are further.
-# Or we can just use the graph and say each hop is X steps.
-# Let's stick to the prompt: "initialize the distance between each room (up to 12 steps)"
-# We can pre-calculate or hardcode distances.
-DISTANCES = {} 
-# We will generate this dynamically or hardcode it. 
-# For simplicity, let's assume a fully connected graph with weighted edges?
-# No, the prompt implies a board structure.
-# Let's use a BFS to calculate distances on the graph defined above, assuming each link is ~4 steps.
+# Distances are the shortest paths over this graph with each link ~4 steps,
+# computed once and shared by every game (see board.Board).
+STANDARD_BOARD = Board.for_graph(BOARD_GRAPH)
+
+# Seats in the holder index that are not players
+SOLUTION = -1
+UNDEALT = -2
+
+DEFAULT_HAND_SIZE = 4
+AI_NAMES = ["Sherlock", "Poirot", "Marple", "Holmes", "Columbo", "Morse", "Maigret", "Wimsey"]
+
+def recorded(method):
+    """Marks a state-changing method: bumps game.version and reports the call to game.recorder.
+
+    Each call holds game.lock, so changes from the event loop and AI worker
+    threads never interleave. Only outermost calls count. Calls made from inside another recorded
+    method are part of that change, and replaying the outer call in order,
+    against the game's seeded generator, repeats them (see persistence.py).
+    A `seed` argument is recorded as the seed actually used, so a game dealt
+    from a fresh seed replays the same deal.
+    """
+    signature = inspect.signature(method)
+    seeded = "seed" in signature.parameters
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            if self._recording:
+                return method(self, *args, **kwargs)
+            self._recording = True
+            try:
+                result = method(self, *args, **kwargs)
+            finally:
+                self._recording = False
+                self.version += 1
+                if self.state is not None:
+                    self.state.version = self.version
+            if self.recorder is not None:
+                if seeded and self.state is not None:
+                    bound = signature.bind(self, *args, **kwargs)
+                    bound.arguments["seed"] = self.state.seed
+                    args, kwargs = bound.args[1:], bound.kwargs
+                self.recorder(method.__name__, args, kwargs)
+            return result
+    return wrapper
 
 class ClueGame:
     def __init__(self):
         self.state = None
         self.truth = {}
-        self.deck = []
-        self.distances = self._calculate_distances()
-
-    def _calculate_distances(self):
-        # Simple BFS to find distances between all pairs of rooms
-        dists = {r: {r2: 99 for r2 in ROOMS} for r in ROOMS}
-        for r in ROOMS:
-            dists[r][r] = 0
-            queue = [(r, 0)]
-            visited = set()
-            while queue:
-                curr, d = queue.pop(0)
-                if curr in visited:
-                    continue
-                visited.add(curr)
-                dists[r][curr] = min(dists[r][curr], d)
-                
-                # Neighbors are roughly 4 steps away in this simplified graph
-                for neighbor in BOARD_GRAPH[curr]:
-                    if neighbor not in visited:
-                        queue.append((neighbor, d + 4))
-        return dists
-
-    def initialize_game(self, human_character: str):
-        # 1. Create Deck
-        cards = []
-        for r in ROOMS: cards.append(Card(name=r, type=CardType.ROOM))
-        for w in WEAPONS: cards.append(Card(name=w, type=CardType.WEAPON))
-        for s in SUSPECTS: cards.append(Card(name=s, type=CardType.SUSPECT))
-        
-        random.shuffle(cards)
+        self.deck = STANDARD_DECK
+        self.holders: List[int] = [] # Card id -> seat holding it (or SOLUTION / UNDEALT), fixed at deal time
+        self._set_board(STANDARD_BOARD)
+        self.log = GameLog()
+        self.deductions: List[Deduction] = [] # Per-player card ownership knowledge, indexed like players
+        self.log_spill_path = None # Set before initialize_game to keep evicted log lines on disk
+        self.rng = random.Random() # Per-game stream for deals, dice and shown cards; reseeded by initialize_game
+        self.recorder = None # Called with (method name, args, kwargs) after every state change, see recorded()
+        self.version = 0 # Bumped by every state change, see recorded()
+        self.lock = threading.RLock() # Held by every state change; hold it to make several one atomic
+        self._recording = False
+
+    @recorded
+    def initialize_game(self, human_character: Optional[str] = None, num_ai_players: int = 3, seed: Optional[int] = None,
+                        categories: Optional[Dict[str, List[str]]] = None, board: Union[Board, BoardGraph, None] = None,
+                        hand_size: Optional[int] = DEFAULT_HAND_SIZE):
+        """Deals a new game. Without a human character every seat is an AI (headless self-play).
+
+        All randomness comes from a generator seeded with `seed` (a fresh one
+        if omitted), recorded in the state so the same seed replays the game.
+
+        Variants may bring their own cards and board (a Board, or room name ->
+        adjacent rooms, optionally weighted; its rooms are the room cards). With `hand_size=None` the whole
+        deck is dealt round-robin, so hands can be uneven. Raises ValueError
+        for a variant that cannot be played.
+        """
+        if board is not None and not isinstance(board, Board):
+            board = Board.for_graph(board)
+        if board is not None:
+            categories = dict(categories or CATEGORIES, room=board.rooms)
+        elif categories is not None and list(categories.get("room", [])) != list(BOARD_GRAPH):
+            raise ValueError("A variant with its own rooms needs a board")
+        self.deck = Deck(categories) if categories is not None else STANDARD_DECK
+        self._set_board(board or STANDARD_BOARD)
+        suspects = self.deck.categories["suspect"]
+        if human_character is not None and human_character not in suspects:
+            raise ValueError(f"Unknown character: {human_character}")
+        num_players = num_ai_players + (1 if human_character else 0)
+        if not 2 <= num_players <= len(suspects):
+            raise ValueError(f"This deck seats 2 to {len(suspects)} players")
+        if hand_size is not None and hand_size < 1:
+            raise ValueError("Hands need at least one card")
+        start = "Lounge" if "Lounge" in self.board.moves else self.board.rooms[0]
+
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.rng = random.Random(seed)
+
+        # 1. Create Deck (interned card ids, see core.py)
+        cards = list(range(len(self.deck)))
+        self.rng.shuffle(cards)
 
         # 2. Select Truth
-        truth_room = next(c for c in cards if c.type == CardType.ROOM)
-        truth_weapon = next(c for c in cards if c.type == CardType.WEAPON)
-        truth_suspect = next(c for c in cards if c.type == CardType.SUSPECT)
-        
-        self.truth = {
-            "room": truth_room,
-            "weapon": truth_weapon,
-            "suspect": truth_suspect
-        }
-        
+        truth = {}
+        for card in cards:
+            category = self.deck.types[card].value
+            if category not in truth:
+                truth[category] = card
+        self.truth = {category: self.deck.models[card] for category, card in truth.items()}
+        self.holders = [UNDEALT] * len(self.deck)
+        for card in truth.values():
+            self.holders[card] = SOLUTION
+
         # Remove truth cards from deck
-        cards.remove(truth_room)
-        cards.remove(truth_weapon)
-        cards.remove(truth_suspect)
-        
+        cards = [card for card in cards if card not in truth.values()]
+
         # 3. Create Players
         # Human player
-        players = [Player(name="You", character_name=human_character, is_human=True, position="Lounge")]
-        
+        players = []
+        if human_character:
+            players.append(PlayerCore(name="You", character_name=human_character, is_human=True, position=start, deck=self.deck))
+
         # AI Players
-        ai_names = ["Sherlock", "Poirot", "Marple"]
-        available_characters = [s for s in SUSPECTS if s != human_character]
-        random.shuffle(available_characters)
-        ai_characters = available_characters[:3]
+        available_characters = [s for s in suspects if s != human_character]
+        self.rng.shuffle(available_characters)
+        ai_characters = available_characters[:num_ai_players]
         for i, char_name in enumerate(ai_characters):
-            name = ai_names[i] if i < len(ai_names) else f"AI_{i+1}"
-            players.append(Player(name=name, character_name=char_name, is_human=False, position="Lounge"))
-            
-        # 4. Deal Cards (4 per player)
-        random.shuffle(cards)
-        for player in players:
-            for _ in range(4):
-                if cards:
-                    card = cards.pop()
-                    player.hand.append(card)
-                    # Mark own cards in notebook
-                    player.notebook[card.name] = "HAND"
-        
+            name = AI_NAMES[i] if i < len(AI_NAMES) else f"AI_{i+1}"
+            players.append(PlayerCore(name=name, character_name=char_name, is_human=False, position=start, deck=self.deck))
+
+        # 4. Deal Cards (4 per player by default). Own cards show up as HAND in the notebook view.
+        self.rng.shuffle(cards)
+        if hand_size is None:
+            hands = [cards[seat::len(players)] for seat in range(len(players))]
+        else:
+            if hand_size * len(players) > len(cards):
+                raise ValueError(f"Not enough cards to deal {hand_size} to {len(players)} players")
+            hands = [cards[len(cards) - (seat + 1) * hand_size:len(cards) - seat * hand_size] for seat in range(len(players))]
+        for seat, (player, hand) in enumerate(zip(players, hands)):
+            for card in hand:
+                player.hand_mask |= 1 << card
+                self.holders[card] = seat
+
         # Remaining cards are hidden (known only to manager - effectively removed from play for players)
-        
-        self.state = GameState(
-            players=players,
-            current_player_index=0,
-            phase=GamePhase.PLAYER_TURN_MOVE,
-            logs=["Game initialized. All players at Lounge."]
-        )
-        
+
+        hand_sizes = [len(hand) for hand in hands]
+        self.deductions = []
+        for i, player in enumerate(players):
+            deduction = Deduction(self.deck.categories, hand_sizes)
+            deduction.see_hand(i, self.deck.names_of(player.hand_mask))
+            self.deductions.append(deduction)
+
+        self.log = GameLog(spill_path=self.log_spill_path)
+        self.state = TableCore(players, seed=seed)
+        self.add_log(f"Game initialized. All players at {start}.")
+
         return self.state
 
+    def _set_board(self, board: Board):
+        self.board = board
+        self.distances = board.distances
+        self.planner = board.planner # Shared roll/reachability tables for this board
+
+    def to_snapshot(self) -> dict:
+        """Everything needed to rebuild this game without replaying its events, as plain JSON types."""
+        state = self.state
+        version, internal, gauss = self.rng.getstate()
+        return {
+            "version": self.version,
+            "categories": self.deck.categories,
+            "board": self.board.graph,
+            "truth": {category: card.name for category, card in self.truth.items()},
+            "holders": self.holders,
+            # The Mersenne Twister state is 625 32-bit words; packed it is a third the size of a JSON list
+            "rng": [version, base64.b64encode(array.array("I", internal).tobytes()).decode(), gauss],
+            "state": {
+                "game_id": state.game_id,
+                "current_player_index": state.current_player_index,
+                "phase": state.phase.value,
+                "winner": state.winner,
+                "seed": state.seed,
+                "log_cursor": state.log_cursor,
+                "available_moves": state.available_moves,
+                "dice_rolled": state.dice_rolled,
+            },
+            "players": [
+                {
+                    "name": p.name,
+                    "character_name": p.character_name,
+                    "position": p.position,
+                    "is_human": p.is_human,
+                    "is_eliminated": p.is_eliminated,
+                    "hand_mask": p.hand_mask,
+                    "seen_mask": p.seen_mask,
+                    "undisproved_suspicions": p.undisproved_suspicions,
+                }
+                for p in state.players
+            ],
+            "deductions": [d.to_dict() for d in self.deductions],
+            "log": self.log.snapshot(),
+        }
+
+    @classmethod
+    def from_snapshot(cls, data: dict, log_spill_path: Optional[str] = None) -> "ClueGame":
+        game = cls()
+        game.log_spill_path = log_spill_path
+        game.version = data.get("version", 0)
+        game.deck = STANDARD_DECK if data["categories"] == STANDARD_DECK.categories else Deck(data["categories"])
+        game._set_board(Board.for_graph(data["board"]))
+        game.truth = {category: game.deck.models[game.deck.ids[name]] for category, name in data["truth"].items()}
+        game.holders = list(data["holders"])
+        version, internal, gauss = data["rng"]
+        game.rng.setstate((version, tuple(array.array("I", base64.b64decode(internal))), gauss))
+
+        players = []
+        for p in data["players"]:
+            player = PlayerCore(p["name"], p["character_name"], p["position"], p["is_human"], deck=game.deck)
+            player.is_eliminated = p["is_eliminated"]
+            player.hand_mask = p["hand_mask"]
+            player.seen_mask = p["seen_mask"]
+            player.undisproved_suspicions = [dict(s) for s in p["undisproved_suspicions"]]
+            players.append(player)
+        state = TableCore(players)
+        for key, value in data["state"].items():
+            setattr(state, key, value)
+        state.phase = GamePhase(state.phase)
+        state.version = game.version
+        game.state = state
+
+        game.deductions = [Deduction.from_dict(game.deck.categories, d) for d in data["deductions"]]
+        game.log = GameLog(spill_path=log_spill_path)
+        game.log.restore(data["log"])
+        return game
+
+    def view(self) -> GameState:
+        """The pydantic snapshot of the game, for API responses."""
+        return self.state.view()
+
+    @property
+    def changing(self) -> bool:
+        """Whether a recorded change is in progress, on any thread; the state may be half-changed."""
+        return self._recording
+
+    @recorded
+    def add_log(self, message: str):
+        self.state.log_cursor = self.log.append(message)
+
+    @recorded
     def roll_dice(self) -> int:
-        return random.randint(1, 6) + random.randint(1, 6)
+        return self.rng.randint(1, 6) + self.rng.randint(1, 6)
+
+    @recorded
+    def roll_for_turn(self):
+        """The human's roll: rolls, offers the valid moves, and skips to the action phase if there are none."""
+        current_player = self.state.players[self.state.current_player_index]
+        roll = self.roll_dice()
+        valid_moves = self.get_valid_moves(current_player.position, roll)
+
+        self.state.available_moves = valid_moves
+        self.state.dice_rolled = True
+        self.add_log(f"{current_player.name} rolled a {roll}. Valid moves: {valid_moves}")
+
+        if not valid_moves:
+            self.add_log(f"{current_player.name} has no valid moves. Staying in {current_player.position}.")
+            self.state.phase = GamePhase.PLAYER_TURN_ACTION
+        return roll, valid_moves
+
+    @recorded
+    def offer_moves(self, valid_moves: List[str]):
+        """An AI seat's roll: the rooms it may move to, kept so a resumed turn does not roll again."""
+        self.state.available_moves = list(valid_moves)
+        self.state.dice_rolled = True
 
     def get_valid_moves(self, current_room: str, dice_roll: int) -> List[str]:
-        valid_rooms = []
-        for room, distance in self.distances[current_room].items():
-            if 0 < distance <= dice_roll:
-                valid_rooms.append(room)
-        return valid_rooms
+        return self.board.valid_moves(current_room, dice_roll)
 
+    @recorded
     def move_player(self, player_index: int, destination: str):
         self.state.players[player_index].position = destination
-        self.state.logs.append(f"{self.state.players[player_index].name} moved to {destination}")
+        self.add_log(f"{self.state.players[player_index].name} moved to {destination}")
         self.state.phase = GamePhase.PLAYER_TURN_ACTION
 
+    def check_suspicion(self, suspect: str, weapon: str, room: str):
+        """Raises ValueError unless all three cards are in this game's deck."""
+        for category, name in (("suspect", suspect), ("weapon", weapon), ("room", room)):
+            if name not in self.deck.categories[category]:
+                raise ValueError(f"Unknown {category}: {name}")
+
+    @recorded
     def handle_suspicion(self, suspect: str, weapon: str, room: str, player_index: int):
+        self.check_suspicion(suspect, weapon, room)
         # Move suspect to room
         for p in self.state.players:
             if p.character_name == suspect:
                 p.position = room
-                self.state.logs.append(f"{suspect} was moved to {room}")
+                self.add_log(f"{suspect} was moved to {room}")
         
-        self.state.logs.append(f"{self.state.players[player_index].name} suspects {suspect} with {weapon} in {room}")
+        self.add_log(f"{self.state.players[player_index].name} suspects {suspect} with {weapon} in {room}")
         
-        # Check if other players have matching cards
-        # Start from next player
+        # Find who disproves from the card -> holder index: the first player
+        # after the suspector, in turn order, holding any of the three cards.
         num_players = len(self.state.players)
-        for i in range(1, num_players):
-            check_idx = (player_index + i) % num_players
+        cards = [suspect, weapon, room]
+        ids = [self.deck.ids[name] for name in cards]
+        suspector = self.state.players[player_index]
+        first = num_players
+        for card in ids:
+            seat = self.holders[card]
+            if seat >= 0 and seat != player_index:
+                first = min(first, (seat - player_index) % num_players)
+        passed = [(player_index + i) % num_players for i in range(1, first)]
+
+        if first < num_players:
+            check_idx = (player_index + first) % num_players
             checker = self.state.players[check_idx]
-            
-            matches = [c for c in checker.hand if c.name in [suspect, weapon, room]]
-            if matches:
-                shown_card = random.choice(matches) # AI logic: show random match
-                self.state.logs.append(f"{checker.name} showed a card to {self.state.players[player_index].name}")
-                
-                # Record seen card for the player who made the suspicion
-                # Record seen card for the player who made the suspicion
-                if shown_card.name not in self.state.players[player_index].seen_cards:
-                    self.state.players[player_index].seen_cards.append(shown_card.name)
-                    # Update notebook
-                    self.state.players[player_index].notebook[shown_card.name] = "SEEN"
-                
-                return {"has_card": True, "player": checker.name, "card": shown_card if self.state.players[player_index].is_human else None}
-        
-        self.state.logs.append("No one could disprove the suspicion.")
+            matches = [card for card in ids if self.holders[card] == check_idx]
+            shown_card = self.deck.models[self.rng.choice(matches)] # AI logic: show random match
+            self._observe_suspicion(player_index, cards, passed, check_idx, shown_card.name)
+            self.add_log(f"{checker.name} showed a card to {suspector.name}")
+
+            # Record seen card for the player who made the suspicion (the notebook view marks it SEEN)
+            suspector.seen_mask |= 1 << self.deck.ids[shown_card.name]
+
+            return {"has_card": True, "player": checker.name, "card": shown_card if suspector.is_human else None}
+
+        self._observe_suspicion(player_index, cards, passed)
+        self.add_log("No one could disprove the suspicion.")
         
         # Record this valuable info for the player
         undisproved = {"suspect": suspect, "weapon": weapon, "room": room}
@@ -187,6 +363,12 @@ class ClueGame:
         
         return {"has_card": False}
 
+    def _observe_suspicion(self, suspector: int, cards: List[str], passed: List[int], shower: Optional[int] = None, shown: Optional[str] = None):
+        # Passes and who showed are public; only the suspector learns which card was shown
+        for i, deduction in enumerate(self.deductions):
+            deduction.observe_suspicion(suspector, cards, passed, shower, shown if i == suspector else None)
+
+    @recorded
     def handle_accusation(self, suspect: str, weapon: str, room: str, player_index: int):
         is_correct = (
             suspect == self.truth["suspect"].name and
@@ -197,13 +379,14 @@ class ClueGame:
         if is_correct:
             self.state.winner = self.state.players[player_index].name
             self.state.phase = GamePhase.GAME_OVER
-            self.state.logs.append(f"{self.state.players[player_index].name} WON! Correct accusation: {suspect}, {weapon}, {room}")
+            self.add_log(f"{self.state.players[player_index].name} WON! Correct accusation: {suspect}, {weapon}, {room}")
             return True
         else:
             self.state.players[player_index].is_eliminated = True
-            self.state.logs.append(f"{self.state.players[player_index].name} made a false accusation and is eliminated.")
+            self.add_log(f"{self.state.players[player_index].name} made a false accusation and is eliminated.")
             return False
 
+    @recorded
     def next_turn(self):
         # Find next active player
         start_idx = self.state.current_player_index
@@ -214,9 +397,9 @@ class ClueGame:
             if self.state.current_player_index == start_idx:
                 # All players eliminated? Should not happen usually unless everyone guessed wrong
                 self.state.phase = GamePhase.GAME_OVER
-                self.state.logs.append("All players eliminated. Game Over.")
+                self.add_log("All players eliminated. Game Over.")
                 return
 
         self.state.phase = GamePhase.PLAYER_TURN_MOVE
         self.state.dice_rolled = False
-        self.state.logs.append(f"It is {self.state.players[self.state.current_player_index].name}'s turn.")
+        self.add_log(f"It is {self.state.players[self.state.current_player_index].name}'s turn.")
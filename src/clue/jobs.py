@@ -0,0 +1,151 @@
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+# LLM round-trips are I/O bound, so a thread pool is enough to keep them
+# off the event loop. The pool size caps concurrent model calls per process.
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_PENDING = 256
+DEFAULT_TIMEOUT_SECONDS = 60.0
+# Finished jobs are kept around so clients can still poll their result.
+DEFAULT_MAX_FINISHED = 4096
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    TIMED_OUT = "timed_out"
+    CANCELLED = "cancelled"
+
+    FINISHED = (DONE, FAILED, TIMED_OUT, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when it was cancelled or ran past its deadline."""
+
+
+class JobQueueFull(Exception):
+    """Raised by submit() when too many jobs are already waiting."""
+
+
+class Job:
+    def __init__(self, game_id: str, timeout: float):
+        self.job_id = uuid.uuid4().hex
+        self.game_id = game_id
+        self.status = JobStatus.PENDING
+        self.created_at = time.monotonic()
+        self.deadline = self.created_at + timeout
+        self.finished_at: Optional[float] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self._cancelled = threading.Event()
+        # Guards every status change: a cancel or timeout must never be overwritten
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in JobStatus.FINISHED
+
+    def cancel(self, status: str = JobStatus.CANCELLED):
+        with self._lock:
+            if self.finished:
+                return
+            self._cancelled.set()
+            self._finish_locked(status)
+
+    def start(self) -> bool:
+        """Marks a pending job as running; False if it was cancelled or finished first."""
+        with self._lock:
+            if self.finished or self._cancelled.is_set():
+                return False
+            self.status = JobStatus.RUNNING
+            return True
+
+    def expire(self) -> "Job":
+        """Times the job out if it ran past its deadline, even while its worker is stuck. Returns the job."""
+        if not self._cancelled.is_set() and time.monotonic() > self.deadline:
+            self.cancel(JobStatus.TIMED_OUT)
+        return self
+
+    def check(self):
+        """Cooperative cancellation point. Call before every state mutation."""
+        self.expire()
+        if self._cancelled.is_set():
+            raise JobCancelled(self.status)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "game_id": self.game_id,
+            "status": self.status,
+            "error": self.error,
+        }
+
+    def _finish(self, status: str, result: Any = None, error: Optional[str] = None):
+        """Records how the job ended, unless it already has (say, cancelled while it ran)."""
+        with self._lock:
+            if not self.finished:
+                self._finish_locked(status, result, error)
+
+    def _finish_locked(self, status: str, result: Any = None, error: Optional[str] = None):
+        self.status = status
+        self.result = result
+        self.error = error
+        self.finished_at = time.monotonic()
+
+
+class JobManager:
+    """Runs blocking work (AI turns) on a bounded thread pool and tracks it as pollable jobs."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, max_pending: int = DEFAULT_MAX_PENDING,
+                 max_finished: int = DEFAULT_MAX_FINISHED):
+        self.max_pending = max_pending
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="clue-ai")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, game_id: str, fn: Callable[[Job], Any], timeout: float = DEFAULT_TIMEOUT_SECONDS) -> Job:
+        job = Job(game_id, timeout)
+        with self._lock:
+            pending = sum(1 for j in self._jobs.values() if not j.finished)
+            if pending >= self.max_pending:
+                raise JobQueueFull()
+            self._jobs[job.job_id] = job
+            self._prune_locked()
+        self._executor.submit(self._run, job, fn)
+        return job
+
+    def get(self, job_id: str) -> Job:
+        return self._jobs[job_id].expire()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job: Job, fn: Callable[[Job], Any]):
+        try:
+            job.check()
+            if not job.start():
+                return
+            job.check()
+            result = fn(job)
+        except JobCancelled:
+            return
+        except Exception as e:
+            logger.exception("AI job %s failed", job.job_id)
+            job._finish(JobStatus.FAILED, error=str(e))
+            return
+        job._finish(JobStatus.DONE, result=result)
+
+    def _prune_locked(self):
+        finished = [job_id for job_id, j in self._jobs.items() if j.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
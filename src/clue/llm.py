@@ -0,0 +1,234 @@
+import http.client
+import json
+import queue
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, TypeVar
+from urllib.parse import urlsplit
+
+from src.clue.metrics import REGISTRY
+
+# Defaults for LLMPool; the server reads overrides from CLUE_LLM_* variables
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_DEADLINE = 30.0      # seconds for one decision, retries and hedges included
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.5        # first retry delay; doubles each time, with full jitter
+# Statuses worth retrying: rate limited, or the provider is having a bad moment
+RETRYABLE_STATUSES = (408, 409, 429, 500, 502, 503, 504)
+
+LLM_ATTEMPTS = REGISTRY.counter(
+    "clue_llm_attempts", "HTTP attempts made by the LLM pool, by outcome (ok, error, retryable, hedge).", ("outcome",))
+
+Messages = List[Dict[str, str]]
+T = TypeVar("T")
+
+
+class LLMError(Exception):
+    """The model backend failed and retrying will not help."""
+
+
+class RetryableLLMError(LLMError):
+    """A failure another attempt may get past (timeouts, 429s, 5xx)."""
+
+
+class LLMDeadlineExceeded(LLMError):
+    pass
+
+
+@dataclass
+class Completion:
+    text: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+class ChatCompletionsClient:
+    """Minimal client for an OpenAI-compatible /chat/completions endpoint.
+
+    Keeps up to `max_connections` keep-alive connections and hands each
+    call one of them, so no call waits on another's socket.
+    """
+
+    def __init__(self, base_url: str, model: str, api_key: Optional[str] = None, max_connections: int = DEFAULT_MAX_CONCURRENCY):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported LLM base URL: {base_url}")
+        self.base_url = base_url
+        self.model = model
+        self.api_key = api_key
+        self._connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._netloc = parts.netloc
+        self._path = parts.path.rstrip("/") + "/chat/completions"
+        self._idle: "queue.LifoQueue" = queue.LifoQueue(maxsize=max_connections)
+
+    def complete(self, messages: Messages, timeout: float) -> Completion:
+        body = json.dumps({"model": self.model, "messages": messages})
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        connection = self._checkout(timeout)
+        try:
+            connection.request("POST", self._path, body, headers)
+            response = connection.getresponse()
+            payload = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            connection.close()
+            raise RetryableLLMError(f"{type(e).__name__}: {e}") from e
+        self._checkin(connection)
+        if response.status in RETRYABLE_STATUSES:
+            raise RetryableLLMError(f"HTTP {response.status}")
+        if response.status != 200:
+            raise LLMError(f"HTTP {response.status}: {payload[:200]!r}")
+        data = json.loads(payload)
+        usage = data.get("usage") or {}
+        return Completion(
+            text=data["choices"][0]["message"]["content"] or "",
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+        )
+
+    def _checkout(self, timeout: float) -> http.client.HTTPConnection:
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = self._connection_class(self._netloc)
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection
+
+    def _checkin(self, connection: http.client.HTTPConnection):
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+
+class LLMPool:
+    """Shared front door to a model backend for every table and worker thread.
+
+    - at most `max_concurrency` requests are in flight, hedges included;
+      callers queue for a slot rather than stampeding the provider,
+    - every call has a deadline covering queueing, retries and hedges,
+    - retryable failures are retried with exponential backoff and full jitter,
+    - with `hedge_after` set, a call still unanswered after that many seconds
+      gets a second, identical request if a slot is free, and the first
+      answer wins. The loser runs to completion but is ignored.
+
+    Without a `client` the pool only bounds model calls made elsewhere (see run).
+    """
+
+    def __init__(self, client=None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, deadline: float = DEFAULT_DEADLINE,
+                 retries: int = DEFAULT_RETRIES, backoff: float = DEFAULT_BACKOFF, hedge_after: Optional[float] = None,
+                 rng: Optional[random.Random] = None):
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.deadline = deadline
+        self.retries = retries
+        self.backoff = backoff
+        self.hedge_after = hedge_after
+        self.rng = rng or random.Random()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="clue-llm")
+
+    @property
+    def model(self) -> Optional[str]:
+        return self.client.model if self.client is not None else None
+
+    def complete(self, messages: Messages, deadline: Optional[float] = None) -> Completion:
+        """The first successful completion, or LLMError once retries or the deadline run out."""
+        give_up_at = time.monotonic() + (deadline if deadline is not None else self.deadline)
+        error = None
+        for attempt in range(self.retries + 1):
+            try:
+                return self._hedged(messages, give_up_at)
+            except RetryableLLMError as e:
+                error = e
+            if attempt == self.retries:
+                break
+            delay = self.rng.uniform(0, self.backoff * 2 ** attempt)
+            if time.monotonic() + delay >= give_up_at:
+                raise LLMDeadlineExceeded(f"No answer before the deadline after {attempt + 1} attempts: {error}") from error
+            time.sleep(delay)
+        raise error
+
+    def run(self, call: Callable[[], T], deadline: Optional[float] = None) -> T:
+        """call() in one of the pool's slots, or LLMDeadlineExceeded once the deadline runs out.
+
+        For model calls the pool cannot make itself, such as a CrewAI kickoff:
+        they share the concurrency cap and the deadline, but are neither
+        retried nor hedged. A call still running at the deadline is abandoned
+        and keeps its slot until it returns.
+        """
+        give_up_at = time.monotonic() + (deadline if deadline is not None else self.deadline)
+        if not self._slots.acquire(timeout=max(give_up_at - time.monotonic(), 0)):
+            raise LLMDeadlineExceeded("No free LLM slot before the deadline")
+        future = self._executor.submit(self._run, call)
+        try:
+            return future.result(timeout=max(give_up_at - time.monotonic(), 0))
+        except FutureTimeout:
+            raise LLMDeadlineExceeded("The model did not answer before the deadline") from None
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    def _hedged(self, messages: Messages, give_up_at: float) -> Completion:
+        remaining = give_up_at - time.monotonic()
+        if remaining <= 0 or not self._slots.acquire(timeout=remaining):
+            raise LLMDeadlineExceeded("No free LLM slot before the deadline")
+        pending = {self._executor.submit(self._attempt, messages, give_up_at)}
+        hedged = self.hedge_after is None
+        error: Optional[LLMError] = None
+        while pending:
+            timeout = give_up_at - time.monotonic()
+            if not hedged:
+                timeout = min(timeout, self.hedge_after)
+            done, pending = wait(pending, timeout=max(timeout, 0), return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    return future.result()
+                except LLMError as e:
+                    error = e
+            if error is not None and not isinstance(error, RetryableLLMError):
+                raise error
+            if not done and not hedged:
+                hedged = True
+                # Hedging only spends spare capacity; it never queues behind other callers
+                if self._slots.acquire(blocking=False):
+                    LLM_ATTEMPTS.inc(outcome="hedge")
+                    pending.add(self._executor.submit(self._attempt, messages, give_up_at))
+                continue
+            if not done and time.monotonic() >= give_up_at:
+                raise LLMDeadlineExceeded("The model did not answer before the deadline")
+        raise error
+
+    def _attempt(self, messages: Messages, give_up_at: float) -> Completion:
+        """Runs on the pool's threads and owns one slot, released when the request ends."""
+        try:
+            completion = self.client.complete(messages, timeout=max(give_up_at - time.monotonic(), 0.001))
+        except RetryableLLMError:
+            LLM_ATTEMPTS.inc(outcome="retryable")
+            raise
+        except LLMError:
+            LLM_ATTEMPTS.inc(outcome="error")
+            raise
+        finally:
+            self._slots.release()
+        LLM_ATTEMPTS.inc(outcome="ok")
+        return completion
+
+    def _run(self, call: Callable[[], T]) -> T:
+        """Like _attempt, for a call made outside the pool's client."""
+        try:
+            result = call()
+        except Exception:
+            LLM_ATTEMPTS.inc(outcome="error")
+            raise
+        finally:
+            self._slots.release()
+        LLM_ATTEMPTS.inc(outcome="ok")
+        return result
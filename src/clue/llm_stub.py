@@ -0,0 +1,139 @@
+"""Local stand-in for an OpenAI-compatible chat completions API.
+
+Answers POST /v1/chat/completions after a simulated, log-normally
+distributed latency. It can be told to stall or fail a share of requests
+or to rate-limit above a concurrency cap, so the AI path and LLMPool can
+be load-tested offline:
+
+    python src/clue/llm_stub.py --port 8002 --median 1.5 --error-rate 0.02
+    CLUE_LLM_BASE_URL=http://127.0.0.1:8002/v1 python src/clue/server.py
+
+The reply echoes the last line of the last user message. ClueAI's prompts
+(see prompts.py) end with the answer options and its parsers look for card
+names in the answer, so an echo parses to a legal (if naive) choice.
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+
+
+class StubLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int] = ("127.0.0.1", 0), median: float = 1.0, sigma: float = 0.5,
+                 error_rate: float = 0.0, max_concurrency: Optional[int] = None, seed: Optional[int] = None,
+                 stall_rate: float = 0.0, stall_seconds: float = 10.0,
+                 prefill_per_token: float = 0.0, decode_per_token: float = 0.0):
+        super().__init__(address, _Handler)
+        self.median = median
+        self.sigma = sigma
+        self.error_rate = error_rate
+        self.max_concurrency = max_concurrency
+        # Providers' tails are heavier than log-normal: now and then a request just hangs
+        self.stall_rate = stall_rate
+        self.stall_seconds = stall_seconds
+        # Seconds per prompt token read and per completion token written, so prompt size shows in latency
+        self.prefill_per_token = prefill_per_token
+        self.decode_per_token = decode_per_token
+        self.requests = 0
+        self.in_flight = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "StubLLMServer":
+        """Serves on a background thread; returns self."""
+        threading.Thread(target=self.serve_forever, name="clue-llm-stub", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def _admit(self) -> Tuple[Optional[int], float]:
+        """The error status to answer with (None for success) and the latency to simulate."""
+        with self._lock:
+            self.requests += 1
+            if self.max_concurrency is not None and self.in_flight >= self.max_concurrency:
+                return 429, 0.0
+            if self._rng.random() < self.error_rate:
+                return 503, 0.0
+            self.in_flight += 1
+            latency = self.median * math.exp(self.sigma * self._rng.gauss(0, 1)) if self.median else 0.0
+            if self._rng.random() < self.stall_rate:
+                latency += self.stall_seconds
+            return None, latency
+
+    def _release(self):
+        with self._lock:
+            self.in_flight -= 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like a real provider
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if not self.path.endswith("/chat/completions"):
+            self._reply(404, {"error": {"message": "not found"}})
+            return
+        status, latency = self.server._admit()
+        if status is not None:
+            self._reply(status, {"error": {"message": "stub failure"}})
+            return
+        try:
+            messages = body.get("messages") or []
+            prompt = " ".join(str(m.get("content", "")) for m in messages)
+            question = next((str(m.get("content", "")) for m in reversed(messages) if m.get("role") == "user"), "")
+            answer = question.strip().rsplit("\n", 1)[-1]
+            time.sleep(latency + len(prompt) // 4 * self.server.prefill_per_token + len(answer) // 4 * self.server.decode_per_token)
+            self._reply(200, {
+                "object": "chat.completion",
+                "model": body.get("model", "stub"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": answer}, "finish_reason": "stop"}],
+                # Rough but stable: about four characters per token
+                "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(answer) // 4,
+                          "total_tokens": (len(prompt) + len(answer)) // 4},
+            })
+        finally:
+            self.server._release()
+
+    def _reply(self, status: int, payload: dict):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8002)
+    parser.add_argument("--median", type=float, default=1.0, help="Median latency in seconds")
+    parser.add_argument("--sigma", type=float, default=0.5, help="Log-normal spread of the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with a 503")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="Share of requests that hang for --stall-seconds more")
+    parser.add_argument("--stall-seconds", type=float, default=10.0)
+    parser.add_argument("--prefill-per-token", type=float, default=0.0, help="Seconds per prompt token")
+    parser.add_argument("--decode-per-token", type=float, default=0.0, help="Seconds per completion token")
+    parser.add_argument("--max-concurrency", type=int, help="Answer 429 above this many requests in flight")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+    server = StubLLMServer((args.host, args.port), args.median, args.sigma, args.error_rate, args.max_concurrency, args.seed,
+                           args.stall_rate, args.stall_seconds, args.prefill_per_token, args.decode_per_token)
+    print(f"Stub LLM listening on {server.base_url}", flush=True)
+    server.serve_forever()
@@ -0,0 +1,222 @@
+import bisect
+import threading
+import time
+from contextlib import ContextDecorator
+from typing import Dict, List, Sequence, Tuple
+
+# Request and turn-phase latencies (seconds): a game-logic call is tens of
+# microseconds, an LLM round-trip several seconds.
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonic count per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            lines.append(f"{self.name}_total{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class _Timer(ContextDecorator):
+    __slots__ = ("histogram", "key", "start")
+
+    def __init__(self, histogram: "Histogram", key: Tuple[str, ...]):
+        self.histogram = histogram
+        self.key = key
+
+    def _recreate_cm(self):
+        # A decorated function may run on several threads at once
+        return _Timer(self.histogram, self.key)
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram._observe(self.key, time.perf_counter() - self.start)
+        return False
+
+
+class Histogram(_Metric):
+    """Bucketed distribution per label combination.
+
+    Observations only bump one bucket; the cumulative counts Prometheus
+    expects are built when rendering.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[Tuple[str, ...], list] = {}  # key -> [bucket counts..., +Inf count, sum]
+
+    def observe(self, value: float, **labels: str):
+        self._observe(self._key(labels), value)
+
+    def time(self, **labels: str) -> _Timer:
+        """Times a `with` block or, used as a decorator, every call of a function."""
+        return _Timer(self, self._key(labels))
+
+    def _observe(self, key: Tuple[str, ...], value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, **labels: str) -> int:
+        series = self._values.get(self._key(labels))
+        return sum(series[:-1]) if series else 0
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            values = [(key, list(series)) for key, series in self._values.items()]
+        for key, series in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                le = 'le="' + _format_value(float(bound)) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    """The metrics one /metrics endpoint exposes, in registration order."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicate metric: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "clue_http_request_seconds", "Time to serve an HTTP request, by route template.", ("method", "route", "status"))
+TURN_PHASE_SECONDS = REGISTRY.histogram(
+    "clue_turn_phase_seconds", "Time spent in each phase of an AI turn.", ("phase",))
+AI_DECISION_SECONDS = REGISTRY.histogram(
+    "clue_ai_decision_seconds", "Time spent in ClueAI.decide_* calls, model round-trips included.", ("decision",))
+LLM_CALLS = REGISTRY.counter(
+    "clue_llm_calls", "Model round-trips, by the decision that made them.", ("decision",))
+LLM_CALL_SECONDS = REGISTRY.histogram(
+    "clue_llm_call_seconds", "Latency of a single model round-trip.", ("decision",))
+LLM_TOKENS = REGISTRY.counter(
+    "clue_llm_tokens", "Tokens reported by the model backend.", ("decision", "kind"))
+DECISION_CACHE_LOOKUPS = REGISTRY.counter(
+    "clue_decision_cache_lookups", "Decision cache lookups, by result (hit or miss).", ("decision", "result"))
+SPECULATIONS = REGISTRY.counter(
+    "clue_speculations", "AI decisions looked up in work done during the human's turn (hit, miss or stale).", ("decision", "outcome"))
+FALLBACK_PARSES = REGISTRY.counter(
+    "clue_ai_fallback_parses", "Model answers that could not be parsed and fell back to a default choice.", ("decision",))
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware feeding HTTP_REQUEST_SECONDS.
+
+    Requests are labelled with the route template ("/game/{game_id}/state"),
+    never the raw path, so the number of series stays bounded. Plain ASGI
+    rather than a BaseHTTPMiddleware, which would add a task per request.
+    """
+
+    def __init__(self, app, histogram: Histogram = HTTP_REQUEST_SECONDS):
+        self.app = app
+        self.histogram = histogram
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = [500]
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            self.histogram.observe(time.perf_counter() - start, method=scope["method"], route=path, status=status[0])
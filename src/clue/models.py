@@ -1,6 +1,6 @@
 from enum import Enum
-from typing import List, Optional, Dict
-from pydantic import BaseModel
+from typing import List, Optional, Dict, Union
+from pydantic import BaseModel, Field
 
 class CardType(str, Enum):
     SUSPECT = "suspect"
@@ -33,15 +33,22 @@ class GamePhase(str, Enum):
     GAME_OVER = "game_over"
 
 class GameState(BaseModel):
+    game_id: Optional[str] = None
     players: List[Player]
     current_player_index: int
     phase: GamePhase
     winner: Optional[str] = None
-    logs: List[str] = []
+    seed: Optional[int] = None # Replays the deal, dice and shown cards when passed back to /game/start
+    log_cursor: int = 0 # Sequence number of the newest log entry; page through /game/{id}/logs
     # The board structure might be static, so maybe not needed in state, 
     # but available moves could be useful
     available_moves: List[str] = [] 
     dice_rolled: bool = False 
+    version: int = 0 # Bumped by every change; the /state ETag, and what If-Match compares against
+
+class LogEntry(BaseModel):
+    seq: int
+    message: str
 
 class MoveRequest(BaseModel):
     destination_room: str
@@ -58,3 +65,11 @@ class AccusationRequest(BaseModel):
 
 class GameConfig(BaseModel):
     human_character: str
+    seed: Optional[int] = None
+    # Variants. Defaults give the standard game: 3 AI opponents with 4 cards each.
+    num_ai_players: int = 3
+    hand_size: Optional[int] = Field(4, ge=1) # None deals the whole deck, so hands may be uneven
+    suspects: Optional[List[str]] = None
+    weapons: Optional[List[str]] = None
+    # Room -> adjacent rooms, or {adjacent room: steps} for a weighted board; its rooms are the room cards
+    board: Optional[Dict[str, Union[List[str], Dict[str, int]]]] = None
@@ -0,0 +1,161 @@
+import json
+import queue
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Optional
+
+from src.clue.board import Board
+from src.clue.game_logic import ClueGame
+
+# Events between snapshots of one game. Restoring replays at most this many.
+DEFAULT_SNAPSHOT_EVERY = 200
+# The writer commits whatever is queued at least this often (seconds) ...
+DEFAULT_FLUSH_INTERVAL = 0.05
+# ... or as soon as this many writes are waiting.
+DEFAULT_BATCH_SIZE = 1000
+
+_STOP = object()
+
+
+def _encode(value):
+    if isinstance(value, Board):
+        return value.graph
+    raise TypeError(f"Cannot record {type(value).__name__}")
+
+
+class EventStore:
+    """Append-only SQLite log of every game's state changes, with periodic snapshots.
+
+    attach() makes a game report each recorded ClueGame call (see
+    game_logic.recorded) as an event. Every `snapshot_every` events the
+    game's full state is stored and the events it covers are dropped, so
+    restore() only loads one snapshot per game plus the events after it and
+    replays them against the game's own seeded generator.
+
+    Callers never wait on SQLite: writes go through a queue to a single
+    writer thread that commits them in batches.
+    """
+
+    def __init__(self, path: str, snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.path = path
+        self.snapshot_every = snapshot_every
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._seq: Dict[str, int] = {}  # game id -> last event seq
+        self._seq_lock = threading.Lock()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS events (game_id TEXT, seq INTEGER, name TEXT, args TEXT, PRIMARY KEY (game_id, seq))")
+        self._db.execute("CREATE TABLE IF NOT EXISTS snapshots (game_id TEXT PRIMARY KEY, seq INTEGER, state TEXT)")
+        self._db.commit()
+        self._writer = threading.Thread(target=self._write_loop, name="clue-event-store", daemon=True)
+        self._writer.start()
+
+    # --- Recording ----------------------------------------------------------
+
+    def attach(self, game_id: str, game: ClueGame):
+        """Starts recording `game`'s state changes under `game_id`."""
+        def record(name, args, kwargs):
+            with self._seq_lock:
+                seq = self._seq.get(game_id, 0) + 1
+                self._seq[game_id] = seq
+            payload = json.dumps([args, kwargs], default=_encode)
+            self._queue.put(("event", game_id, seq, name, payload))
+            if seq % self.snapshot_every == 0:
+                self._queue.put(("snapshot", game_id, seq, json.dumps(game.to_snapshot())))
+        game.recorder = record
+
+    def delete(self, game_id: str):
+        with self._seq_lock:
+            self._seq.pop(game_id, None)
+        self._queue.put(("delete", game_id))
+
+    def flush(self):
+        """Blocks until everything queued so far is committed."""
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        done.wait()
+
+    def close(self):
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._db.close()
+
+    def _write_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get(timeout=self.flush_interval))
+            except queue.Empty:
+                pass
+            stop = any(op is _STOP for op in batch)
+            self._commit([op for op in batch if op is not _STOP])
+            if stop:
+                return
+
+    def _commit(self, batch: List[tuple]):
+        events, waiters = [], []
+        with self._db:
+            for op in batch:
+                kind = op[0]
+                if kind == "event":
+                    events.append(op[1:])
+                    continue
+                # Keep ordering: events queued before a snapshot or delete go in first
+                if events:
+                    self._db.executemany("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?)", events)
+                    events = []
+                if kind == "snapshot":
+                    _, game_id, seq, state = op
+                    self._db.execute("INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?)", (game_id, seq, state))
+                    self._db.execute("DELETE FROM events WHERE game_id = ? AND seq <= ?", (game_id, seq))
+                elif kind == "delete":
+                    self._db.execute("DELETE FROM events WHERE game_id = ?", (op[1],))
+                    self._db.execute("DELETE FROM snapshots WHERE game_id = ?", (op[1],))
+                elif kind == "flush":
+                    waiters.append(op[1])
+            if events:
+                self._db.executemany("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?)", events)
+        for waiter in waiters:
+            waiter.set()
+
+    # --- Restoring ----------------------------------------------------------
+
+    def restore(self, make_game: Optional[Callable[[str, Optional[dict]], ClueGame]] = None) -> Dict[str, ClueGame]:
+        """Rebuilds every stored game and re-attaches it. Call before recording anything.
+
+        `make_game(game_id, snapshot)` builds the starting point for a game
+        (default: ClueGame.from_snapshot, or a fresh ClueGame when the game
+        has no snapshot yet); its events are replayed on top of it.
+        """
+        make_game = make_game or (lambda game_id, snapshot: ClueGame.from_snapshot(snapshot) if snapshot else ClueGame())
+        snapshots = {}
+        for game_id, seq, state in self._db.execute("SELECT game_id, seq, state FROM snapshots"):
+            snapshots[game_id] = (seq, json.loads(state))
+
+        games: Dict[str, ClueGame] = {}
+        last_seq: Dict[str, int] = {seq_game: seq for seq_game, (seq, _) in snapshots.items()}
+        for game_id, (_, snapshot) in snapshots.items():
+            games[game_id] = make_game(game_id, snapshot)
+        for game_id, seq, name, args in self._db.execute("SELECT game_id, seq, name, args FROM events ORDER BY game_id, seq"):
+            game = games.get(game_id)
+            if game is None:
+                game = games[game_id] = make_game(game_id, None)
+            positional, keywords = json.loads(args)
+            getattr(game, name)(*positional, **keywords)
+            last_seq[game_id] = seq
+
+        with self._seq_lock:
+            self._seq.update(last_seq)
+        for game_id, game in games.items():
+            if game.state is None:
+                # Its first event never made it to disk
+                del self._seq[game_id]
+                continue
+            game.state.game_id = game_id
+            self.attach(game_id, game)
+        return {game_id: game for game_id, game in games.items() if game.state is not None}
@@ -0,0 +1,99 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+from src.clue.deduction import Deduction
+
+# Probability of each 2d6 total
+ROLL_PROBABILITIES = {total: (6 - abs(total - 7)) / 36 for total in range(2, 13)}
+
+DEFAULT_HORIZON = 3
+DEFAULT_DISCOUNT = 0.5
+# Suspecting in a room that may be the murder room teaches us about all three
+# categories; elsewhere only the suspect and weapon answers are informative.
+CANDIDATE_ROOM_VALUE = 1.0
+KNOWN_ROOM_VALUE = 0.25
+# Distinct distance matrices whose tables are kept for sharing (LRU, see board.DEFAULT_MAX_BOARDS)
+DEFAULT_MAX_PLANNERS = 64
+
+
+class MovePlanner:
+    """Deterministic multi-turn movement policy over a fixed board.
+
+    reach[k][a][b] is the probability of being in room b within k turns,
+    starting from room a and always moving optimally towards b under the 2d6
+    roll distribution and the move rules of ClueGame.get_valid_moves. The
+    tables only depend on the distance matrix, so they are built once per
+    board and shared by every game on it.
+    """
+
+    _cache: "OrderedDict[tuple, MovePlanner]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    max_cached = DEFAULT_MAX_PLANNERS
+
+    def __init__(self, distances: Dict[str, Dict[str, int]], horizon: int = DEFAULT_HORIZON):
+        self.rooms: List[str] = list(distances)
+        self.index = {room: i for i, room in enumerate(self.rooms)}
+        self.horizon = horizon
+        n = len(self.rooms)
+
+        # destinations[a][roll] = rooms reachable from a with that roll (or [a] if none)
+        self.destinations = []
+        for a, room in enumerate(self.rooms):
+            by_roll = {}
+            for roll in ROLL_PROBABILITIES:
+                reachable = [self.index[r] for r, d in distances[room].items() if 0 < d <= roll]
+                by_roll[roll] = reachable or [a]
+            self.destinations.append(by_roll)
+
+        self.reach = [[[1.0 if a == b else 0.0 for b in range(n)] for a in range(n)]]
+        for _ in range(horizon):
+            previous = self.reach[-1]
+            current = []
+            for a in range(n):
+                row = []
+                for b in range(n):
+                    if a == b:
+                        row.append(1.0)
+                        continue
+                    expected = 0.0
+                    for roll, p in ROLL_PROBABILITIES.items():
+                        expected += p * max(previous[d][b] for d in self.destinations[a][roll])
+                    row.append(expected)
+                current.append(row)
+            self.reach.append(current)
+
+    @classmethod
+    def for_board(cls, distances: Dict[str, Dict[str, int]], horizon: int = DEFAULT_HORIZON) -> "MovePlanner":
+        key = (horizon, tuple((a, tuple(sorted(row.items()))) for a, row in sorted(distances.items())))
+        with cls._cache_lock:
+            planner = cls._cache.get(key)
+            if planner is not None:
+                cls._cache.move_to_end(key)
+                return planner
+        planner = cls(distances, horizon)
+        with cls._cache_lock:
+            planner = cls._cache.setdefault(key, planner)
+            cls._cache.move_to_end(key)
+            while len(cls._cache) > cls.max_cached:
+                cls._cache.popitem(last=False)
+        return planner
+
+    def room_values(self, knowledge: Optional[Deduction]) -> List[float]:
+        if knowledge is None:
+            return [CANDIDATE_ROOM_VALUE] * len(self.rooms)
+        candidates = set(knowledge.candidates("room"))
+        return [CANDIDATE_ROOM_VALUE if room in candidates else KNOWN_ROOM_VALUE for room in self.rooms]
+
+    def score(self, destination: str, values: Sequence[float], discount: float = DEFAULT_DISCOUNT) -> float:
+        """Value of suspecting in `destination` now, plus the best room reachable from it later."""
+        d = self.index[destination]
+        reach = self.reach[self.horizon][d]
+        later = max((values[t] * reach[t] for t in range(len(self.rooms)) if t != d), default=0.0)
+        return values[d] + discount * later
+
+    def choose(self, valid_moves: Sequence[str], knowledge: Optional[Deduction] = None) -> Optional[str]:
+        if not valid_moves:
+            return None
+        values = self.room_values(knowledge)
+        return max(valid_moves, key=lambda room: self.score(room, values))
@@ -0,0 +1,100 @@
+import random
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.clue.deduction import Deduction
+from src.clue.models import GameState, Player
+from src.clue.planner import MovePlanner
+from src.clue.strategy import DEFAULT_ACCUSATION_CONFIDENCE, choose_accusation, choose_suspicion
+
+# A policy decides everything an AI seat does during its turn. ClueAI is one;
+# the classes here are the model-free ones used for self-play and as the
+# server's fallback. They all share ClueAI's method signatures.
+
+
+class RandomPolicy:
+    """Uniformly random moves and suspicions; only accuses when certain."""
+
+    batches_moves = False
+    # Decisions that may be worked out ahead (see speculation.py): none, they all draw from self.rng
+    speculative_decisions = ()
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
+
+    def decide_move(self, player: Player, valid_moves: List[str], game_state: GameState,
+                    knowledge: Optional[Deduction] = None, planner: Optional[MovePlanner] = None) -> Optional[str]:
+        return self.rng.choice(valid_moves) if valid_moves else None
+
+    def decide_suspicion(self, player: Player, current_room: str, game_state: GameState,
+                         all_suspects: List[str], all_weapons: List[str],
+                         knowledge: Optional[Deduction] = None) -> Dict[str, str]:
+        return {"suspect": self.rng.choice(all_suspects), "weapon": self.rng.choice(all_weapons), "room": current_room}
+
+    def decide_accusation(self, player: Player, game_state: GameState,
+                          knowledge: Optional[Deduction] = None) -> Optional[Dict[str, str]]:
+        if knowledge is None:
+            return None
+        return choose_accusation(knowledge, confidence=1.0)
+
+
+class HeuristicPolicy:
+    """Movement planner, information-gain suspicions and confidence-gated accusations. No model calls."""
+
+    batches_moves = False
+    # The planner is deterministic; suspicions and accusations draw from self.rng
+    speculative_decisions = ("move",)
+
+    def __init__(self, accusation_confidence: float = DEFAULT_ACCUSATION_CONFIDENCE,
+                 rng: Optional[np.random.Generator] = None):
+        self.accusation_confidence = accusation_confidence
+        self.rng = rng or np.random.default_rng()
+
+    def decide_move(self, player: Player, valid_moves: List[str], game_state: GameState,
+                    knowledge: Optional[Deduction] = None, planner: Optional[MovePlanner] = None) -> Optional[str]:
+        if not valid_moves:
+            return None
+        if planner is None:
+            return valid_moves[0]
+        return planner.choose(valid_moves, knowledge)
+
+    def decide_suspicion(self, player: Player, current_room: str, game_state: GameState,
+                         all_suspects: List[str], all_weapons: List[str],
+                         knowledge: Optional[Deduction] = None) -> Dict[str, str]:
+        if knowledge is None:
+            return {"suspect": all_suspects[0], "weapon": all_weapons[0], "room": current_room}
+        return choose_suspicion(knowledge, game_state.current_player_index, current_room, self.rng)
+
+    def decide_accusation(self, player: Player, game_state: GameState,
+                          knowledge: Optional[Deduction] = None) -> Optional[Dict[str, str]]:
+        if knowledge is None:
+            return None
+        return choose_accusation(knowledge, self.accusation_confidence, self.rng)
+
+
+def cached_llm_policy(seed: Optional[int] = None, decision_cache=None, cache_path: Optional[str] = None):
+    """ClueAI backed by a decision cache, so repeated simulations reuse model answers.
+
+    Pass one `decision_cache` to every seat and game that should share answers;
+    otherwise each policy gets its own, on disk at `cache_path` if given.
+    """
+    # Imported here so model-free simulations never load crewai
+    from src.clue.agents import ClueAI
+    from src.clue.decision_cache import DecisionCache
+    if decision_cache is None:
+        decision_cache = DecisionCache(path=cache_path)
+    return ClueAI(decision_cache=decision_cache)
+
+
+def make_policy(name: str, seed: Optional[int] = None, **options):
+    if name == "random":
+        return RandomPolicy(random.Random(seed))
+    if name == "heuristic":
+        return HeuristicPolicy(rng=np.random.default_rng(seed), **options)
+    if name == "cached-llm":
+        return cached_llm_policy(seed, **options)
+    raise ValueError(f"Unknown policy: {name}")
+
+
+POLICY_NAMES = ("random", "heuristic", "cached-llm")
@@ -0,0 +1,186 @@
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from src.clue.deduction import Deduction, _bits
+
+DEFAULT_SAMPLES = 2000
+DEFAULT_TIME_BUDGET = 0.005  # seconds
+DEFAULT_BATCH = 4096
+
+Solution = Tuple[str, ...]
+
+
+class SolutionEstimate:
+    def __init__(self, probabilities: Dict[Solution, float], accepted: int, drawn: int, elapsed: float):
+        self.probabilities = probabilities
+        self.accepted = accepted
+        self.drawn = drawn
+        self.elapsed = elapsed
+
+    def best(self) -> Tuple[Optional[Solution], float]:
+        if not self.probabilities:
+            return None, 0.0
+        solution = max(self.probabilities, key=self.probabilities.get)
+        return solution, self.probabilities[solution]
+
+
+class SolutionEstimator:
+    """Monte Carlo estimate of P(solution) given everything a player has deduced.
+
+    Samples are full card deals consistent with a Deduction:
+      1. each still-unknown solution category draws a card uniformly from its candidates,
+      2. the other unknown cards are randomly permuted into the free hand slots,
+      3. deals violating a holder's `maybe` mask or an open clause are rejected.
+    Every consistent deal is produced with the same probability, so accepted
+    samples are uniform over the worlds the player cannot tell apart.
+    All three steps run over a whole batch at once with NumPy.
+    """
+
+    def __init__(self, knowledge: Deduction):
+        self.knowledge = knowledge
+        k = knowledge
+        num_cards = len(k.cards)
+        self.categories = k.categories
+
+        self.known = {}  # category -> card index already pinned to the solution
+        self.free_categories = []  # (category, candidate card indices)
+        pinned = 0
+        for category, cat_mask in k.category_masks.items():
+            m = k.has[k.solution] & cat_mask
+            if m:
+                self.known[category] = m.bit_length() - 1
+                pinned |= m
+            else:
+                self.free_categories.append((category, np.array(list(_bits(k.maybe[k.solution] & cat_mask)))))
+
+        owned = pinned
+        for m in k.has:
+            owned |= m
+        self.unknown = np.array([i for i in range(num_cards) if not owned >> i & 1], dtype=np.int64)
+        self.position = np.full(num_cards, -1, dtype=np.int64)
+        self.position[self.unknown] = np.arange(len(self.unknown))
+
+        # Free slots of every holder except the solution, which is sampled separately
+        slot_holders = []
+        for h, size in enumerate(k.sizes):
+            if h != k.solution:
+                slot_holders.extend([h] * (size - k.has[h].bit_count()))
+        self.slot_holders = np.array(slot_holders, dtype=np.int64)
+
+        allowed = np.zeros((len(k.sizes), num_cards), dtype=bool)
+        for h, m in enumerate(k.maybe):
+            for i in _bits(m):
+                allowed[h, i] = True
+        # allowed_by_slot[j, c]: may card c sit in free slot j
+        self.allowed_by_slot = allowed[self.slot_holders]
+        # Only false when the knowledge itself is contradictory
+        self.consistent = len(self.slot_holders) + len(self.free_categories) == len(self.unknown)
+
+        self.clauses = []
+        for holder, m in k.clauses:
+            slots = np.nonzero(self.slot_holders == holder)[0]
+            clause_cards = np.zeros(num_cards, dtype=bool)
+            clause_cards[list(_bits(m))] = True
+            self.clauses.append((slots, clause_cards))
+
+    def sample(self, rng: np.random.Generator, batch: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Draws `batch` deals. Returns (solution card indices [batch, free categories], accepted mask)."""
+        solutions, _, accepted = self._draw(rng, batch)
+        return solutions, accepted
+
+    def _draw(self, rng: np.random.Generator, batch: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        num_free = len(self.free_categories)
+        keys = rng.random((batch, len(self.unknown)))
+        solutions = np.empty((batch, num_free), dtype=np.int64)
+        rows = np.arange(batch)
+        for f, (_, candidates) in enumerate(self.free_categories):
+            chosen = candidates[rng.integers(0, len(candidates), size=batch)]
+            solutions[:, f] = chosen
+            # Negative keys sort the solution cards first, in category order
+            keys[rows, self.position[chosen]] = f - num_free
+
+        order = np.argsort(keys, axis=1)
+        dealt = self.unknown[order[:, num_free:]]  # [batch, free slots]
+
+        slots = np.arange(dealt.shape[1])
+        accepted = self.allowed_by_slot[slots, dealt].all(axis=1)
+        for clause_slots, clause_cards in self.clauses:
+            accepted &= clause_cards[dealt[:, clause_slots]].any(axis=1)
+        return solutions, dealt, accepted
+
+    def sample_worlds(self, rng: np.random.Generator, count: int, time_budget: float = DEFAULT_TIME_BUDGET,
+                      batch: int = DEFAULT_BATCH) -> np.ndarray:
+        """Up to `count` consistent deals as an owner matrix: owners[world, card] = holder index."""
+        k = self.knowledge
+        if not self.free_categories or not self.consistent:
+            return np.empty((0, len(k.cards)), dtype=np.int64)
+        base = np.empty(len(k.cards), dtype=np.int64)
+        for h, m in enumerate(k.has):
+            for i in _bits(m):
+                base[i] = h
+
+        start = time.perf_counter()
+        worlds = []
+        found = 0
+        while found < count:
+            solutions, dealt, accepted = self._draw(rng, batch)
+            dealt, solutions = dealt[accepted], solutions[accepted]
+            if len(dealt):
+                owners = np.repeat(base[None, :], len(dealt), axis=0)
+                rows = np.arange(len(dealt))[:, None]
+                owners[rows, dealt] = self.slot_holders[None, :]
+                owners[rows, solutions] = k.solution
+                worlds.append(owners)
+                found += len(dealt)
+            if time.perf_counter() - start > time_budget:
+                break
+        if not worlds:
+            return np.empty((0, len(k.cards)), dtype=np.int64)
+        return np.concatenate(worlds)[:count]
+
+    def estimate(self, rng: Optional[np.random.Generator] = None, samples: int = DEFAULT_SAMPLES,
+                 time_budget: float = DEFAULT_TIME_BUDGET, batch: int = DEFAULT_BATCH) -> SolutionEstimate:
+        """Samples until `samples` deals were accepted or `time_budget` seconds passed."""
+        rng = rng or np.random.default_rng()
+        start = time.perf_counter()
+        k = self.knowledge
+
+        if not self.free_categories:
+            solution = tuple(k.cards[self.known[c]] for c in self.categories)
+            return SolutionEstimate({solution: 1.0}, 0, 0, 0.0)
+
+        counts: Dict[tuple, int] = {}
+        accepted_total = drawn = 0
+        while self.consistent and accepted_total < samples:
+            solutions, accepted = self.sample(rng, batch)
+            drawn += batch
+            kept = solutions[accepted]
+            accepted_total += len(kept)
+            if len(kept):
+                rows, n = np.unique(kept, axis=0, return_counts=True)
+                for row, count in zip(map(tuple, rows), n):
+                    counts[row] = counts.get(row, 0) + int(count)
+            if time.perf_counter() - start > time_budget:
+                break
+
+        probabilities = {}
+        if accepted_total:
+            for row, count in counts.items():
+                probabilities[self._solution(row)] = count / accepted_total
+        else:
+            # Nothing consistent found in budget: fall back to uniform over candidates
+            grids = np.meshgrid(*[c for _, c in self.free_categories], indexing="ij")
+            rows = np.stack([g.ravel() for g in grids], axis=1)
+            for row in map(tuple, rows):
+                probabilities[self._solution(row)] = 1 / len(rows)
+        return SolutionEstimate(probabilities, accepted_total, drawn, time.perf_counter() - start)
+
+    def _solution(self, free_row) -> Solution:
+        free = {category: card for (category, _), card in zip(self.free_categories, free_row)}
+        return tuple(self.knowledge.cards[self.known[c] if c in self.known else free[c]] for c in self.categories)
+
+
+def solution_probabilities(knowledge: Deduction, rng: Optional[np.random.Generator] = None, **budget) -> SolutionEstimate:
+    return SolutionEstimator(knowledge).estimate(rng, **budget)
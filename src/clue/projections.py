@@ -0,0 +1,124 @@
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from src.clue.models import GamePhase, GameState
+
+# What each seat may see of the game. Everything about the table is public
+# except what a player knows about the cards: their hand, their notebook,
+# the cards they were shown and the suspicions they could not get disproved.
+# Those are only sent to the player themselves; a seat of None (a spectator)
+# sees nobody's. The seed replays the deal, so it is kept back from everyone
+# until the game is over.
+
+PRIVATE_PLAYER_FIELDS = ("hand", "notebook", "seen_cards", "undisproved_suspicions")
+SECRET_UNTIL_GAME_OVER = ("seed",)
+STATE_FIELDS = tuple(GameState.model_fields)
+# Projections kept per state version: one per (seat, fields) a client asked for
+DEFAULT_MAX_PROJECTIONS = 16
+
+Fields = Optional[Tuple[str, ...]]
+
+
+def parse_fields(fields: Optional[str]) -> Fields:
+    """'phase,available_moves' -> ('available_moves', 'phase'); None or '' selects every field.
+
+    Raises ValueError for a field GameState does not have.
+    """
+    if not fields:
+        return None
+    names = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = names.difference(STATE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown state fields: {', '.join(sorted(unknown))}")
+    return tuple(sorted(names)) or None
+
+
+def human_seat(state: Dict[str, Any]) -> Optional[int]:
+    """The first human seat of a serialized state, the one the frontend plays."""
+    for index, player in enumerate(state.get("players", ())):
+        if player.get("is_human"):
+            return index
+    return None
+
+
+def project(state: Dict[str, Any], seat: Optional[int], fields: Fields = None) -> Dict[str, Any]:
+    """A serialized GameState as `seat` may see it, cut down to `fields`.
+
+    Works on TableCore.model_dump() output and never changes it.
+    """
+    names = STATE_FIELDS if fields is None else fields
+    projected = {name: state[name] for name in names if name in state}
+    if state.get("phase") != GamePhase.GAME_OVER.value:
+        for name in SECRET_UNTIL_GAME_OVER:
+            projected.pop(name, None)
+    if "players" in projected:
+        projected["players"] = [
+            player if index == seat else _without_private(player)
+            for index, player in enumerate(projected["players"])
+        ]
+    return projected
+
+
+def _without_private(player: Dict[str, Any]) -> Dict[str, Any]:
+    public = dict(player)
+    for name in PRIVATE_PLAYER_FIELDS:
+        public[name] = {} if name == "notebook" else []
+    return public
+
+
+class ProjectionCache:
+    """One game's projections for its current state version, serialized once each.
+
+    The state is dumped once per version and every (seat, fields) projection
+    of it at most once; a new version drops them all. A dump that may have
+    caught a change halfway (one was in progress while it was taken) is
+    returned but never cached.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_PROJECTIONS):
+        self.max_entries = max_entries
+        self.version = None
+        self._state: Optional[Dict[str, Any]] = None
+        self._entries: Dict[Tuple[Optional[int], Fields], Tuple[Dict[str, Any], Optional[bytes]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, game, seat: Optional[int], fields: Fields = None) -> Dict[str, Any]:
+        return self._entry(game, seat, fields)[1]
+
+    def body(self, game, seat: Optional[int], fields: Fields = None) -> bytes:
+        """The projection as a JSON response body."""
+        version, projected, body = self._entry(game, seat, fields)
+        if body is None:
+            body = json.dumps(projected, separators=(",", ":")).encode()
+            with self._lock:
+                key = (seat, fields)
+                if self.version == version and key in self._entries:
+                    self._entries[key] = (projected, body)
+        return body
+
+    def _entry(self, game, seat, fields) -> Tuple[Optional[int], Dict[str, Any], Optional[bytes]]:
+        key = (seat, fields)
+        version = game.version
+        with self._lock:
+            if self.version == version:
+                cached = self._entries.get(key)
+                if cached is not None:
+                    return version, cached[0], cached[1]
+                state = self._state
+            else:
+                state = None
+        if state is None:
+            settled = not game.changing
+            state = game.state.model_dump(mode="json")
+            if not (settled and not game.changing and game.version == version):
+                return None, project(state, seat, fields), None
+        projected = project(state, seat, fields)
+        with self._lock:
+            if self.version != version:
+                if self.version is not None and version < self.version:
+                    return None, projected, None
+                self.version, self._state, self._entries = version, state, {}
+            if len(self._entries) < self.max_entries:
+                self._entries[key] = (projected, None)
+        return version, projected, None
@@ -0,0 +1,156 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.clue.core import CATEGORIES
+from src.clue.deduction import Deduction
+from src.clue.models import Player
+
+# Compact prompts for ClueAI's model calls. What a player knows is sent as a
+# per-category grid of the cards still open (possibly in the envelope) and the
+# ones in their own hand; everything else in a category is cleared. That is
+# bounded by the deck size, unlike the raw notebook dict it replaces, and each
+# prompt is fitted to a token budget by dropping detail, never the options.
+# Decision prompts end with a line listing the answer options, which the
+# local stub model (llm_stub.py) echoes back.
+
+DEFAULT_PROMPT_BUDGET = 250  # tokens per decision prompt, persona included
+CHARS_PER_TOKEN = 4          # rough, but close enough for budgeting English prompts
+
+LABELS = {"suspect": "Suspects", "weapon": "Weapons", "room": "Rooms"}
+
+PERSONAS = {
+    "Miss Scarlet": "cunning, charming and deceptive",
+    "Colonel Mustard": "dignified, pompous and blustery",
+    "Mrs. White": "frazzled, intrusive, knows every secret",
+    "Mr. Green": "slick and always looking for an angle",
+    "Mrs. Peacock": "proper, elegant, with a sharp tongue",
+    "Professor Plum": "quick-witted, arrogant and intellectual",
+}
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+@dataclass
+class Prompt:
+    system: str
+    user: str
+    expected_output: str
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.system) + estimate_tokens(self.user)
+
+    def messages(self) -> List[Dict[str, str]]:
+        return [{"role": "system", "content": self.system}, {"role": "user", "content": self.user}]
+
+
+def persona(player: Optional[Player]) -> str:
+    if player is None:
+        return "You advise Clue players, each on their own information only. Answer tersely."
+    trait = PERSONAS.get(player.character_name, "a mysterious guest")
+    return f"You are {player.character_name} in a game of Clue: {trait}. Answer tersely."
+
+
+def _categories(player: Player) -> Dict[str, Sequence[str]]:
+    deck = getattr(player, "deck", None)
+    return deck.categories if deck is not None else CATEGORIES
+
+
+def knowledge_grid(player: Player, knowledge: Optional[Deduction] = None,
+                   categories: Optional[Dict[str, Sequence[str]]] = None) -> List[Tuple[str, List[str], List[str]]]:
+    """(label, open cards, cards in the player's hand) per category."""
+    categories = categories or _categories(player)
+    notebook = player.notebook
+    grid = []
+    for category, cards in categories.items():
+        if knowledge is not None:
+            open_cards = knowledge.candidates(category)
+        else:
+            open_cards = [card for card in cards if card not in notebook]
+        held = [card for card in cards if notebook.get(card) == "HAND"]
+        grid.append((LABELS.get(category, category.title()), open_cards, held))
+    return grid
+
+
+def _grid_lines(grid, detail: int) -> List[str]:
+    """detail 2: open and held cards, 1: open cards only, 0: counts only."""
+    lines = []
+    for label, open_cards, held in grid:
+        if detail == 0:
+            lines.append(f"{label}: {len(open_cards)} open")
+        elif detail == 1 or not held:
+            lines.append(f"{label} open: {', '.join(open_cards) or '-'}")
+        else:
+            lines.append(f"{label} open: {', '.join(open_cards) or '-'}; yours: {', '.join(held)}")
+    return lines
+
+
+class PromptBuilder:
+    """Builds ClueAI's decision prompts within a token budget.
+
+    When a prompt does not fit, the knowledge grid loses detail (own hand,
+    then card names) before anything else; the task and its options are
+    always kept, so a prompt only exceeds the budget if they alone do.
+    """
+
+    def __init__(self, budget: int = DEFAULT_PROMPT_BUDGET):
+        self.budget = budget
+
+    def _fit(self, system: str, head: List[str], grids: List[list], tail: List[str], expected_output: str) -> Prompt:
+        for detail in (2, 1, 0):
+            body = list(head)
+            for grid in grids:
+                body.extend(_grid_lines(grid, detail))
+            prompt = Prompt(system, "\n".join(body + tail), expected_output)
+            if prompt.tokens <= self.budget:
+                return prompt
+        return Prompt(system, "\n".join(head + tail), expected_output)
+
+    def move(self, player: Player, valid_moves: Sequence[str], knowledge: Optional[Deduction] = None) -> Prompt:
+        return self._fit(
+            persona(player),
+            [f"Your move. You are in the {player.position}. Pick a room where a suspicion teaches you most."],
+            [knowledge_grid(player, knowledge)],
+            [f"Answer with one room: {', '.join(valid_moves)}"],
+            "One room name.",
+        )
+
+    def moves(self, requests: Sequence[Tuple[Player, Sequence[str], Optional[Deduction]]]) -> Prompt:
+        """One prompt deciding several players' moves, each on their own knowledge only."""
+        head = ["Each player below picks a room to move to, using only their own knowledge."]
+        grids, tail = [], []
+        for player, valid_moves, knowledge in requests:
+            grids.append(knowledge_grid(player, knowledge))
+            tail.append(f"{player.name} in {player.position}, options: {', '.join(valid_moves)}")
+        # Grids are per player, so interleave them with each player's options when they fit
+        for detail in (2, 1, 0):
+            body = list(head)
+            for grid, line in zip(grids, tail):
+                body.append(line)
+                body.extend("  " + l for l in _grid_lines(grid, detail))
+            body.append("Answer one line per player: 'Name: Room'")
+            prompt = Prompt(persona(None), "\n".join(body), "One line per player: 'Name: Room'")
+            if prompt.tokens <= self.budget * len(requests):
+                return prompt
+        return Prompt(persona(None), "\n".join(head + tail + ["Answer one line per player: 'Name: Room'"]),
+                      "One line per player: 'Name: Room'")
+
+    def suspicion(self, player: Player, room: str, suspects: Sequence[str], weapons: Sequence[str],
+                  knowledge: Optional[Deduction] = None) -> Prompt:
+        return self._fit(
+            persona(player),
+            [f"Make a suspicion in the {room}: name a suspect and a weapon. Ask about open cards to learn most."],
+            [[row for row in knowledge_grid(player, knowledge) if row[0] != LABELS["room"]]],
+            [f"Answer 'Suspect: X, Weapon: Y' with X one of {', '.join(suspects)} and Y one of {', '.join(weapons)}"],
+            "'Suspect: X, Weapon: Y'",
+        )
+
+    def flavor(self, player: Player, suspicion: Dict[str, str]) -> Prompt:
+        return Prompt(
+            persona(player),
+            f"In one short in-character sentence, announce: {suspicion['suspect']} with the "
+            f"{suspicion['weapon']} in the {suspicion['room']}. Reveal nothing about your cards.",
+            "One short sentence.",
+        )
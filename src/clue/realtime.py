@@ -0,0 +1,123 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+from src.clue.game_log import GameLog
+from src.clue.models import GameState
+
+# How many deltas we keep so a reconnecting client can catch up without a snapshot
+DELTA_HISTORY = 256
+# How many undelivered messages a subscriber may queue before it gets resynced
+SUBSCRIBER_BUFFER = 64
+
+
+def diff_states(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns only what changed between two serialized GameStates.
+
+    Players are diffed field by field and every other top-level field is
+    sent when it changes.
+    """
+    delta: Dict[str, Any] = {}
+    for key, value in new.items():
+        if key == "players":
+            old_players = old.get("players", [])
+            players = {}
+            for i, player in enumerate(value):
+                previous = old_players[i] if i < len(old_players) else {}
+                changed = {k: v for k, v in player.items() if previous.get(k) != v}
+                if changed:
+                    players[i] = changed
+            if players:
+                delta["players"] = players
+        elif old.get(key) != value:
+            delta[key] = value
+    return delta
+
+
+class _Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_BUFFER)
+
+
+class StateFeed:
+    """Versioned stream of GameState deltas for one game.
+
+    publish() may be called from the event loop or from AI worker threads;
+    delivery always happens on each subscriber's own event loop.
+    """
+
+    def __init__(self, projection: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None):
+        self.version = 0
+        # Applied to every published state, e.g. to hide what the viewer may not see (see projections.py)
+        self.projection = projection
+        self._snapshot: Dict[str, Any] = {}
+        self._history: deque = deque(maxlen=DELTA_HISTORY)
+        self._subscribers: List[_Subscriber] = []
+        self._lock = threading.Lock()
+
+    def publish(self, state: GameState, log: Optional[GameLog] = None) -> Optional[Dict[str, Any]]:
+        """Diffs `state` against the last published one and pushes the delta.
+
+        When the game's log is passed, new log entries ride along with the
+        delta so clients do not have to page /logs for them.
+        """
+        snapshot = state.model_dump(mode="json")
+        if self.projection is not None:
+            snapshot = self.projection(snapshot)
+        with self._lock:
+            changes = diff_states(self._snapshot, snapshot)
+            if not changes:
+                return None
+            if log is not None and "log_cursor" in changes:
+                entries = log.read(after=self._snapshot.get("log_cursor", 0))
+                changes["logs"] = [entry.model_dump() for entry in entries]
+            self.version += 1
+            self._snapshot = snapshot
+            message = {"type": "delta", "version": self.version, "changes": changes}
+            self._history.append(message)
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.loop.call_soon_threadsafe(self._deliver, subscriber, message)
+        return message
+
+    def snapshot_message(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"type": "snapshot", "version": self.version, "state": self._snapshot}
+
+    def catch_up(self, since: Optional[int]) -> List[Dict[str, Any]]:
+        """Messages that bring a client at version `since` up to date."""
+        with self._lock:
+            if since is not None and since <= self.version:
+                oldest = self._history[0]["version"] if self._history else self.version + 1
+                if since + 1 >= oldest:
+                    return [m for m in self._history if m["version"] > since]
+        return [self.snapshot_message()]
+
+    def subscribe(self) -> _Subscriber:
+        subscriber = _Subscriber(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: _Subscriber):
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def close(self):
+        """Tells every subscriber the game is gone."""
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        for subscriber in subscribers:
+            subscriber.loop.call_soon_threadsafe(self._deliver, subscriber, None)
+
+    def _deliver(self, subscriber: _Subscriber, message: Optional[Dict[str, Any]]):
+        if subscriber.queue.full():
+            # The client fell behind: drop its backlog and send a fresh snapshot instead
+            while not subscriber.queue.empty():
+                subscriber.queue.get_nowait()
+            if message is not None:
+                message = self.snapshot_message()
+        subscriber.queue.put_nowait(message)
@@ -1,10 +1,15 @@
 import sys
 import os
+import time
+from contextlib import contextmanager
+from typing import Optional
+_import_started = time.perf_counter()
+import numpy as np
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 print("Starting server script...", flush=True)
 
 try:
-    from fastapi import FastAPI, HTTPException, WebSocket
+    from fastapi import FastAPI, Header, HTTPException, Query, Response, WebSocket, WebSocketDisconnect
     from fastapi.middleware.cors import CORSMiddleware
     from dotenv import load_dotenv
     print("Imports successful", flush=True)
@@ -17,16 +22,18 @@ load_dotenv()
 
 from src.clue.models import GameConfig, MoveRequest, SuspicionRequest, AccusationRequest, GameState, GamePhase
 from src.clue.game_logic import ClueGame, ROOMS, WEAPONS, SUSPECTS
-from src.clue.game_logic import ClueGame, ROOMS, WEAPONS, SUSPECTS
-
-try:
-    from src.clue.agents import ClueAI
-except ImportError as e:
-    print(f"WARNING: Could not import ClueAI: {e}", flush=True)
-    ClueAI = None
-except Exception as e:
-    print(f"WARNING: Error importing ClueAI: {e}", flush=True)
-    ClueAI = None
+from src.clue.board import Board
+from src.clue.persistence import EventStore
+from src.clue.sessions import GameBusy, GameSession, SessionRegistry, VersionMismatch, etag, etag_matches
+from src.clue.game_log import DEFAULT_PAGE_SIZE
+from src.clue.policies import HeuristicPolicy
+from src.clue.turns import play_turn, plan_moves, upcoming_ai_seats
+from src.clue.jobs import Job, JobCancelled, JobManager, JobQueueFull
+from src.clue.ai_backend import READY, DISABLED, FAILED, LazyAIBackend
+from src.clue.speculation import Speculation, SpeculativePolicy, next_ai_seat
+from src.clue.llm import DEFAULT_DEADLINE, DEFAULT_MAX_CONCURRENCY, DEFAULT_RETRIES, ChatCompletionsClient, LLMPool
+from src.clue.metrics import CONTENT_TYPE, REGISTRY, RequestMetricsMiddleware
+from src.clue.projections import Fields, parse_fields
 
 app = FastAPI()
 
@@ -36,190 +43,512 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],  # Clients send it back as If-Match / If-None-Match
 )
+app.add_middleware(RequestMetricsMiddleware)
 
-game = ClueGame()
-game = ClueGame()
-try:
-    ai_interface = ClueAI()
-    print("AI Interface initialized successfully", flush=True)
-except Exception as e:
-    print(f"FAILED to initialize AI Interface: {e}", flush=True)
-    ai_interface = None
+sessions = SessionRegistry()
+ai_jobs = JobManager(max_workers=int(os.getenv("CLUE_AI_WORKERS", "8")))
+AI_TURN_TIMEOUT = float(os.getenv("CLUE_AI_TURN_TIMEOUT", "60"))
+# Work out the next AI seat's turn while the human plays (see speculation.py).
+# Its own small pool, so it never delays a real AI turn.
+SPECULATE = os.getenv("CLUE_SPECULATE", "1") == "1"
+speculation_jobs = JobManager(max_workers=int(os.getenv("CLUE_SPECULATION_WORKERS", "2")))
+# An evicted game must not keep a worker busy
+sessions.on_evict(lambda session: session.ai_job and session.ai_job.cancel())
+sessions.on_evict(lambda session: session.speculation_job and session.speculation_job.cancel())
+sessions.on_evict(lambda session: session.feed.close())
+sessions.on_evict(lambda session: session.game.log.close())
+# Optional JSON board file (see board.Board.load) used by games that do not bring their own board
+DEFAULT_BOARD = Board.load(os.environ["CLUE_BOARD_FILE"]) if os.getenv("CLUE_BOARD_FILE") else None
+# Optional directory for log lines that fall out of the in-memory ring buffer
+LOG_SPILL_DIR = os.getenv("CLUE_LOG_SPILL_DIR")
+if LOG_SPILL_DIR:
+    os.makedirs(LOG_SPILL_DIR, exist_ok=True)
+
+def log_spill_path(game_id: str) -> Optional[str]:
+    return os.path.join(LOG_SPILL_DIR, f"{game_id}.jsonl") if LOG_SPILL_DIR else None
+
+def restored_game(game_id: str, snapshot: Optional[dict]) -> ClueGame:
+    if snapshot:
+        return ClueGame.from_snapshot(snapshot, log_spill_path(game_id))
+    game = ClueGame()
+    game.log_spill_path = log_spill_path(game_id)
+    return game
+
+# Optional SQLite file recording every game change, so games survive restarts and reloads
+STATE_DB = os.getenv("CLUE_STATE_DB")
+event_store = EventStore(STATE_DB) if STATE_DB else None
+if event_store:
+    sessions.on_evict(lambda session: event_store.delete(session.game_id))
+    for restored_id, restored in event_store.restore(restored_game).items():
+        sessions.create(restored, game_id=restored_id).feed.publish(restored.state, restored.log)
+    print(f"Restored {len(sessions)} games from {STATE_DB}", flush=True)
+
+@app.on_event("shutdown")
+def close_event_store():
+    if event_store:
+        event_store.close()
+def build_ai_interface():
+    # crewai and its LLM stack are only imported here, on the first AI decision (or warm-up)
+    from src.clue.agents import ClueAI
+    from src.clue.decision_cache import DecisionCache
+    return ClueAI(
+        accusation_confidence=float(os.getenv("CLUE_AI_ACCUSATION_CONFIDENCE", "0.9")),
+        suspicion_mode=os.getenv("CLUE_AI_SUSPICION_MODE", "llm"),
+        flavor_text=os.getenv("CLUE_AI_FLAVOR_TEXT", "0") == "1",
+        move_mode=os.getenv("CLUE_AI_MOVE_MODE", "llm"),
+        decision_cache=DecisionCache(
+            max_entries=int(os.getenv("CLUE_AI_CACHE_SIZE", "4096")),
+            ttl=float(os.getenv("CLUE_AI_CACHE_TTL", str(24 * 60 * 60))),
+            path=os.getenv("CLUE_AI_CACHE_PATH"),
+        ),
+        llm_pool=build_llm_pool(),
+        prompt_budget=int(os.getenv("CLUE_AI_PROMPT_BUDGET", "250")),
+        verbose=os.getenv("CLUE_AI_VERBOSE", "0") == "1",
+    )
+
+def build_llm_pool() -> LLMPool:
+    """A shared, bounded pool to CLUE_LLM_BASE_URL (any OpenAI-compatible API, or llm_stub.py).
+
+    Without CLUE_LLM_BASE_URL the AI goes through CrewAI's default model; the
+    pool then only caps its concurrency and deadline, with no retries or hedges.
+    """
+    base_url = os.getenv("CLUE_LLM_BASE_URL")
+    max_concurrency = int(os.getenv("CLUE_LLM_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY)))
+    deadline = float(os.getenv("CLUE_LLM_DEADLINE", str(DEFAULT_DEADLINE)))
+    if not base_url:
+        return LLMPool(max_concurrency=max_concurrency, deadline=deadline)
+    hedge_after = os.getenv("CLUE_LLM_HEDGE_AFTER")
+    return LLMPool(
+        ChatCompletionsClient(
+            base_url,
+            model=os.getenv("CLUE_LLM_MODEL", "gpt-4o-mini"),
+            api_key=os.getenv("CLUE_LLM_API_KEY", os.getenv("OPENAI_API_KEY")),
+            max_connections=max_concurrency,
+        ),
+        max_concurrency=max_concurrency,
+        deadline=deadline,
+        retries=int(os.getenv("CLUE_LLM_RETRIES", str(DEFAULT_RETRIES))),
+        hedge_after=float(hedge_after) if hedge_after else None,
+    )
+
+# CLUE_AI_BACKEND=heuristic deploys without the model backend; crewai is never imported
+ai_backend = LazyAIBackend(build_ai_interface, enabled=os.getenv("CLUE_AI_BACKEND", "llm") != "heuristic")
+if os.getenv("CLUE_AI_WARMUP", "0") == "1":
+    ai_backend.warm()
+
+def release_ai(session: GameSession):
+    """Hands a finished or evicted game's model agents back to the pool."""
+    ai_interface = ai_backend.loaded()
+    if ai_interface is not None:
+        ai_interface.release_game(session.game_id)
+
+sessions.on_evict(release_ai)
+
+def policy_for(session: GameSession):
+    """The policy playing this table's AI seats. Runs on AI worker threads, so it may block on the first load.
+
+    Without a model backend, AI seats still play with the model-free
+    heuristics, seeded from the game so its samplers never share a stream
+    with another table.
+    """
+    ai_interface = ai_backend.get()
+    if ai_interface is not None:
+        return ai_interface
+    if session.ai_policy is None:
+        session.ai_policy = HeuristicPolicy(
+            accusation_confidence=float(os.getenv("CLUE_AI_ACCUSATION_CONFIDENCE", "0.9")),
+            rng=np.random.default_rng(session.game.state.seed),
+        )
+    return session.ai_policy
+
+def start_speculation(session: GameSession):
+    """On the human's turn, starts working out the next AI seat's turn in the background.
+
+    A speculation that is still current for that seat is kept; a stale one
+    is cancelled and replaced.
+    """
+    game = session.game
+    if not SPECULATE or game.state.phase == GamePhase.GAME_OVER:
+        return
+    if not game.state.players[game.state.current_player_index].is_human:
+        return
+    seat = next_ai_seat(game)
+    if seat is None:
+        return
+    current = session.speculation
+    if current is not None and current.seat == seat and current.is_current(game):
+        return
+    if session.speculation_job:
+        session.speculation_job.cancel()
+    speculation = session.speculation = Speculation(game, seat)
+    try:
+        session.speculation_job = speculation_jobs.submit(
+            session.game_id, lambda job: speculation.run(game, policy_for(session), job.check), timeout=AI_TURN_TIMEOUT)
+    except JobQueueFull:
+        session.speculation = None  # Purely an optimization; skip it under load
+
+def speculative_policy(session: GameSession):
+    """The policy for the current AI turn, answering from the speculation when it was made for this seat."""
+    policy = policy_for(session)
+    speculation, session.speculation = session.speculation, None
+    if speculation is None or speculation.seat != session.game.state.current_player_index:
+        return policy
+    # Whatever it has finished is used; it must not keep the policy busy during the turn
+    if session.speculation_job:
+        session.speculation_job.cancel()
+    return SpeculativePolicy(policy, session.game, speculation)
 
 @app.get("/")
 async def root():
     return {"message": "Clue Game API"}
 
+@app.get("/ready")
+async def ready(response: Response):
+    """503 until the AI backend is warm (or known to be unavailable); the first poll starts warming it."""
+    ai_backend.warm()
+    if ai_backend.status not in (READY, FAILED, DISABLED):
+        response.status_code = 503
+    return {"ai_backend": ai_backend.to_dict(), "startup_seconds": STARTUP_SECONDS}
+
+@app.get("/metrics")
+async def metrics():
+    """Request, turn-phase and model-call metrics in the Prometheus text format."""
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+def get_session(game_id: str) -> GameSession:
+    try:
+        session = sessions.get(game_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Game not found")
+    if not session.game.state:
+        raise HTTPException(status_code=400, detail="Game not started")
+    return session
+
+def get_game(game_id: str) -> ClueGame:
+    return get_session(game_id).game
+
+def selected_fields(fields: Optional[str]) -> Fields:
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@contextmanager
+def changing(session: GameSession, if_match: Optional[str], response: Response):
+    """Makes one request's changes to the game, alone; the response carries the resulting version as its ETag.
+
+    409 while an AI turn or another request is changing the game, 412 if
+    If-Match names a version the client has not caught up with.
+    """
+    try:
+        with session.exclusive(if_match) as game:
+            yield game
+            response.headers["ETag"] = etag(game.version)
+    except GameBusy:
+        raise HTTPException(status_code=409, detail="The game is being changed by another request, retry shortly")
+    except VersionMismatch:
+        raise HTTPException(status_code=412, detail="The game has changed since that version")
+
 @app.post("/game/start")
 async def start_game(config: GameConfig):
-    state = game.initialize_game(config.human_character)
-    return state
+    session = sessions.create()
+    session.game.log_spill_path = log_spill_path(session.game_id)
+    if event_store:
+        event_store.attach(session.game_id, session.game)
+    categories = None
+    if config.suspects or config.weapons:
+        categories = {
+            "suspect": config.suspects or SUSPECTS,
+            "weapon": config.weapons or WEAPONS,
+            "room": list(config.board) if config.board else ROOMS,
+        }
+    try:
+        state = session.game.initialize_game(
+            config.human_character,
+            num_ai_players=config.num_ai_players,
+            seed=config.seed,
+            categories=categories,
+            board=config.board or DEFAULT_BOARD,
+            hand_size=config.hand_size,
+        )
+    except ValueError as e:
+        sessions.remove(session.game_id)
+        raise HTTPException(status_code=400, detail=str(e))
+    state.game_id = session.game_id
+    session.feed.publish(state, session.game.log)
+    start_speculation(session)
+    return session.state_view()
 
-@app.get("/game/state")
-async def get_state():
-    if not game.state:
-        raise HTTPException(status_code=400, detail="Game not started")
-    return game.state
+@app.get("/game/{game_id}/state")
+async def get_state(game_id: str, fields: Optional[str] = None, if_none_match: Optional[str] = Header(None)):
+    """The game state as the human seat sees it, tagged with its version; 304 with no body if If-None-Match already names it.
 
-@app.post("/game/roll")
-async def roll_dice():
-    if not game.state:
-        raise HTTPException(status_code=400, detail="Game not started")
-    
-    roll = game.roll_dice()
-    current_player = game.state.players[game.state.current_player_index]
-    valid_moves = game.get_valid_moves(current_player.position, roll)
-    
-    game.state.available_moves = valid_moves
-    game.state.dice_rolled = True
-    game.state.dice_rolled = True
-    game.state.logs.append(f"{current_player.name} rolled a {roll}. Valid moves: {valid_moves}")
-    
-    if not valid_moves:
-        game.state.logs.append(f"{current_player.name} has no valid moves. Staying in {current_player.position}.")
-        game.state.phase = GamePhase.PLAYER_TURN_ACTION
-    
+    `fields` selects top-level fields, e.g. ?fields=phase,current_player_index,available_moves.
+    """
+    session = get_session(game_id)
+    selected = selected_fields(fields)
+    version = session.game.version
+    if etag_matches(if_none_match, version):
+        return Response(status_code=304, headers={"ETag": etag(version)})
+    # Served pre-serialized: every poll of an unchanged version reuses the same bytes
+    body = session.projections.body(session.game, session.viewer, selected)
+    return Response(body, media_type="application/json", headers={"ETag": etag(version)})
+
+@app.get("/game/{game_id}/logs")
+async def get_logs(game_id: str, after: int = 0, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=1000)):
+    game = get_game(game_id)
+    entries = game.log.read(after=after, limit=limit)
+    return {
+        "entries": entries,
+        "cursor": entries[-1].seq if entries else max(after, 0),
+        "first_seq": game.log.first_seq,
+        "last_seq": game.log.last_seq,
+    }
+
+@app.post("/game/{game_id}/roll")
+async def roll_dice(game_id: str, response: Response, if_match: Optional[str] = Header(None)):
+    session = get_session(game_id)
+    with changing(session, if_match, response) as game:
+        roll, valid_moves = game.roll_for_turn()
+        session.feed.publish(game.state, game.log)
+        start_speculation(session)
     return {"roll": roll, "valid_moves": valid_moves}
 
-@app.post("/game/move")
-async def move(request: MoveRequest):
-    if not game.state:
-        raise HTTPException(status_code=400, detail="Game not started")
-    
-    game.move_player(game.state.current_player_index, request.destination_room)
-    return game.state
+@app.post("/game/{game_id}/move")
+async def move(game_id: str, request: MoveRequest, response: Response, fields: Optional[str] = None,
+               if_match: Optional[str] = Header(None)):
+    session = get_session(game_id)
+    selected = selected_fields(fields)
+    with changing(session, if_match, response) as game:
+        game.move_player(game.state.current_player_index, request.destination_room)
+        session.feed.publish(game.state, game.log)
+        start_speculation(session)
+    return session.state_view(selected)
 
-@app.post("/game/suspect")
-async def suspect(request: SuspicionRequest):
-    if not game.state:
-        raise HTTPException(status_code=400, detail="Game not started")
-    
-    result = game.handle_suspicion(request.suspect, request.weapon, request.room, game.state.current_player_index)
-    game.next_turn() # End turn after suspicion (simplified flow)
-    return {"state": game.state, "result": result}
-
-@app.post("/game/accuse")
-async def accuse(request: AccusationRequest):
-    if not game.state:
-        raise HTTPException(status_code=400, detail="Game not started")
-    
-    success = game.handle_accusation(request.suspect, request.weapon, request.room, game.state.current_player_index)
-    if not success:
+@app.post("/game/{game_id}/suspect")
+async def suspect(game_id: str, request: SuspicionRequest, response: Response, fields: Optional[str] = None,
+                  if_match: Optional[str] = Header(None)):
+    session = get_session(game_id)
+    selected = selected_fields(fields)
+    with changing(session, if_match, response) as game:
+        # Checked before anything changes: a bad suspicion must not leave half a turn behind
+        try:
+            game.check_suspicion(request.suspect, request.weapon, request.room)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        position = game.state.players[game.state.current_player_index].position
+        if request.room != position:
+            raise HTTPException(status_code=400, detail=f"A suspicion must name the room you are in ({position})")
+        result = game.handle_suspicion(request.suspect, request.weapon, request.room, game.state.current_player_index)
+        game.next_turn() # End turn after suspicion (simplified flow)
+        session.feed.publish(game.state, game.log)
+    return {"state": session.state_view(selected), "result": result}
+
+@app.post("/game/{game_id}/accuse")
+async def accuse(game_id: str, request: AccusationRequest, response: Response, fields: Optional[str] = None,
+                 if_match: Optional[str] = Header(None)):
+    session = get_session(game_id)
+    selected = selected_fields(fields)
+    with changing(session, if_match, response) as game:
+        success = game.handle_accusation(request.suspect, request.weapon, request.room, game.state.current_player_index)
+        if not success:
+            game.next_turn()
+        session.feed.publish(game.state, game.log)
+        if game.state.phase == GamePhase.GAME_OVER:
+            release_ai(session)
+    return {"state": session.state_view(selected), "success": success}
+
+@app.post("/game/{game_id}/pass")
+async def pass_turn(game_id: str, response: Response, fields: Optional[str] = None,
+                    if_match: Optional[str] = Header(None)):
+    session = get_session(game_id)
+    selected = selected_fields(fields)
+    with changing(session, if_match, response) as game:
         game.next_turn()
-    return {"state": game.state, "success": success}
+        session.feed.publish(game.state, game.log)
+    return session.state_view(selected)
 
-@app.post("/game/pass")
-async def pass_turn():
-    if not game.state:
-        raise HTTPException(status_code=400, detail="Game not started")
-    
-    game.next_turn()
-    return game.state
+class JobSteps:
+    """Makes an AI job's changes to the game one step at a time, under the game's lock.
 
-@app.post("/game/ai-turn")
-async def play_ai_turn():
-    if not game.state:
-        raise HTTPException(status_code=400, detail="Game not started")
-    
+    Decisions, and the model calls behind them, happen between steps without
+    the lock, so a hung model call never holds up the table. Each step first
+    re-checks that the job still owns the game: it has not been cancelled or
+    timed out, and nothing else has changed the game since its last step.
+    """
+
+    def __init__(self, game: ClueGame, job: Job):
+        self.game = game
+        self.job = job
+        self.version = game.version
+
+    def owns_game(self) -> bool:
+        return self.game.version == self.version
+
+    @contextmanager
+    def __call__(self):
+        with self.game.lock:
+            self.job.check()
+            if not self.owns_game():
+                raise JobCancelled()
+            yield
+            self.version = self.game.version
+
+def run_ai_turn(session: GameSession, job: Job, planned: Optional[dict] = None, steps: Optional[JobSteps] = None):
+    """Plays one full AI turn and returns a summary of it. Runs on the job pool, never on the event loop."""
+    game = session.game
+    steps = steps or JobSteps(game, job)
     current_player = game.state.players[game.state.current_player_index]
-    if current_player.is_human:
-        raise HTTPException(status_code=400, detail="It is the human player's turn")
-    
-    # 1. Roll Dice
-    roll = game.roll_dice()
-    valid_moves = game.get_valid_moves(current_player.position, roll)
-    game.state.logs.append(f"{current_player.name} rolled a {roll}.")
-    
-    # 2. Decide Move
-    if valid_moves:
-    # 2. Decide Move
-    if valid_moves:
-        if ai_interface:
-            destination = ai_interface.decide_move(current_player, valid_moves, game.state)
-        else:
-            import random
-            destination = random.choice(valid_moves)
-            print("AI Interface not available, falling back to random move")
-        
-        game.move_player(game.state.current_player_index, destination)
-    else:
-        game.state.logs.append(f"{current_player.name} has no valid moves.")
-        game.next_turn()
-        return game.state
-
-    # 3. Decide Action (Suspect)
-    # AI will always try to suspect if in a room
-    # (Simplified: AI doesn't Accuse yet to avoid early game over)
-    # (Simplified: AI doesn't Accuse yet to avoid early game over)
-    if ai_interface:
-        suspicion = ai_interface.decide_suspicion(
-            current_player, 
-            current_player.position, 
-            game.state, 
-            SUSPECTS, 
-            WEAPONS
-        )
-    else:
-        # Fallback random suspicion
-        import random
-        suspicion = {
-            "suspect": random.choice(SUSPECTS),
-            "weapon": random.choice(WEAPONS),
-            "room": current_player.position
-        }
-    
-    result = game.handle_suspicion(
-        suspicion["suspect"], 
-        suspicion["weapon"], 
-        suspicion["room"], 
-        game.state.current_player_index
-    )
-    
-    
-    # 3.b Update AI Notebook based on suspicion result
-    if result["has_card"]:
-        # The game logic already updates 'seen_cards' and 'notebook' for the player 
-        # inside handle_suspicion if a card is shown.
+    try:
+        return play_turn(game, speculative_policy(session), job.check, lambda: session.feed.publish(game.state, game.log),
+                         planned, steps)
+    except JobCancelled:
+        # Never leave the table stuck halfway through an AI turn:
+        # once we have moved, the rest of the turn is forfeited,
+        # unless someone else has already carried on from there.
+        with game.lock:
+            if (steps.owns_game() and game.state.phase == GamePhase.PLAYER_TURN_ACTION
+                    and game.state.players[game.state.current_player_index] is current_player):
+                game.add_log(f"{current_player.name} ran out of time.")
+                game.next_turn()
+        raise
+    finally:
+        session.feed.publish(game.state, game.log)
+        if game.state.phase == GamePhase.GAME_OVER:
+            release_ai(session)
+        start_speculation(session)
+
+def run_ai_round(session: GameSession, job: Job):
+    """Plays AI turns until it is a human's turn, the game ends, or a full round has been played."""
+    game = session.game
+    steps = JobSteps(game, job)
+    seats = upcoming_ai_seats(game)
+    planned = plan_moves(game, seats, policy_for(session), steps)
+    turns = []
+    for index in seats:
+        if game.state.phase == GamePhase.GAME_OVER or game.state.current_player_index != index:
+            break
+        turns.append(run_ai_turn(session, job, planned.get(index), steps))
+    return {"turns": turns}
+
+def submit_ai_job(session: GameSession, fn, response: Response, if_match: Optional[str] = None, turns: int = 1) -> dict:
+    if session.ai_job and not session.ai_job.expire().finished:
+        # Double-submits (e.g. a double click) join the job already in flight
+        return session.ai_job.to_dict()
+
+    # The job makes the changes; holding the game here only makes the checks and the submit atomic
+    with changing(session, if_match, response) as game:
+        current_player = game.state.players[game.state.current_player_index]
+        if current_player.is_human:
+            raise HTTPException(status_code=400, detail="It is the human player's turn")
+        if game.state.phase == GamePhase.GAME_OVER:
+            raise HTTPException(status_code=400, detail="Game is over")
+
+        try:
+            session.ai_job = ai_jobs.submit(session.game_id, fn, timeout=AI_TURN_TIMEOUT * turns)
+        except JobQueueFull:
+            raise HTTPException(status_code=503, detail="Too many AI turns in progress, retry shortly")
+    return session.ai_job.to_dict()
+
+@app.post("/game/{game_id}/ai-turn", status_code=202)
+async def play_ai_turn(game_id: str, response: Response, if_match: Optional[str] = Header(None)):
+    session = get_session(game_id)
+    return submit_ai_job(session, lambda job: run_ai_turn(session, job), response, if_match)
+
+@app.post("/game/{game_id}/ai-run", status_code=202)
+async def play_ai_round(game_id: str, response: Response, if_match: Optional[str] = Header(None)):
+    """Plays every consecutive AI turn up to the human's turn as one job.
+
+    Poll it at /game/{game_id}/ai-turn/{job_id}; the result lists every turn played.
+    """
+    session = get_session(game_id)
+    turns = len(upcoming_ai_seats(session.game)) or 1
+    return submit_ai_job(session, lambda job: run_ai_round(session, job), response, if_match, turns)
+
+def get_job(game_id: str, job_id: str) -> Job:
+    get_game(game_id)
+    try:
+        job = ai_jobs.get(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.game_id != game_id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@app.get("/game/{game_id}/ai-turn/{job_id}")
+async def get_ai_turn(game_id: str, job_id: str, fields: Optional[str] = None):
+    selected = selected_fields(fields)
+    job = get_job(game_id, job_id)
+    response = job.to_dict()
+    if job.finished:
+        response["state"] = get_session(game_id).state_view(selected)
+        response["result"] = job.result
+    return response
+
+@app.delete("/game/{game_id}/ai-turn/{job_id}")
+async def cancel_ai_turn(game_id: str, job_id: str):
+    job = get_job(game_id, job_id)
+    job.cancel()
+    return job.to_dict()
+
+@app.websocket("/game/{game_id}/ws")
+async def game_feed(websocket: WebSocket, game_id: str, since: Optional[int] = None):
+    """Pushes versioned GameState deltas for one game.
+
+    Clients send `since=<last version seen>` when reconnecting. If the gap is
+    still in the delta history they get only the missing deltas, otherwise a
+    full snapshot. Messages with a version the client already has can be ignored.
+    """
+    try:
+        session = sessions.get(game_id)
+    except KeyError:
+        await websocket.close(code=4404)
+        return
+    await websocket.accept()
+    subscriber = session.feed.subscribe()
+    try:
+        for message in session.feed.catch_up(since):
+            await websocket.send_json(message)
+        while True:
+            message = await subscriber.queue.get()
+            if message is None:
+                await websocket.close(code=4410)
+                return
+            await websocket.send_json(message)
+    except WebSocketDisconnect:
         pass
-    else:
-        # If no one could disprove, that's huge info!
-        # It means the suspect, weapon, and room (that are not in my hand) are likely the answer.
-        pass 
-        # For now, simplistic notebook update is handled in game_logic, 
-        # but complex deduction on 'pass' (no one showed) is implicit in 'unknowns' staying unknown.
-
-    # 4. Decide Action (Accuse)
-    # Now check if AI wants to accuse based on new info
-    # 4. Decide Action (Accuse)
-    # Now check if AI wants to accuse based on new info
-    accusation = None
-    if ai_interface:
-        accusation = ai_interface.decide_accusation(current_player, game.state)
-    
-    if accusation:
-        game.handle_accusation(
-            accusation["suspect"],
-            accusation["weapon"],
-            accusation["room"],
-            game.state.current_player_index
-        )
-        # Handle Accusation will either win (Game Over) or eliminate player
-        # If eliminated, turn ends. If win, state updates to Game Over.
-        
-    if game.state.phase != GamePhase.GAME_OVER:
-        game.next_turn()
-    
-    return game.state
+    finally:
+        session.feed.unsubscribe(subscriber)
 
 @app.get("/game/constants")
 async def get_constants():
+    """Cards of games started without a variant: the standard ones, on CLUE_BOARD_FILE's rooms if set."""
     return {
-        "rooms": ROOMS,
+        "rooms": DEFAULT_BOARD.rooms if DEFAULT_BOARD is not None else ROOMS,
         "weapons": WEAPONS,
         "suspects": SUSPECTS
     }
 
+@app.get("/game/{game_id}/constants")
+async def get_game_constants(game_id: str):
+    """Cards and board of this game, which may be a variant of the standard one."""
+    game = get_game(game_id)
+    return {
+        "rooms": game.deck.categories["room"],
+        "weapons": game.deck.categories["weapon"],
+        "suspects": game.deck.categories["suspect"],
+        "board": game.board.graph,
+    }
+
+# Time from the first line of this module until the app is ready to serve
+STARTUP_SECONDS = time.perf_counter() - _import_started
+STARTUP_BUDGET = float(os.getenv("CLUE_STARTUP_BUDGET", "2.0"))
+print(f"Server ready in {STARTUP_SECONDS:.2f}s", flush=True)
+if STARTUP_SECONDS > STARTUP_BUDGET:
+    print(f"WARNING: startup took {STARTUP_SECONDS:.2f}s, over the {STARTUP_BUDGET:.2f}s budget", flush=True)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("src.clue.server:app", host="0.0.0.0", port=8001, reload=True)
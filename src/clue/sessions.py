@@ -0,0 +1,185 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+
+from src.clue.game_logic import ClueGame
+from src.clue.projections import Fields, ProjectionCache, human_seat, project
+from src.clue.realtime import StateFeed
+
+# Defaults sized so one process can host thousands of tables.
+# A finished ClueGame is only a few KB, so the cap is about bounding
+# worst-case memory rather than the common case.
+DEFAULT_MAX_SESSIONS = 10000
+DEFAULT_IDLE_TTL_SECONDS = 60 * 60
+# How long a request waits out someone else's hold on the game lock before
+# answering 409. Readers (speculation, an AI turn between its steps) only
+# hold it for a moment; a change in progress holds it far longer.
+LOCK_WAIT_SECONDS = 0.05
+
+
+class GameBusy(Exception):
+    """An AI turn or another request is changing the game."""
+
+
+class VersionMismatch(Exception):
+    """The client's If-Match names a version the game has moved past."""
+
+
+def etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def etag_matches(header: Optional[str], version: int) -> bool:
+    """Whether an If-Match / If-None-Match header names this state version ("*" names any)."""
+    if header is None:
+        return False
+    tag = etag(version)
+    for part in header.split(","):
+        part = part.strip()
+        if part == "*" or part.removeprefix("W/") == tag:
+            return True
+    return False
+
+
+class GameSession:
+    """A single table: the game itself plus bookkeeping for the registry."""
+
+    def __init__(self, game_id: str, game: ClueGame):
+        self.game_id = game_id
+        self.game = game
+        self.created_at = time.monotonic()
+        self.last_access = self.created_at
+        self.ai_job = None  # In-flight AI turn, if any (see jobs.py)
+        # The frontend plays the human seat, so that is all it is sent (see projections.py)
+        self.feed = StateFeed(projection=lambda state: project(state, human_seat(state)))
+        self.projections = ProjectionCache()
+        self.ai_policy = None  # Per-table model-free policy, created on first use by the server
+        self.speculation = None  # Next AI seat's turn worked out during the human's (see speculation.py)
+        self.speculation_job = None
+
+    def touch(self):
+        self.last_access = time.monotonic()
+
+    @property
+    def viewer(self) -> Optional[int]:
+        """The seat the frontend plays: the only one whose hand and notebook it is sent."""
+        for index, player in enumerate(self.game.state.players):
+            if player.is_human:
+                return index
+        return None
+
+    def state_view(self, fields: Fields = None) -> dict:
+        """The game state as the viewer may see it, cut down to `fields` (see projections.py)."""
+        return self.projections.get(self.game, self.viewer, fields)
+
+    @contextmanager
+    def exclusive(self, if_match: Optional[str] = None):
+        """Holds the game for one request's changes, so they never interleave with another's.
+
+        Fails fast instead of queueing: raises GameBusy while an AI turn or
+        another request holds the game (brief holds by readers are waited
+        out, see LOCK_WAIT_SECONDS), and VersionMismatch if `if_match`
+        (an If-Match header) names a version the game has moved past.
+        """
+        game = self.game
+        if not game.lock.acquire(timeout=LOCK_WAIT_SECONDS):
+            raise GameBusy()
+        try:
+            if self.ai_job is not None and not self.ai_job.expire().finished:
+                raise GameBusy()
+            if if_match is not None and not etag_matches(if_match, game.version):
+                raise VersionMismatch()
+            yield game
+        finally:
+            game.lock.release()
+
+
+class SessionRegistry:
+    """Maps game ids to live games with LRU + idle-TTL eviction.
+
+    Sessions are kept in an OrderedDict ordered by last access, so both
+    LRU eviction and the TTL sweep only ever look at the oldest entries.
+    All operations are O(1) amortized regardless of the number of live games.
+    """
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS, idle_ttl: float = DEFAULT_IDLE_TTL_SECONDS):
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self._sessions: "OrderedDict[str, GameSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._evict_listeners: List[Callable[[GameSession], None]] = []
+
+    def on_evict(self, listener: Callable[[GameSession], None]):
+        """Register a callback invoked (outside the lock) for every evicted session."""
+        self._evict_listeners.append(listener)
+
+    def create(self, game: Optional[ClueGame] = None, game_id: Optional[str] = None) -> GameSession:
+        """Registers a new table. `game_id` is only passed when restoring a stored game."""
+        session = GameSession(game_id or uuid.uuid4().hex, game or ClueGame())
+        with self._lock:
+            self._sessions[session.game_id] = session
+            evicted = self._expire_locked(session.last_access)
+            while len(self._sessions) > self.max_sessions:
+                _, oldest = self._sessions.popitem(last=False)
+                evicted.append(oldest)
+        self._notify(evicted)
+        return session
+
+    def get(self, game_id: str) -> GameSession:
+        """Return the session and mark it as recently used. Raises KeyError if unknown or expired."""
+        now = time.monotonic()
+        with self._lock:
+            session = self._sessions.get(game_id)
+            if session is None:
+                raise KeyError(game_id)
+            if now - session.last_access > self.idle_ttl:
+                del self._sessions[game_id]
+                evicted = [session]
+                session = None
+            else:
+                session.last_access = now
+                self._sessions.move_to_end(game_id)
+                evicted = []
+        if session is None:
+            self._notify(evicted)
+            raise KeyError(game_id)
+        return session
+
+    def remove(self, game_id: str) -> bool:
+        with self._lock:
+            session = self._sessions.pop(game_id, None)
+        if session is None:
+            return False
+        self._notify([session])
+        return True
+
+    def sweep(self) -> int:
+        """Drop every session idle for longer than the TTL. Returns the number evicted."""
+        with self._lock:
+            evicted = self._expire_locked(time.monotonic())
+        self._notify(evicted)
+        return len(evicted)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, game_id: str):
+        return game_id in self._sessions
+
+    def _expire_locked(self, now: float) -> List[GameSession]:
+        evicted = []
+        while self._sessions:
+            game_id, oldest = next(iter(self._sessions.items()))
+            if now - oldest.last_access <= self.idle_ttl:
+                break
+            del self._sessions[game_id]
+            evicted.append(oldest)
+        return evicted
+
+    def _notify(self, evicted: List[GameSession]):
+        for session in evicted:
+            for listener in self._evict_listeners:
+                listener(session)
@@ -0,0 +1,134 @@
+"""Headless AI-vs-AI self-play.
+
+Plays full games without the API server or a human seat, fanning them out
+over a process pool, and reports throughput, game length and win rates per
+policy:
+
+    python -m src.clue.simulate --games 500 --policies heuristic,random --workers 8
+
+Model-backed seats ("cached-llm") share one decision cache per worker
+process; with --cache-path it is also kept on disk across runs.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.clue.board import Board
+from src.clue.decision_cache import DecisionCache
+from src.clue.game_logic import ClueGame
+from src.clue.models import GamePhase
+from src.clue.policies import POLICY_NAMES, make_policy
+from src.clue.turns import play_turn
+
+NUM_SEATS = 4
+DEFAULT_MAX_TURNS = 400
+
+# Per worker process: cache path -> the DecisionCache every cached-llm seat it plays shares
+_decision_caches: Dict[Optional[str], DecisionCache] = {}
+
+
+def worker_decision_cache(path: Optional[str] = None) -> DecisionCache:
+    cache = _decision_caches.get(path)
+    if cache is None:
+        cache = _decision_caches[path] = DecisionCache(path=path)
+    return cache
+
+
+def play_game(seed: int, seat_policies: Sequence[str], max_turns: int = DEFAULT_MAX_TURNS,
+              board_file: Optional[str] = None, cache_path: Optional[str] = None) -> Dict:
+    """Plays one all-AI game. Returns the winning seat's policy (None for a draw) and the turn count."""
+    game = ClueGame()
+    board = Board.load(board_file) if board_file else None  # Cached per process after the first game
+    game.initialize_game(None, num_ai_players=len(seat_policies), seed=seed, board=board)
+    policies = [
+        make_policy(name, seed=seed * 100 + seat,
+                    **({"decision_cache": worker_decision_cache(cache_path)} if name == "cached-llm" else {}))
+        for seat, name in enumerate(seat_policies)
+    ]
+
+    turns = 0
+    while game.state.phase != GamePhase.GAME_OVER and turns < max_turns:
+        play_turn(game, policies[game.state.current_player_index])
+        turns += 1
+
+    winner = None
+    if game.state.winner:
+        names = [p.name for p in game.state.players]
+        winner = seat_policies[names.index(game.state.winner)]
+    return {"seed": seed, "winner": winner, "turns": turns}
+
+
+def _play_batch(args) -> List[Dict]:
+    seeds, seat_policies_by_game, max_turns, board_file, cache_path = args
+    return [play_game(seed, policies, max_turns, board_file, cache_path)
+            for seed, policies in zip(seeds, seat_policies_by_game)]
+
+
+def simulate(num_games: int, policies: Sequence[str], workers: Optional[int] = None, seed: int = 0,
+             max_turns: int = DEFAULT_MAX_TURNS, chunk_size: int = 16, board_file: Optional[str] = None,
+             cache_path: Optional[str] = None) -> Dict:
+    """Plays `num_games` games across a process pool.
+
+    Seats are filled by cycling through `policies`, rotated by one seat each
+    game so no policy always moves first.
+    """
+    seat_policies = [[policies[(game + seat) % len(policies)] for seat in range(NUM_SEATS)] for game in range(num_games)]
+    seeds = [seed + game for game in range(num_games)]
+    batches = [
+        (seeds[i:i + chunk_size], seat_policies[i:i + chunk_size], max_turns, board_file, cache_path)
+        for i in range(0, num_games, chunk_size)
+    ]
+
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for batch in pool.map(_play_batch, batches):
+            results.extend(batch)
+    elapsed = time.perf_counter() - start
+
+    seats = Counter(name for game in seat_policies for name in game)
+    wins = Counter(r["winner"] for r in results if r["winner"])
+    turns = [r["turns"] for r in results]
+    return {
+        "games": num_games,
+        "seconds": elapsed,
+        "games_per_second": num_games / elapsed if elapsed else 0.0,
+        "mean_turns": statistics.mean(turns),
+        "median_turns": statistics.median(turns),
+        "draws": sum(1 for r in results if r["winner"] is None),
+        # Share of a policy's seats that won, so uneven seat counts compare fairly
+        "win_rate": {name: wins[name] / seats[name] for name in seats},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Clue self-play")
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--policies", default="heuristic,random",
+                        help=f"Comma separated, cycled over the {NUM_SEATS} seats. Choices: {', '.join(POLICY_NAMES)}")
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: one per core)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS)
+    parser.add_argument("--board", default=None, help="JSON board file (default: the standard board)")
+    parser.add_argument("--cache-path", default=None,
+                        help="SQLite file of cached-llm decisions, reused across games and runs (default: in memory, per worker)")
+    args = parser.parse_args()
+
+    policies = [p.strip() for p in args.policies.split(",") if p.strip()]
+    report = simulate(args.games, policies, args.workers, args.seed, args.max_turns, board_file=args.board,
+                      cache_path=args.cache_path)
+    print(f"{report['games']} games in {report['seconds']:.2f}s ({report['games_per_second']:.1f} games/s)")
+    print(f"turns: mean {report['mean_turns']:.1f}, median {report['median_turns']}, draws {report['draws']}")
+    for name, rate in sorted(report["win_rate"].items()):
+        print(f"  {name:>10}: {rate:.1%} of seats won")
+
+
+if __name__ == "__main__":
+    main()
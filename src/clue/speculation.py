@@ -0,0 +1,163 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.clue.board import MAX_ROLL
+from src.clue.deduction import Deduction
+from src.clue.game_logic import ClueGame
+from src.clue.metrics import SPECULATIONS
+from src.clue.models import GamePhase
+
+# Work done for the next AI seat while the human is still deciding.
+#
+# Everything an AI seat decides on its turn depends on two inputs: where it
+# stands and what it knows (its Deduction). Neither changes while the human
+# rolls and moves, so the seat's valid moves for every roll, its move for
+# each of those and its suspicion in each room it would move to can be
+# worked out ahead. A Speculation records the inputs it was computed from
+# and is only used while they are unchanged; if the human's suspicion drags
+# the seat to another room or teaches it something, it is thrown away.
+#
+# Only decisions a policy lists in `speculative_decisions` are worked out:
+# ones that need no model call and depend on nothing but the seat's position
+# and knowledge (no rng, no clock). Model calls would mostly be wasted and
+# compete with real turns for the LLM pool, and anything else could come out
+# differently ahead of time, so seeded games would depend on timing. For
+# everything else only the valid moves are worked out.
+
+# Rolls in order of likelihood (2d6), so the most useful work is done first
+ROLLS_BY_LIKELIHOOD = sorted(range(2, MAX_ROLL + 1), key=lambda roll: abs(roll - 7))
+
+
+def _noop():
+    pass
+
+
+class _SeatTurn:
+    """The game state as the seat will see it on its own turn: policies read the current player from it."""
+
+    def __init__(self, state, seat: int):
+        self._state = state
+        self.current_player_index = seat
+
+    def __getattr__(self, name):
+        return getattr(self._state, name)
+
+
+class Speculation:
+    """One AI seat's decisions, worked out ahead of its turn."""
+
+    def __init__(self, game: ClueGame, seat: int):
+        self.seat = seat
+        # A copy of what the seat knows, taken between changes: run() must not read it while they happen
+        with game.lock:
+            knowledge = game.deductions[seat]
+            self.state_version = game.version
+            self.position = game.state.players[seat].position
+            self.knowledge_version = knowledge.version
+            self.knowledge = Deduction.from_dict(game.deck.categories, knowledge.to_dict())
+        self.valid_moves: Dict[int, List[str]] = {}            # roll -> rooms reachable
+        self.destinations: Dict[Tuple[str, ...], str] = {}     # valid moves -> chosen room
+        self.suspicions: Dict[str, Dict[str, str]] = {}        # room -> suspicion made there
+        self.complete = False
+
+    def run(self, game: ClueGame, policy, check: Callable[[], None] = _noop) -> "Speculation":
+        """Works out the seat's next turn as far as it can be known now.
+
+        Results are stored as they are found, so whatever was finished before
+        `check` aborts the run (or the seat's turn comes) can still be used.
+        Never changes the game, and decides from its own copy of the seat's knowledge.
+        """
+        decisions = getattr(policy, "speculative_decisions", ())
+        player = game.state.players[self.seat]
+        knowledge = self.knowledge
+        view = _SeatTurn(game.state, self.seat)
+        for roll in ROLLS_BY_LIKELIHOOD:
+            self.valid_moves[roll] = game.get_valid_moves(self.position, roll)
+
+        rooms = []  # Where the seat may suspect, most likely first
+        for roll in ROLLS_BY_LIKELIHOOD:
+            options = tuple(self.valid_moves[roll])
+            if not options or options in self.destinations:
+                continue
+            if "move" in decisions:
+                check()
+                destination = policy.decide_move(player, list(options), view, knowledge, game.planner)
+                self.destinations[options] = destination
+                rooms.append(destination)
+            else:
+                rooms.extend(options)
+
+        if "suspicion" in decisions:
+            for room in dict.fromkeys(rooms):
+                check()
+                self.suspicions[room] = policy.decide_suspicion(
+                    player, room, view, game.deck.categories["suspect"], game.deck.categories["weapon"], knowledge)
+        self.complete = True
+        return self
+
+    def knows_the_same(self, game: ClueGame) -> bool:
+        """Whether the seat knows what it knew. Enough for suspicions, which are keyed by room."""
+        return game.deductions[self.seat].version == self.knowledge_version and game.state.phase != GamePhase.GAME_OVER
+
+    def is_current(self, game: ClueGame) -> bool:
+        """Whether the seat also still stands where it did, as its moves require."""
+        return game.state.players[self.seat].position == self.position and self.knows_the_same(game)
+
+
+def next_ai_seat(game: ClueGame) -> Optional[int]:
+    """The first active AI seat after the current player, if any."""
+    players = game.state.players
+    for step in range(1, len(players)):
+        index = (game.state.current_player_index + step) % len(players)
+        if not players[index].is_human and not players[index].is_eliminated:
+            return index
+    return None
+
+
+class SpeculativePolicy:
+    """Wraps a policy, answering from a Speculation where it covers the question.
+
+    Anything the speculation does not cover, or everything once it is no
+    longer current, goes to the wrapped policy.
+    """
+
+    def __init__(self, policy, game: ClueGame, speculation: Speculation):
+        self.policy = policy
+        self.game = game
+        self.speculation = speculation
+
+    @property
+    def batches_moves(self) -> bool:
+        return self.policy.batches_moves
+
+    def _lookup(self, player, decision: str, table: dict, key, current: Callable[[ClueGame], bool]):
+        """The speculated answer, or None; counts hits, misses and stale speculations."""
+        speculation = self.speculation
+        if self.game.state.players[speculation.seat] is not player:
+            return None
+        if not current(self.game):
+            SPECULATIONS.inc(decision=decision, outcome="stale")
+            return None
+        answer = table.get(key)
+        SPECULATIONS.inc(decision=decision, outcome="miss" if answer is None else "hit")
+        return answer
+
+    def decide_move(self, player, valid_moves, game_state, knowledge=None, planner=None):
+        destination = self._lookup(player, "move", self.speculation.destinations, tuple(valid_moves),
+                                   self.speculation.is_current)
+        if destination is not None:
+            return destination
+        return self.policy.decide_move(player, valid_moves, game_state, knowledge, planner)
+
+    def decide_moves(self, requests, game_state):
+        return self.policy.decide_moves(requests, game_state)
+
+    def decide_suspicion(self, player, current_room, game_state, all_suspects, all_weapons, knowledge=None):
+        suspicion = self._lookup(player, "suspicion", self.speculation.suspicions, current_room,
+                                 self.speculation.knows_the_same)
+        if suspicion is not None:
+            return dict(suspicion)
+        return self.policy.decide_suspicion(player, current_room, game_state, all_suspects, all_weapons, knowledge)
+
+    def decide_accusation(self, player, game_state, knowledge=None):
+        # Depends on what this turn's suspicion reveals, so never speculated
+        return self.policy.decide_accusation(player, game_state, knowledge)
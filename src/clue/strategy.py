@@ -0,0 +1,144 @@
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.clue.deduction import Deduction, _bits
+from src.clue.probability import SolutionEstimator, solution_probabilities
+
+# Consistent deals used to score suspicions. A hundred or so worlds
+# already ranks the 36 (suspect, weapon) pairs of a room reliably.
+DEFAULT_WORLDS = 128
+DEFAULT_TIME_BUDGET = 0.001  # seconds spent sampling worlds
+# Small batches so the time budget is honoured at sub-millisecond granularity
+SAMPLE_BATCH = 512
+
+# Minimum estimated probability of a solution before accusing it
+DEFAULT_ACCUSATION_CONFIDENCE = 0.9
+# Above this many candidate solutions no single one gets near any sensible
+# confidence, so we skip the Monte Carlo estimate altogether.
+MAX_ESTIMATED_COMBINATIONS = 8
+
+_NO_SHOW = 1 << 30
+
+
+def _expected_entropy(counts: np.ndarray, total: float) -> np.ndarray:
+    """counts[pair, outcome, solution] -> expected posterior solution entropy per pair (bits)."""
+    per_outcome = counts.sum(axis=2, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        conditional = np.where(counts > 0, counts / per_outcome, 1.0)
+        return -(counts * np.log2(conditional)).sum(axis=(1, 2)) / total
+
+
+def choose_suspicion(knowledge: Deduction, suspector: int, room: str,
+                     rng: Optional[np.random.Generator] = None,
+                     worlds: int = DEFAULT_WORLDS, time_budget: float = DEFAULT_TIME_BUDGET) -> Dict[str, str]:
+    """Picks the (suspect, weapon) pair for `room` with the largest expected information gain.
+
+    Each sampled world fixes who holds every card, so a suspicion's outcome
+    there is the first player after the suspector holding one of the three
+    cards, plus which card they show (uniform over their matches). Passes are
+    implied by who showed. We score every pair by the expected entropy of the
+    solution after seeing that outcome and pick the lowest.
+    """
+    rng = rng or np.random.default_rng()
+    suspects = list(_bits(knowledge.category_masks["suspect"]))
+    weapons = list(_bits(knowledge.category_masks["weapon"]))
+    room_index = knowledge.index[room]
+
+    owners = SolutionEstimator(knowledge).sample_worlds(rng, worlds, time_budget, batch=SAMPLE_BATCH)
+    if len(owners) == 0:
+        return _fallback(knowledge, suspector, suspects, weapons, room)
+
+    # pairs[p] = (suspect, weapon, room) card indices
+    pairs = np.array([(s, w, room_index) for s in suspects for w in weapons], dtype=np.int64)
+    holders = owners[:, pairs]  # [world, pair, 3]
+
+    # Response order: players after the suspector; everyone else never shows
+    rank = np.full(len(knowledge.sizes), _NO_SHOW, dtype=np.int64)
+    for step in range(1, knowledge.num_players):
+        rank[(suspector + step) % knowledge.num_players] = step
+    ranks = rank[holders]
+    first = ranks.min(axis=2, keepdims=True)
+    shown = (ranks == first) & (first < _NO_SHOW)
+    num_shown = shown.sum(axis=2)
+
+    # Outcome 0 = nobody showed, otherwise 1 + card slot + 3 * shower
+    num_outcomes = 1 + 3 * len(knowledge.sizes)
+    outcome_shown = 1 + np.arange(3)[None, None, :] + 3 * holders
+    weights_shown = np.where(shown, 1.0 / np.maximum(num_shown, 1)[..., None], 0.0)
+    weights_none = (num_shown == 0).astype(float)
+
+    solution_ids, num_solutions = _solution_ids(owners, knowledge.solution)
+
+    num_pairs = len(pairs)
+    pair_ids = np.arange(num_pairs)[None, :]
+    base = (pair_ids * num_outcomes) * num_solutions + solution_ids[:, None]  # [world, pair]
+    index = np.concatenate([
+        base.reshape(-1),
+        (base[..., None] + outcome_shown * num_solutions).reshape(-1),
+    ])
+    weights = np.concatenate([weights_none.reshape(-1), weights_shown.reshape(-1)])
+    counts = np.bincount(index, weights=weights, minlength=num_pairs * num_outcomes * num_solutions)
+    counts = counts.reshape(num_pairs, num_outcomes, num_solutions)
+
+    scores = _expected_entropy(counts, float(len(owners)))
+    best = int(np.argmin(scores))
+    suspect, weapon, _ = pairs[best]
+    return {"suspect": knowledge.cards[suspect], "weapon": knowledge.cards[weapon], "room": room}
+
+
+def _solution_ids(owners: np.ndarray, solution: int):
+    """Numbers each world's solution 0..n-1 (worlds with the same solution share one), and returns n.
+
+    Worlds are compared by which cards they put in the solution, packed into
+    bytes, so decks of any size are told apart.
+    """
+    in_solution = np.packbits(owners == solution, axis=1)
+    _, solution_ids = np.unique(in_solution, axis=0, return_inverse=True)
+    solution_ids = solution_ids.reshape(-1)
+    return solution_ids, int(solution_ids.max()) + 1
+
+
+def _fallback(knowledge: Deduction, suspector: int, suspects, weapons, room: str) -> Dict[str, str]:
+    """No worlds to score against: ask about cards we do not hold, preferring solution candidates."""
+    solution = knowledge.maybe[knowledge.solution]
+    own = knowledge.has[suspector]
+
+    def preference(card: int):
+        return (not solution >> card & 1, own >> card & 1)
+
+    suspect = min(suspects, key=preference)
+    weapon = min(weapons, key=preference)
+    return {"suspect": knowledge.cards[suspect], "weapon": knowledge.cards[weapon], "room": room}
+
+
+def choose_accusation(knowledge: Deduction, confidence: float = DEFAULT_ACCUSATION_CONFIDENCE,
+                      rng: Optional[np.random.Generator] = None) -> Optional[Dict[str, str]]:
+    """Accuses when the solution is certain, likely enough, or as good as it will ever get.
+
+    Cards in the undealt pile are never shown, so some ambiguity between them
+    and the solution can be permanent. Once every card not yet placed can only
+    be in the solution or the undealt pile, no suspicion can teach us anything
+    more and we accuse the most likely solution instead of waiting forever.
+    """
+    candidates = [knowledge.candidates(category) for category in ("suspect", "weapon", "room")]
+    combinations = len(candidates[0]) * len(candidates[1]) * len(candidates[2])
+    if combinations == 1:
+        return dict(zip(("suspect", "weapon", "room"), (c[0] for c in candidates)))
+
+    exhausted = _nothing_left_to_learn(knowledge)
+    if not exhausted and (confidence >= 1.0 or combinations > MAX_ESTIMATED_COMBINATIONS):
+        return None
+    solution, probability = solution_probabilities(knowledge, rng).best()
+    if not solution or (probability < confidence and not exhausted):
+        return None
+    return dict(zip(("suspect", "weapon", "room"), solution))
+
+
+def _nothing_left_to_learn(knowledge: Deduction) -> bool:
+    hidden = knowledge.maybe[knowledge.solution] | knowledge.maybe[knowledge.undealt]
+    for player in range(knowledge.num_players):
+        # Some player might still hold an unplaced card we could ask about
+        if knowledge.maybe[player] & ~knowledge.has[player] & hidden:
+            return False
+    return True
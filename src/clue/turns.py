@@ -0,0 +1,181 @@
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, List, Optional
+
+from src.clue.game_logic import ClueGame
+from src.clue.metrics import TURN_PHASE_SECONDS
+from src.clue.models import GamePhase
+
+# The AI turn loop, shared by the API server and headless self-play.
+# `policy` is anything with ClueAI's decide_* methods (see policies.py).
+
+
+def _noop():
+    pass
+
+
+def play_turn(game: ClueGame, policy, check: Callable[[], None] = _noop,
+              on_move: Callable[[], None] = _noop, planned: Optional[dict] = None,
+              step: Callable[[], ContextManager] = nullcontext) -> dict:
+    """Plays the current seat's full turn and returns a summary of it.
+
+    `check` is called before every state mutation so callers can abort a
+    turn (e.g. on timeout); `on_move` fires right after the move is applied.
+    Every group of mutations runs inside `step()` and every decision outside
+    it, so a caller can hold a lock for the changes without holding it
+    through a slow policy.
+
+    A turn an abandoned job left halfway is resumed from the game's phase,
+    never replayed: a seat that already rolled keeps its roll, and one that
+    already moved goes on to its accusation (it may have suspected already).
+    """
+    current_player = game.state.players[game.state.current_player_index]
+    summary = {"player": current_player.name}
+    if game.state.phase == GamePhase.GAME_OVER:
+        return summary
+    knowledge = game.deductions[game.state.current_player_index]
+    if game.state.phase == GamePhase.PLAYER_TURN_ACTION:
+        summary["resumed"] = True
+        return _finish_turn(game, policy, current_player, knowledge, summary, check, step)
+    # A move planned ahead (see plan_moves) only holds if nobody dragged us elsewhere since
+    if planned and planned["position"] != current_player.position:
+        planned = None
+
+    # 1. Roll Dice
+    check()
+    with step():
+        if game.state.dice_rolled:
+            roll, valid_moves = None, list(game.state.available_moves)
+            summary["resumed"] = True
+        elif planned:
+            roll, valid_moves = planned["roll"], planned["valid_moves"]
+        else:
+            with TURN_PHASE_SECONDS.time(phase="roll"):
+                roll = game.roll_dice()
+                valid_moves = game.get_valid_moves(current_player.position, roll)
+        if roll is not None:
+            game.offer_moves(valid_moves)
+            game.add_log(f"{current_player.name} rolled a {roll}.")
+    summary["roll"] = roll
+
+    # 2. Decide Move
+    if valid_moves:
+        if planned and planned["destination"]:
+            destination = planned["destination"]
+        else:
+            with TURN_PHASE_SECONDS.time(phase="decide_move"):
+                destination = policy.decide_move(current_player, valid_moves, game.state, knowledge, game.planner)
+
+        check()
+        with step(), TURN_PHASE_SECONDS.time(phase="move"):
+            game.move_player(game.state.current_player_index, destination)
+        on_move()
+        summary["destination"] = destination
+    else:
+        with step():
+            game.add_log(f"{current_player.name} has no valid moves.")
+            game.next_turn()
+        return summary
+
+    # 3. Decide Action (Suspect)
+    # AI will always try to suspect if in a room
+    with TURN_PHASE_SECONDS.time(phase="decide_suspicion"):
+        suspicion = policy.decide_suspicion(
+            current_player,
+            current_player.position,
+            game.state,
+            game.deck.categories["suspect"],
+            game.deck.categories["weapon"],
+            knowledge
+        )
+    check()
+    with step(), TURN_PHASE_SECONDS.time(phase="suspicion"):
+        if suspicion.get("flavor"):
+            game.add_log(f"{current_player.name}: \"{suspicion['flavor']}\"")
+        result = game.handle_suspicion(
+            suspicion["suspect"],
+            suspicion["weapon"],
+            suspicion["room"],
+            game.state.current_player_index
+        )
+    summary["suspicion"] = {k: suspicion[k] for k in ("suspect", "weapon", "room")}
+    summary["disproved_by"] = result.get("player")
+
+    # 3.b Update AI Notebook based on suspicion result
+    # handle_suspicion already updated 'seen_cards'/'notebook' and fed the outcome
+    # (who passed, who showed) into every player's Deduction engine.
+    return _finish_turn(game, policy, current_player, knowledge, summary, check, step)
+
+
+def _finish_turn(game: ClueGame, policy, current_player, knowledge, summary: dict,
+                 check: Callable[[], None], step: Callable[[], ContextManager]) -> dict:
+    """The end of play_turn: the accusation, if any, then the next seat's turn."""
+    # 4. Decide Action (Accuse)
+    # Now check if AI wants to accuse based on new info
+    with TURN_PHASE_SECONDS.time(phase="decide_accusation"):
+        accusation = policy.decide_accusation(current_player, game.state, knowledge)
+
+    check()
+    with step():
+        if accusation:
+            summary["accusation"] = accusation
+            with TURN_PHASE_SECONDS.time(phase="accusation"):
+                summary["accusation_correct"] = game.handle_accusation(
+                    accusation["suspect"],
+                    accusation["weapon"],
+                    accusation["room"],
+                    game.state.current_player_index
+                )
+            # Handle Accusation will either win (Game Over) or eliminate player
+            # If eliminated, turn ends. If win, state updates to Game Over.
+
+        if game.state.phase != GamePhase.GAME_OVER:
+            game.next_turn()
+
+    return summary
+
+
+def upcoming_ai_seats(game: ClueGame) -> List[int]:
+    """Consecutive active AI seats starting at the current player, at most one full round."""
+    players = game.state.players
+    seats = []
+    index = game.state.current_player_index
+    for _ in range(len(players)):
+        if players[index].is_human and not players[index].is_eliminated:
+            break
+        if not players[index].is_eliminated:
+            seats.append(index)
+        index = (index + 1) % len(players)
+    return seats
+
+
+def plan_moves(game: ClueGame, seats: List[int], policy,
+               step: Callable[[], ContextManager] = nullcontext) -> Dict[int, dict]:
+    """Rolls for every upcoming AI seat up front and, if the policy batches, decides all their moves at once.
+
+    Dice do not depend on anything that happens earlier in the round, so only a
+    seat whose character gets pulled into another room by a suspicion needs to
+    decide again on its own turn.
+    """
+    current = game.state.current_player_index
+    if game.state.phase != GamePhase.PLAYER_TURN_MOVE or game.state.dice_rolled:
+        seats = [index for index in seats if index != current]  # Under way already; play_turn resumes it
+    planned = {}
+    with step(), TURN_PHASE_SECONDS.time(phase="roll"):
+        for index in seats:
+            player = game.state.players[index]
+            roll = game.roll_dice()
+            planned[index] = {
+                "position": player.position,
+                "roll": roll,
+                "valid_moves": game.get_valid_moves(player.position, roll),
+                "destination": None,
+            }
+    if policy.batches_moves:
+        with TURN_PHASE_SECONDS.time(phase="decide_moves"):
+            choices = policy.decide_moves(
+                [(game.state.players[i], planned[i]["valid_moves"], game.deductions[i]) for i in seats],
+                game.state,
+            )
+        for index in seats:
+            planned[index]["destination"] = choices.get(game.state.players[index].name)
+    return planned
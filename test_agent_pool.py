@@ -0,0 +1,41 @@
+import itertools
+
+from src.clue.agent_pool import AgentPool
+
+
+def factory():
+    counter = itertools.count()
+    return lambda: f"agent-{next(counter)}"
+
+
+def test_agents_are_scoped_to_a_game_and_seat():
+    pool = AgentPool()
+    make = factory()
+    a = pool.checkout("g1", "Sherlock", "Miss Scarlet", make)
+    assert pool.checkout("g1", "Sherlock", "Miss Scarlet", make) is a
+    assert pool.checkout("g2", "Sherlock", "Miss Scarlet", make) is not a
+    assert pool.stats()["games"] == 2 and pool.created == 2
+
+
+def test_released_agents_are_reused_by_character_only():
+    pool = AgentPool()
+    make = factory()
+    a = pool.checkout("g1", "Sherlock", "Miss Scarlet", make)
+    pool.release("g1")
+    pool.release("g1")
+    assert pool.checkout("g2", "Poirot", "Colonel Mustard", make) != a
+    assert pool.checkout("g2", "Marple", "Miss Scarlet", make) == a
+    assert pool.reused == 1
+
+
+def test_memory_stays_bounded_however_many_games_are_played():
+    pool = AgentPool(max_idle_per_kind=2, max_games=3)
+    make = factory()
+    for game in range(100):
+        for seat, character in enumerate(["Miss Scarlet", "Mr. Green", "Mrs. White"]):
+            pool.checkout(game, seat, character, make)
+        if game % 2:
+            pool.release(game)
+    stats = pool.stats()
+    assert stats["games"] <= 3 and stats["idle"] <= 2 * 3
+    assert stats["created"] < 100 * 3
@@ -0,0 +1,54 @@
+import pytest
+
+pytest.importorskip("crewai")  # ClueAI builds on CrewAI; without it these tests are skipped
+
+from src.clue.agents import ClueAI
+from src.clue.llm import Completion
+from src.clue.models import Player
+
+
+class ScriptedPool:
+    """Stands in for LLMPool: answers every prompt with the next scripted reply."""
+
+    client = "scripted"  # Prompts go to complete(), never through CrewAI
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.prompts = []
+
+    def complete(self, messages, deadline=None):
+        self.prompts.append(messages)
+        return Completion(self.replies.pop(0))
+
+
+def _players():
+    return [
+        Player(name="Sherlock", character_name="Colonel Mustard", position="Lounge"),
+        Player(name="Poirot", character_name="Mrs. White", position="Hall"),
+    ]
+
+
+def test_decide_moves_parses_one_line_per_player():
+    sherlock, poirot = _players()
+    pool = ScriptedPool("Sherlock: Kitchen\nPoirot: Study")
+    ai = ClueAI(llm_pool=pool)
+    choices = ai.decide_moves([(sherlock, ["Hall", "Kitchen"], None), (poirot, ["Study", "Library"], None)], None)
+    assert choices == {"Sherlock": "Kitchen", "Poirot": "Study"}
+    assert len(pool.prompts) == 1
+
+    # Both answers were cached, so the same round never reaches the model again
+    assert ai.decide_moves([(sherlock, ["Hall", "Kitchen"], None), (poirot, ["Study", "Library"], None)], None) == choices
+
+
+def test_decide_moves_leaves_out_players_it_cannot_parse():
+    sherlock, poirot = _players()
+    ai = ClueAI(llm_pool=ScriptedPool("I would rather not say.\nPoirot goes to the Library"))
+    choices = ai.decide_moves([(sherlock, ["Hall", "Kitchen"], None), (poirot, ["Study", "Library"], None),
+                               (Player(name="Marple", character_name="Mr. Green", position="Hall"), ["Study"], None)], None)
+    # Sherlock's line is missing, so the caller decides for Sherlock alone; one option needs no model
+    assert choices == {"Poirot": "Library", "Marple": "Study"}
+
+
+def test_only_planner_moves_are_worked_out_ahead():
+    assert ClueAI(move_mode="planner", suspicion_mode="optimizer").speculative_decisions == ("move",)
+    assert ClueAI(move_mode="llm", suspicion_mode="optimizer").speculative_decisions == ()
@@ -0,0 +1,35 @@
+import os
+import subprocess
+import sys
+import threading
+
+from src.clue.ai_backend import DISABLED, FAILED, READY, LazyAIBackend
+
+
+def test_builds_once_on_first_use():
+    calls = []
+    backend = LazyAIBackend(lambda: calls.append(1) or "ai")
+    assert calls == []
+    threads = [threading.Thread(target=backend.get) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert backend.get() == "ai" and backend.status == READY and calls == [1]
+
+
+def test_failed_and_disabled_backends_fall_back_to_none():
+    def broken():
+        raise ImportError("no crewai")
+    backend = LazyAIBackend(broken)
+    assert backend.get() is None and backend.status == FAILED and "crewai" in backend.error
+    assert LazyAIBackend(broken, enabled=False).get() is None
+    assert LazyAIBackend(broken, enabled=False).status == DISABLED
+
+
+def test_server_import_does_not_load_the_model_backend():
+    root = os.path.dirname(os.path.abspath(__file__))
+    code = "import sys, src.clue.server; print('src.clue.agents' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True,
+                         env=dict(os.environ, PYTHONPATH=root, CLUE_AI_BACKEND="heuristic"), check=True)
+    assert out.stdout.strip().splitlines()[-1] == "False"
@@ -11,16 +11,17 @@ def test_game_flow():
         print(f"Failed to start game: {response.text}")
         return
     state = response.json()
+    game_url = f"{BASE_URL}/game/{state['game_id']}"
     print("Game started. Players:", [p['name'] for p in state['players']])
 
     # 2. Get State
-    response = requests.get(f"{BASE_URL}/game/state")
+    response = requests.get(f"{game_url}/state")
     assert response.status_code == 200
     print("State retrieved successfully.")
 
     # 3. Roll Dice (Human turn)
     print("Rolling dice...")
-    response = requests.post(f"{BASE_URL}/game/roll")
+    response = requests.post(f"{game_url}/roll")
     if response.status_code == 200:
         data = response.json()
         print(f"Rolled: {data['roll']}, Valid moves: {data['valid_moves']}")
@@ -29,24 +30,29 @@ def test_game_flow():
         if data['valid_moves']:
             move_to = data['valid_moves'][0]
             print(f"Moving to {move_to}...")
-            response = requests.post(f"{BASE_URL}/game/move", json={"destination_room": move_to})
+            response = requests.post(f"{game_url}/move", json={"destination_room": move_to})
             assert response.status_code == 200
             print("Moved successfully.")
             
             # 5. Pass (end turn)
             print("Passing turn...")
-            requests.post(f"{BASE_URL}/game/pass")
+            requests.post(f"{game_url}/pass")
         else:
             print("No moves, passing...")
-            requests.post(f"{BASE_URL}/game/pass")
+            requests.post(f"{game_url}/pass")
 
     # 6. AI Turn
     print("Triggering AI turn...")
-    response = requests.post(f"{BASE_URL}/game/ai-turn")
-    if response.status_code == 200:
-        print("AI turn completed.")
-        state = response.json()
-        print("Logs:", state['logs'][-2:])
+    response = requests.post(f"{game_url}/ai-turn")
+    if response.status_code == 202:
+        job = response.json()
+        while job['status'] in ("pending", "running"):
+            time.sleep(0.5)
+            job = requests.get(f"{game_url}/ai-turn/{job['job_id']}").json()
+        print(f"AI turn finished: {job['status']}")
+        cursor = job['state']['log_cursor'] if job.get('state') else 0
+        logs = requests.get(f"{game_url}/logs", params={"after": max(cursor - 2, 0)}).json()
+        print("Logs:", [entry['message'] for entry in logs['entries']])
     else:
         print(f"AI turn failed: {response.text}")
 
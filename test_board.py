@@ -0,0 +1,36 @@
+import json
+
+from src.clue.board import Board
+from src.clue.game_logic import ClueGame
+
+
+def test_tables_are_shared_per_board():
+    assert ClueGame().board is ClueGame().board
+    assert Board.for_graph({"A": ["B"], "B": ["A"]}) is Board.for_graph({"A": ["B"], "B": ["A"]})
+
+
+def test_client_boards_do_not_grow_the_cache_without_bound(monkeypatch):
+    monkeypatch.setattr(Board, "max_cached", 4)
+    standard = ClueGame().board
+    for i in range(10):
+        ClueGame().initialize_game("Miss Scarlet", num_ai_players=1, board={f"R{i}": ["Hall"], "Hall": [f"R{i}"]})
+    assert len(Board._cache) <= 4
+    assert ClueGame().board is standard  # Still held by the module, so still shared
+
+
+def test_weighted_shortest_paths():
+    board = Board({"A": {"B": 2, "C": 9}, "B": {"C": 3}, "C": {}})
+    assert board.distances["A"]["C"] == 5
+    assert board.valid_moves("A", 4) == ["B"]
+    assert board.valid_moves("A", 5) == ["B", "C"]
+    assert board.valid_moves("C", 12) == []
+
+
+def test_game_on_a_board_file(tmp_path):
+    rooms = [f"Room {i}" for i in range(20)]
+    path = tmp_path / "ring.json"
+    path.write_text(json.dumps({"rooms": {r: {rooms[i - 1]: 3, rooms[(i + 1) % 20]: 3} for i, r in enumerate(rooms)}}))
+    game = ClueGame()
+    game.initialize_game("Miss Scarlet", seed=1, board=Board.load(str(path)))
+    assert game.deck.categories["room"] == rooms
+    assert game.get_valid_moves("Room 0", 6) == ["Room 1", "Room 2", "Room 18", "Room 19"]
@@ -0,0 +1,57 @@
+import threading
+import time
+
+from src.clue.decision_cache import DecisionCache
+
+
+def test_key_ignores_collection_order():
+    a = DecisionCache.key("move", valid_moves=["Hall", "Study"], notebook={"Rope": "SEEN", "Hall": "HAND"})
+    b = DecisionCache.key("move", notebook={"Hall": "HAND", "Rope": "SEEN"}, valid_moves=["Study", "Hall"])
+    assert a == b
+    assert a != DecisionCache.key("suspicion", valid_moves=["Hall", "Study"], notebook={"Rope": "SEEN", "Hall": "HAND"})
+
+
+def test_lru_eviction_and_counters():
+    cache = DecisionCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 2}
+
+
+def test_expired_entries_are_misses():
+    cache = DecisionCache(ttl=0.01)
+    cache.put("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+
+def test_disk_store_survives_a_new_cache(tmp_path):
+    path = str(tmp_path / "decisions.sqlite")
+    cache = DecisionCache(path=path)
+    cache.put("a", {"suspect": "Mr. Green", "weapon": "Rope"})
+    cache.close()
+    assert DecisionCache(path=path).get("a") == {"suspect": "Mr. Green", "weapon": "Rope"}
+
+
+def test_several_writers_can_share_one_disk_store(tmp_path):
+    path = str(tmp_path / "decisions.db")
+    caches = [DecisionCache(path=path) for _ in range(4)]  # Like one per simulate worker process
+
+    def write(index, cache):
+        for i in range(50):
+            cache.put(f"{index}-{i}", i)
+
+    threads = [threading.Thread(target=write, args=(index, cache)) for index, cache in enumerate(caches)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for cache in caches:
+        cache.close()
+
+    fresh = DecisionCache(path=path)
+    assert all(fresh.get(f"{index}-{i}") == i for index in range(4) for i in range(50))
+    assert fresh._db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
@@ -0,0 +1,55 @@
+from src.clue.deduction import Deduction
+from src.clue.game_logic import CATEGORIES, ClueGame
+
+SUSPECTS, WEAPONS, ROOMS = CATEGORIES["suspect"], CATEGORIES["weapon"], CATEGORIES["room"]
+
+
+def make(hand):
+    deduction = Deduction(CATEGORIES, [4, 4, 4, 4])
+    deduction.see_hand(0, hand)
+    return deduction
+
+
+def test_passes_and_shown_cards_narrow_the_solution():
+    deduction = make(["Miss Scarlet", "Dagger", "Kitchen", "Hall"])
+    for weapon in ["Candlestick", "Lead Pipe", "Revolver"]:
+        deduction.observe_suspicion(0, ["Mr. Green", weapon, "Study"], passed=[], shower=1, shown=weapon)
+    assert deduction.candidates("weapon") == ["Rope", "Wrench"]
+
+
+def test_everyone_passing_puts_unheld_cards_in_solution():
+    deduction = make(["Miss Scarlet", "Dagger", "Kitchen", "Hall"])
+    deduction.observe_suspicion(0, ["Mr. Green", "Rope", "Study"], passed=[1, 2, 3])
+    # Only the solution or the undealt pile can hold them now
+    assert deduction.possible_holders("Rope") == [deduction.solution, deduction.undealt]
+
+
+def test_unseen_show_resolves_once_other_cards_are_excluded():
+    deduction = make(["Miss Scarlet", "Dagger", "Kitchen", "Hall"])
+    deduction.observe_suspicion(2, ["Mr. Green", "Rope", "Study"], passed=[], shower=1)
+    deduction.observe_suspicion(0, ["Mr. Green", "Wrench", "Lounge"], passed=[1], shower=2, shown="Mr. Green")
+    deduction.observe_suspicion(0, ["Mrs. White", "Rope", "Lounge"], passed=[1], shower=3, shown="Rope")
+    assert deduction.holder_of("Study") == 1
+
+
+def test_game_engines_stay_consistent_with_the_deal():
+    game = ClueGame()
+    state = game.initialize_game("Miss Scarlet")
+    for _ in range(30):
+        index = state.current_player_index
+        game.handle_suspicion(SUSPECTS[_ % 6], WEAPONS[_ % 6], ROOMS[_ % 9], index)
+        game.next_turn()
+    for deduction in game.deductions:
+        assert not deduction.contradiction
+        for i, player in enumerate(state.players):
+            for card in player.hand:
+                assert i in deduction.possible_holders(card.name)
+        assert game.truth["room"].name in deduction.candidates("room")
+
+
+def test_repeated_suspicions_do_not_pile_up_clauses():
+    deduction = Deduction(CATEGORIES, [4, 4, 4, 4])
+    deduction.see_hand(0, ["Miss Scarlet", "Dagger", "Kitchen", "Hall"])
+    for _ in range(5):
+        deduction.observe_suspicion(1, ["Mr. Green", "Rope", "Study"], passed=[], shower=2)
+    assert deduction.clauses == [(2, deduction.mask(["Mr. Green", "Rope", "Study"]))]
@@ -0,0 +1,27 @@
+from src.clue.game_log import GameLog
+
+
+def test_read_pages_after_cursor():
+    log = GameLog()
+    for i in range(5):
+        log.append(f"line {i}")
+    page = log.read(after=2, limit=2)
+    assert [entry.seq for entry in page] == [3, 4]
+
+
+def test_ring_buffer_drops_oldest_entries():
+    log = GameLog(capacity=3)
+    for i in range(5):
+        log.append(f"line {i}")
+    assert log.first_seq == 3
+    assert [entry.seq for entry in log.read()] == [3, 4, 5]
+
+
+def test_spilled_entries_can_still_be_read(tmp_path):
+    log = GameLog(capacity=2, spill_path=str(tmp_path / "game.jsonl"))
+    for i in range(5):
+        log.append(f"line {i}")
+    assert log.first_seq == 1
+    assert [entry.message for entry in log.read(after=0, limit=10)] == [f"line {i}" for i in range(5)]
+    log.close()
+    assert not (tmp_path / "game.jsonl").exists()
@@ -0,0 +1,90 @@
+import pytest
+
+from src.clue.game_logic import ClueGame
+
+
+def _play_dice(seed):
+    game = ClueGame()
+    state = game.initialize_game("Miss Scarlet", seed=seed)
+    hands = [[c.name for c in p.hand] for p in state.players]
+    return hands, game.truth, [game.roll_dice() for _ in range(20)]
+
+
+def test_same_seed_replays_the_game():
+    assert _play_dice(42) == _play_dice(42)
+    assert _play_dice(42) != _play_dice(43)
+
+
+def test_seed_is_recorded_in_state():
+    game = ClueGame()
+    assert game.initialize_game("Miss Scarlet", seed=7).seed == 7
+    assert ClueGame().initialize_game("Miss Scarlet").seed is not None
+
+
+def test_every_change_bumps_the_state_version():
+    game = ClueGame()
+    state = game.initialize_game("Miss Scarlet", seed=3)
+    assert state.version == game.version == 1
+    game.roll_for_turn()  # Calls other recorded methods, but counts once
+    assert game.view().version == 2
+    assert ClueGame.from_snapshot(game.to_snapshot()).view().version == 2
+
+
+def test_compact_state_serializes_like_its_view():
+    game = ClueGame()
+    game.initialize_game("Miss Scarlet", seed=1)
+    game.handle_suspicion("Mr. Green", "Rope", "Hall", 0)
+    assert game.state.model_dump() == game.view().model_dump(mode="json")
+
+
+def _ring_board(n):
+    rooms = [f"Room {i}" for i in range(n)]
+    return {room: [rooms[i - 1], rooms[(i + 1) % n]] for i, room in enumerate(rooms)}
+
+
+def test_variant_deals_whole_deck_to_six_players():
+    game = ClueGame()
+    suspects = [f"Suspect {i}" for i in range(8)]
+    state = game.initialize_game(None, num_ai_players=6, seed=1, board=_ring_board(12),
+                                 categories={"suspect": suspects, "weapon": ["Rope", "Wrench", "Axe"], "room": []},
+                                 hand_size=None)
+    sizes = sorted(p.hand_mask.bit_count() for p in state.players)
+    # 23 cards minus the 3 in the envelope, dealt round-robin
+    assert sum(sizes) == 20 and sizes[0] == 3 and sizes[-1] == 4
+    assert state.players[0].position == "Room 0"
+
+
+def test_hands_need_at_least_one_card():
+    for hand_size in (0, -1):
+        with pytest.raises(ValueError):
+            ClueGame().initialize_game("Miss Scarlet", seed=1, hand_size=hand_size)
+
+
+def test_suspicion_is_disproved_by_the_first_holder_in_turn_order():
+    game = ClueGame()
+    state = game.initialize_game("Miss Scarlet", seed=4)
+    for suspector in range(4):
+        for card in game.deck.names:
+            if card in game.deck.categories["suspect"]:
+                cards = [card, "Rope", "Hall"]
+            elif card in game.deck.categories["weapon"]:
+                cards = ["Mr. Green", card, "Hall"]
+            else:
+                cards = ["Mr. Green", "Rope", card]
+            expected = None
+            for step in range(1, 4):
+                seat = (suspector + step) % 4
+                if state.players[seat].hand_mask & game.deck.mask(cards):
+                    expected = state.players[seat].name
+                    break
+            result = game.handle_suspicion(*cards, suspector)
+            assert result.get("player") == expected
+
+
+def test_suspicion_of_unknown_cards_changes_nothing():
+    game = ClueGame()
+    game.initialize_game("Miss Scarlet", seed=4)
+    logs = game.log.tail(50)
+    with pytest.raises(ValueError):
+        game.handle_suspicion("Nobody", "Rope", "Hall", 0)
+    assert game.log.tail(50) == logs
@@ -0,0 +1,65 @@
+import threading
+import time
+
+from src.clue.jobs import Job, JobManager, JobStatus
+
+
+def wait_for(job, timeout=2.0):
+    end = time.monotonic() + timeout
+    while not job.finished and time.monotonic() < end:
+        time.sleep(0.01)
+    return job
+
+
+def test_job_result_is_returned():
+    manager = JobManager(max_workers=1)
+    job = wait_for(manager.submit("game", lambda job: 42))
+    assert job.status == JobStatus.DONE
+    assert job.result == 42
+
+
+def test_slow_job_times_out_before_mutating():
+    manager = JobManager(max_workers=1)
+    mutated = []
+
+    def slow(job):
+        time.sleep(0.05)
+        job.check()
+        mutated.append(True)
+
+    job = manager.submit("game", slow, timeout=0.01)
+    time.sleep(0.1)
+    assert manager.get(job.job_id).status == JobStatus.TIMED_OUT
+    assert mutated == []
+
+
+def test_cancel_stops_running_job():
+    manager = JobManager(max_workers=1)
+    started = threading.Event()
+
+    def waits(job):
+        started.set()
+        while True:
+            job.check()
+            time.sleep(0.01)
+
+    job = manager.submit("game", waits)
+    started.wait(1)
+    job.cancel()
+    assert job.status == JobStatus.CANCELLED
+
+
+def test_cancel_just_before_the_job_starts_sticks(monkeypatch):
+    manager = JobManager(max_workers=1)
+    ran = []
+    check = Job.check
+
+    def check_then_cancel(job):
+        check(job)
+        job.cancel()  # Lands after the worker's check, before fn runs
+
+    monkeypatch.setattr(Job, "check", check_then_cancel)
+    job = wait_for(manager.submit("game", lambda job: ran.append(True)))
+    time.sleep(0.05)
+    assert job.status == JobStatus.CANCELLED and job.finished
+    assert ran == []
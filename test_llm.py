@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from src.clue.llm import ChatCompletionsClient, Completion, LLMDeadlineExceeded, LLMPool, RetryableLLMError
+from src.clue.llm_stub import StubLLMServer
+
+MESSAGES = [{"role": "user", "content": "Move to the Kitchen or the Hall?"}]
+
+
+class FakeClient:
+    model = "fake"
+
+    def __init__(self, latencies=(), failures=0):
+        self.latencies = list(latencies)
+        self.failures = failures
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def complete(self, messages, timeout):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latencies[call - 1] if call <= len(self.latencies) else 0.01)
+            if call <= self.failures:
+                raise RetryableLLMError("HTTP 503")
+            return Completion(f"answer {call}")
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def test_round_trip_through_the_stub_server():
+    server = StubLLMServer(median=0.0).start()
+    try:
+        pool = LLMPool(ChatCompletionsClient(server.base_url, model="stub"), max_concurrency=2)
+        completion = pool.complete(MESSAGES)
+        assert completion.text == MESSAGES[0]["content"]
+        assert completion.prompt_tokens > 0 and completion.completion_tokens > 0
+        assert pool.complete(MESSAGES).text == completion.text  # over a reused connection
+    finally:
+        server.stop()
+
+
+def test_retries_retryable_failures_with_backoff():
+    client = FakeClient(failures=2)
+    pool = LLMPool(client, retries=2, backoff=0.01)
+    assert pool.complete(MESSAGES).text == "answer 3"
+    with pytest.raises(RetryableLLMError):
+        LLMPool(FakeClient(failures=5), retries=1, backoff=0.01).complete(MESSAGES)
+
+
+def test_hedged_request_wins_over_a_slow_one():
+    client = FakeClient(latencies=[1.0, 0.01])
+    pool = LLMPool(client, hedge_after=0.05)
+    start = time.monotonic()
+    assert pool.complete(MESSAGES).text == "answer 2"
+    assert time.monotonic() - start < 0.5
+
+
+def test_deadline_bounds_the_whole_call():
+    pool = LLMPool(FakeClient(latencies=[1.0]), deadline=0.05)
+    start = time.monotonic()
+    with pytest.raises(LLMDeadlineExceeded):
+        pool.complete(MESSAGES)
+    assert time.monotonic() - start < 0.5
+
+
+def test_concurrency_is_capped_across_callers():
+    client = FakeClient(latencies=[0.02] * 40)
+    pool = LLMPool(client, max_concurrency=3)
+    threads = [threading.Thread(target=pool.complete, args=(MESSAGES,)) for _ in range(12)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert client.calls == 12 and client.max_in_flight == 3
+
+
+def test_calls_made_outside_the_pool_share_its_cap_and_deadline():
+    client = FakeClient(latencies=[0.02] * 12)
+    pool = LLMPool(max_concurrency=3)
+    threads = [threading.Thread(target=pool.run, args=(lambda: client.complete(MESSAGES, None),)) for _ in range(12)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert client.calls == 12 and client.max_in_flight == 3
+
+    start = time.monotonic()
+    with pytest.raises(LLMDeadlineExceeded):
+        LLMPool(deadline=0.05).run(lambda: time.sleep(1.0))
+    assert time.monotonic() - start < 0.5
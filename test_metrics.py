@@ -0,0 +1,59 @@
+import random
+import threading
+
+from src.clue.game_logic import ClueGame
+from src.clue.metrics import TURN_PHASE_SECONDS, Registry
+from src.clue.policies import RandomPolicy
+from src.clue.turns import play_turn
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    latency = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    latency.observe(0.05, route="/a")
+    latency.observe(0.5, route="/a")
+    latency.observe(5, route="/a")
+    lines = registry.render().splitlines()
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{route="/a"} 3' in lines
+    assert 'latency_seconds_sum{route="/a"} 5.55' in lines
+
+
+def test_counter_is_thread_safe_and_escapes_labels():
+    registry = Registry()
+    calls = registry.counter("calls", "Calls.", ("decision",))
+
+    def work():
+        for _ in range(1000):
+            calls.inc(decision='say "hi"')
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert calls.value(decision='say "hi"') == 4000
+    assert 'calls_total{decision="say \\"hi\\""} 4000' in registry.render()
+
+
+def test_timer_decorator_records_every_call():
+    registry = Registry()
+    seconds = registry.histogram("work_seconds", "Work.")
+
+    @seconds.time()
+    def work():
+        return 42
+    assert work() == 42 and work() == 42
+    assert seconds.count() == 2
+
+
+def test_play_turn_times_its_phases():
+    game = ClueGame()
+    game.initialize_game(None, num_ai_players=3, seed=3)
+    before = TURN_PHASE_SECONDS.count(phase="decide_suspicion")
+    for _ in range(10):
+        play_turn(game, RandomPolicy(random.Random(0)))
+    assert TURN_PHASE_SECONDS.count(phase="roll") >= 10
+    assert TURN_PHASE_SECONDS.count(phase="decide_suspicion") > before
@@ -0,0 +1,65 @@
+import random
+
+from src.clue.game_logic import ClueGame
+from src.clue.persistence import EventStore
+from src.clue.policies import RandomPolicy
+from src.clue.turns import play_turn
+
+
+def _play(store, game_id, turns):
+    game = ClueGame()
+    store.attach(game_id, game)
+    game.initialize_game("Miss Scarlet", seed=11)
+    game.roll_for_turn()
+    game.next_turn()
+    policy = RandomPolicy(random.Random(0))
+    for _ in range(turns):
+        play_turn(game, policy)
+    return game
+
+
+def test_restore_replays_to_the_same_state(tmp_path):
+    path = str(tmp_path / "games.db")
+    store = EventStore(path, snapshot_every=7)
+    games = {game_id: _play(store, game_id, turns) for game_id, turns in (("a", 3), ("b", 12))}
+    store.close()
+
+    restored_store = EventStore(path)
+    restored = restored_store.restore()
+    assert set(restored) == {"a", "b"}
+    for game_id, game in games.items():
+        copy = restored[game_id]
+        assert copy.state.model_dump() == dict(game.state.model_dump(), game_id=game_id)
+        assert [d.to_dict() for d in copy.deductions] == [d.to_dict() for d in game.deductions]
+        assert copy.log.tail(50) == game.log.tail(50)
+        # Same generator state, so the game carries on identically
+        assert [copy.roll_dice() for _ in range(5)] == [game.roll_dice() for _ in range(5)]
+    restored_store.close()
+
+
+def test_deleted_games_are_not_restored(tmp_path):
+    path = str(tmp_path / "games.db")
+    store = EventStore(path, snapshot_every=5)
+    _play(store, "a", 4)
+    store.delete("a")
+    store.close()
+    store = EventStore(path)
+    assert store.restore() == {}
+    store.close()
+
+
+def test_unseeded_game_restores_the_same_deal_before_its_first_snapshot(tmp_path):
+    path = str(tmp_path / "games.db")
+    store = EventStore(path)
+    game = ClueGame()
+    store.attach("a", game)
+    game.initialize_game("Miss Scarlet")  # A fresh seed, as /game/start deals by default
+    game.roll_for_turn()
+    store.close()
+
+    restored_store = EventStore(path)
+    copy = restored_store.restore()["a"]
+    assert copy.state.seed == game.state.seed
+    assert copy.truth == game.truth
+    assert copy.state.model_dump() == dict(game.state.model_dump(), game_id="a")
+    restored_store.close()
@@ -0,0 +1,28 @@
+from src.clue.deduction import Deduction
+from src.clue.game_logic import CATEGORIES, ClueGame
+from src.clue.planner import ROLL_PROBABILITIES, MovePlanner
+
+
+def test_roll_distribution_sums_to_one():
+    assert abs(sum(ROLL_PROBABILITIES.values()) - 1) < 1e-12
+
+
+def test_tables_are_shared_per_board():
+    assert ClueGame().planner is ClueGame().planner
+
+
+def test_reach_matches_roll_odds_for_one_turn():
+    game = ClueGame()
+    planner = game.planner
+    # Kitchen -> Ballroom is one hop (4 steps): any roll of 4 or more gets there
+    p = sum(prob for roll, prob in ROLL_PROBABILITIES.items() if roll >= 4)
+    assert abs(planner.reach[1][planner.index["Kitchen"]][planner.index["Ballroom"]] - p) < 1e-12
+    # More turns never make a room harder to reach
+    assert planner.reach[3][planner.index["Kitchen"]][planner.index["Lounge"]] >= planner.reach[1][planner.index["Kitchen"]][planner.index["Lounge"]]
+
+
+def test_prefers_rooms_that_may_still_be_the_answer():
+    deduction = Deduction(CATEGORIES, [4, 4, 4, 4])
+    deduction.see_hand(0, ["Miss Scarlet", "Dagger", "Kitchen", "Hall"])
+    planner = ClueGame().planner
+    assert planner.choose(["Kitchen", "Ballroom"], deduction) == "Ballroom"
@@ -0,0 +1,30 @@
+import numpy as np
+
+from src.clue.deduction import Deduction
+from src.clue.game_logic import CATEGORIES, ClueGame, SUSPECTS, WEAPONS, ROOMS
+from src.clue.probability import solution_probabilities
+
+
+def test_probabilities_sum_to_one_and_include_truth():
+    rng = np.random.default_rng(7)
+    game = ClueGame()
+    state = game.initialize_game("Miss Scarlet")
+    for _ in range(12):
+        game.handle_suspicion(SUSPECTS[rng.integers(6)], WEAPONS[rng.integers(6)], ROOMS[rng.integers(9)], state.current_player_index)
+        game.next_turn()
+
+    estimate = solution_probabilities(game.deductions[0], rng, samples=2000, time_budget=1.0)
+    truth = (game.truth["suspect"].name, game.truth["weapon"].name, game.truth["room"].name)
+    assert abs(sum(estimate.probabilities.values()) - 1) < 1e-9
+    assert estimate.probabilities.get(truth, 0) > 0
+
+
+def test_known_solution_is_certain():
+    deduction = Deduction(CATEGORIES, [4, 4, 4, 4])
+    deduction.see_hand(0, ["Miss Scarlet", "Dagger", "Kitchen", "Hall"])
+    deduction.has[deduction.solution] |= deduction.mask(["Mr. Green", "Rope", "Study"])
+    deduction.propagate()
+
+    solution, probability = solution_probabilities(deduction).best()
+    assert solution == ("Mr. Green", "Rope", "Study")
+    assert probability == 1.0
@@ -0,0 +1,71 @@
+import pytest
+
+from src.clue.game_logic import ClueGame
+from src.clue.projections import ProjectionCache, human_seat, parse_fields, project
+from src.clue.realtime import StateFeed
+
+
+def _game():
+    game = ClueGame()
+    game.initialize_game("Miss Scarlet", num_ai_players=2, seed=5)
+    return game
+
+
+def test_opponents_private_fields_are_hidden():
+    state = _game().state.model_dump()
+    seat = human_seat(state)
+    projected = project(state, seat)
+
+    assert projected["players"][seat] == state["players"][seat]
+    for index, player in enumerate(projected["players"]):
+        if index != seat:
+            assert player["hand"] == [] and player["notebook"] == {} and player["seen_cards"] == []
+            assert player["position"] == state["players"][index]["position"]
+    assert state["players"][1]["hand"]  # The dump itself is left alone
+
+
+def test_seed_is_kept_back_until_game_over():
+    game = _game()
+    state = game.state.model_dump()
+    assert "seed" not in project(state, 0)
+    assert "seed" not in project(state, 0, parse_fields("seed,phase"))
+
+    truth = game.truth
+    game.handle_accusation(truth["suspect"].name, truth["weapon"].name, truth["room"].name, 0)
+    assert project(game.state.model_dump(), 0)["seed"] == game.state.seed
+
+
+def test_fields_selects_top_level_fields():
+    state = _game().state.model_dump()
+    fields = parse_fields("phase, current_player_index,available_moves")
+    assert project(state, 0, fields) == {
+        "available_moves": state["available_moves"],
+        "current_player_index": state["current_player_index"],
+        "phase": state["phase"],
+    }
+    assert parse_fields("") is None
+    with pytest.raises(ValueError):
+        parse_fields("phase,truth")
+
+
+def test_cache_serializes_each_projection_once_per_version():
+    game = _game()
+    cache = ProjectionCache()
+    fields = parse_fields("phase")
+
+    body = cache.body(game, 0)
+    assert cache.body(game, 0) is body
+    assert cache.get(game, 0, fields) is cache.get(game, 0, fields)
+    assert cache.get(game, None)["players"][0]["hand"] == []
+
+    game.next_turn()
+    assert cache.body(game, 0) is not body
+    assert list(cache._entries) == [(0, None)]
+
+
+def test_feed_publishes_the_projection():
+    game = _game()
+    feed = StateFeed(projection=lambda state: project(state, human_seat(state)))
+    feed.publish(game.state)
+    players = feed.snapshot_message()["state"]["players"]
+    assert players[0]["hand"] and players[1]["hand"] == []
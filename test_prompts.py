@@ -0,0 +1,37 @@
+from src.clue.game_logic import ClueGame
+from src.clue.prompts import PromptBuilder, knowledge_grid
+
+
+def new_game():
+    game = ClueGame()
+    game.initialize_game("Miss Scarlet", seed=5)
+    return game
+
+
+def test_grid_lists_open_and_held_cards_per_category():
+    game = new_game()
+    player = game.state.players[1]
+    grid = {label: (open_cards, held) for label, open_cards, held in knowledge_grid(player, game.deductions[1])}
+    assert set(grid) == {"Suspects", "Weapons", "Rooms"}
+    hand = {card.name for card in player.hand}
+    assert {card for _, held in grid.values() for card in held} == hand
+    assert not hand & {card for open_cards, _ in grid.values() for card in open_cards}
+
+
+def test_prompts_end_with_the_options_and_stay_within_budget():
+    game = new_game()
+    player = game.state.players[1]
+    prompt = PromptBuilder().move(player, ["Kitchen", "Hall"], game.deductions[1])
+    assert prompt.user.splitlines()[-1] == "Answer with one room: Kitchen, Hall"
+    assert prompt.tokens <= PromptBuilder().budget
+    assert "notebook" not in prompt.user and "{" not in prompt.user
+
+
+def test_tight_budget_drops_detail_but_keeps_the_options():
+    game = new_game()
+    player = game.state.players[1]
+    rich = PromptBuilder(1000).suspicion(player, "Hall", ["Mr. Green"], ["Rope"], game.deductions[1])
+    lean = PromptBuilder(60).suspicion(player, "Hall", ["Mr. Green"], ["Rope"], game.deductions[1])
+    assert lean.tokens < rich.tokens
+    assert lean.user.splitlines()[-1] == rich.user.splitlines()[-1]
+    assert "yours" in rich.user and "yours" not in lean.user
@@ -0,0 +1,30 @@
+from src.clue.game_logic import ClueGame
+from src.clue.realtime import StateFeed, diff_states
+
+
+def test_diff_sends_only_changed_fields():
+    old = {"phase": "a", "log_cursor": 1, "players": [{"name": "You", "position": "Lounge"}]}
+    new = {"phase": "a", "log_cursor": 2, "players": [{"name": "You", "position": "Hall"}]}
+    assert diff_states(old, new) == {"log_cursor": 2, "players": {0: {"position": "Hall"}}}
+
+
+def test_delta_carries_new_log_entries():
+    game = ClueGame()
+    feed = StateFeed()
+    feed.publish(game.initialize_game("Miss Scarlet"), game.log)
+    game.next_turn()
+    message = feed.publish(game.state, game.log)
+    assert [entry["message"] for entry in message["changes"]["logs"]] == ["It is Sherlock's turn."]
+
+
+def test_catch_up_falls_back_to_snapshot_when_history_is_gone():
+    game = ClueGame()
+    feed = StateFeed()
+    feed.publish(game.initialize_game("Miss Scarlet"))
+    game.next_turn()
+    feed.publish(game.state)
+
+    assert [m["version"] for m in feed.catch_up(1)] == [2]
+    assert feed.catch_up(2) == []
+    feed._history.clear()
+    assert feed.catch_up(1)[0]["type"] == "snapshot"
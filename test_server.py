@@ -0,0 +1,145 @@
+import os
+import threading
+import time
+
+os.environ.setdefault("CLUE_AI_BACKEND", "heuristic")  # No model backend in tests
+os.environ.setdefault("CLUE_SPECULATE", "0")
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from src.clue import server
+from src.clue.board import Board
+from src.clue.models import GamePhase
+from src.clue.policies import HeuristicPolicy
+
+
+@pytest.fixture
+def client():
+    return TestClient(server.app)
+
+
+def _start(client, **config):
+    state = client.post("/game/start", json=dict({"human_character": "Miss Scarlet", "seed": 3}, **config)).json()
+    return state["game_id"], server.sessions.get(state["game_id"]).game
+
+
+def test_bad_suspicion_is_rejected_before_anything_changes(client):
+    game_id, game = _start(client)
+    version, logs = game.version, game.log.tail(50)
+    room = game.state.players[0].position
+
+    response = client.post(f"/game/{game_id}/suspect", json={"suspect": "Nobody", "weapon": "Rope", "room": room})
+    assert response.status_code == 400
+    response = client.post(f"/game/{game_id}/suspect", json={"suspect": "Mr. Green", "weapon": "Rope", "room": "Nowhere"})
+    assert response.status_code == 400
+    other = next(r for r in game.board.rooms if r != room)
+    response = client.post(f"/game/{game_id}/suspect", json={"suspect": "Mr. Green", "weapon": "Rope", "room": other})
+    assert response.status_code == 400
+    assert game.version == version and game.log.tail(50) == logs
+
+
+def test_constants_follow_the_default_board(client, monkeypatch):
+    assert client.get("/game/constants").json()["rooms"] == server.ROOMS
+    board = Board.for_graph({"Attic": ["Cellar"], "Cellar": ["Attic"]})
+    monkeypatch.setattr(server, "DEFAULT_BOARD", board)
+    assert client.get("/game/constants").json()["rooms"] == ["Attic", "Cellar"]
+
+
+def test_hand_size_below_one_is_rejected(client):
+    response = client.post("/game/start", json={"human_character": "Miss Scarlet", "hand_size": 0})
+    assert response.status_code == 422
+
+
+def _wait(client, game_id, job_id):
+    for _ in range(200):
+        job = client.get(f"/game/{game_id}/ai-turn/{job_id}").json()
+        if job["status"] not in ("pending", "running"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError("AI job did not finish")
+
+
+def test_hung_model_call_does_not_lock_the_table(client, monkeypatch):
+    game_id, game = _start(client, seed=4)
+    client.post(f"/game/{game_id}/pass")  # The first AI seat's turn; it rolls high enough to move
+    released = threading.Event()
+    session = server.sessions.get(game_id)
+    policy = HeuristicPolicy(rng=np.random.default_rng(0))
+
+    class Hung(HeuristicPolicy):
+        def decide_move(self, *args, **kwargs):
+            released.wait(5)  # A model call that outlives the job
+            return super().decide_move(*args, **kwargs)
+
+    monkeypatch.setattr(server, "AI_TURN_TIMEOUT", 0.1)
+    monkeypatch.setattr(server, "policy_for", lambda session: Hung())
+    hung = client.post(f"/game/{game_id}/ai-turn").json()
+    time.sleep(0.2)
+
+    monkeypatch.setattr(server, "policy_for", lambda session: policy)
+    retry = client.post(f"/game/{game_id}/ai-turn")
+    assert retry.status_code == 202 and retry.json()["job_id"] != hung["job_id"]
+    assert _wait(client, game_id, retry.json()["job_id"])["status"] == "done"
+    version = game.version
+
+    released.set()  # The stale job wakes up and must leave the game alone
+    time.sleep(0.1)
+    assert _wait(client, game_id, hung["job_id"])["status"] == "timed_out"
+    assert game.version == version
+    assert not session.game.lock._is_owned()
+
+
+def test_unchanged_state_polls_get_304(client):
+    game_id, game = _start(client)
+    response = client.get(f"/game/{game_id}/state")
+    etag = response.headers["ETag"]
+    assert response.status_code == 200 and response.json()["version"] == game.version
+
+    response = client.get(f"/game/{game_id}/state", headers={"If-None-Match": etag})
+    assert response.status_code == 304 and response.content == b"" and response.headers["ETag"] == etag
+
+    client.post(f"/game/{game_id}/roll")
+    response = client.get(f"/game/{game_id}/state", headers={"If-None-Match": etag})
+    assert response.status_code == 200 and response.headers["ETag"] != etag
+
+
+def test_changes_from_a_stale_version_get_412(client):
+    game_id, game = _start(client)
+    etag = client.get(f"/game/{game_id}/state").headers["ETag"]
+
+    response = client.post(f"/game/{game_id}/roll", headers={"If-Match": etag})
+    assert response.status_code == 200
+    version = game.version
+    response = client.post(f"/game/{game_id}/pass", headers={"If-Match": etag})
+    assert response.status_code == 412 and game.version == version
+    response = client.post(f"/game/{game_id}/pass", headers={"If-Match": client.get(f"/game/{game_id}/state").headers["ETag"]})
+    assert response.status_code == 200 and game.version == version + 1
+
+
+def test_ai_run_stops_at_the_humans_turn(client):
+    game_id, game = _start(client, seed=4)
+    client.post(f"/game/{game_id}/pass")
+    job = client.post(f"/game/{game_id}/ai-run").json()
+    result = _wait(client, game_id, job["job_id"])
+
+    assert result["status"] == "done"
+    assert [turn["player"] for turn in result["result"]["turns"]] == ["Sherlock", "Poirot", "Marple"]
+    assert game.state.current_player_index == 0 or game.state.phase == GamePhase.GAME_OVER
+
+
+def test_ai_run_stops_at_game_over(client, monkeypatch):
+    game_id, game = _start(client, seed=4)
+    client.post(f"/game/{game_id}/pass")
+
+    class Solver(HeuristicPolicy):
+        def decide_accusation(self, player, game_state, knowledge=None):
+            return {category: card.name for category, card in game.truth.items()}
+
+    monkeypatch.setattr(server, "policy_for", lambda session: Solver(rng=np.random.default_rng(0)))
+    job = client.post(f"/game/{game_id}/ai-run").json()
+    result = _wait(client, game_id, job["job_id"])
+
+    assert [turn["player"] for turn in result["result"]["turns"]] == ["Sherlock"]
+    assert game.state.phase == GamePhase.GAME_OVER and game.state.winner == "Sherlock"
@@ -0,0 +1,89 @@
+import threading
+import time
+
+import pytest
+
+from src.clue.sessions import GameBusy, SessionRegistry, VersionMismatch, etag, etag_matches
+
+
+def test_get_returns_created_session():
+    registry = SessionRegistry()
+    session = registry.create()
+    assert registry.get(session.game_id) is session
+
+
+def test_lru_eviction_keeps_recently_used():
+    registry = SessionRegistry(max_sessions=2)
+    evicted = []
+    registry.on_evict(lambda s: evicted.append(s.game_id))
+
+    first = registry.create()
+    second = registry.create()
+    registry.get(first.game_id)  # first is now most recently used
+    registry.create()
+
+    assert first.game_id in registry
+    assert second.game_id not in registry
+    assert evicted == [second.game_id]
+
+
+def test_idle_sessions_expire():
+    registry = SessionRegistry(idle_ttl=0.01)
+    session = registry.create()
+    time.sleep(0.02)
+    assert registry.sweep() == 1
+    with pytest.raises(KeyError):
+        registry.get(session.game_id)
+
+
+def test_etag_matches_any_listed_version():
+    assert etag(3) == '"3"'
+    assert etag_matches('"2", W/"3"', 3)
+    assert etag_matches("*", 3)
+    assert not etag_matches('"2"', 3)
+    assert not etag_matches(None, 3)
+
+
+def test_exclusive_rejects_stale_versions_and_concurrent_changes():
+    session = SessionRegistry().create()
+    session.game.initialize_game("Miss Scarlet", seed=1)
+    version = session.game.version
+
+    with session.exclusive(etag(version)) as game:
+        game.roll_for_turn()
+    assert session.game.version == version + 1
+    with pytest.raises(VersionMismatch):
+        with session.exclusive(etag(version)):
+            pass
+
+    held, done = threading.Event(), threading.Event()
+
+    def hold():
+        with session.game.lock:
+            held.set()
+            done.wait()
+
+    threading.Thread(target=hold).start()
+    held.wait()
+    try:
+        with pytest.raises(GameBusy):
+            with session.exclusive():
+                pass
+    finally:
+        done.set()
+
+
+def test_exclusive_waits_out_a_brief_hold():
+    session = SessionRegistry().create()
+    session.game.initialize_game("Miss Scarlet", seed=1)
+    held = threading.Event()
+
+    def peek():
+        with session.game.lock:  # Like a speculation copying a seat's knowledge
+            held.set()
+            time.sleep(0.01)
+
+    threading.Thread(target=peek).start()
+    held.wait()
+    with session.exclusive() as game:
+        game.roll_for_turn()
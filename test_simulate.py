@@ -0,0 +1,20 @@
+from src.clue.simulate import play_game, simulate, worker_decision_cache
+
+
+def test_self_play_games_finish():
+    result = play_game(3, ["heuristic", "random", "heuristic", "random"])
+    assert result["turns"] < 400
+    assert result["winner"] in (None, "heuristic", "random")
+
+
+def test_simulate_reports_win_rates_per_policy():
+    report = simulate(2, ["random"], workers=1)
+    assert report["games"] == 2
+    assert set(report["win_rate"]) == {"random"}
+
+
+def test_workers_share_one_decision_cache_per_path(tmp_path):
+    path = str(tmp_path / "decisions.db")
+    assert worker_decision_cache(path) is worker_decision_cache(path)
+    assert worker_decision_cache() is worker_decision_cache()
+    assert worker_decision_cache() is not worker_decision_cache(path)
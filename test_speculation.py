@@ -0,0 +1,71 @@
+import random
+
+import numpy as np
+
+from src.clue.game_logic import ClueGame
+from src.clue.policies import HeuristicPolicy, RandomPolicy
+from src.clue.speculation import Speculation, SpeculativePolicy, next_ai_seat
+from src.clue.turns import play_turn
+
+
+class CountingPolicy(HeuristicPolicy):
+    def __init__(self):
+        super().__init__(rng=np.random.default_rng(0))
+        self.calls = []
+
+    def decide_move(self, player, valid_moves, *args, **kwargs):
+        self.calls.append("move")
+        return super().decide_move(player, valid_moves, *args, **kwargs)
+
+    def decide_suspicion(self, player, current_room, *args, **kwargs):
+        self.calls.append("suspicion")
+        return super().decide_suspicion(player, current_room, *args, **kwargs)
+
+
+def new_game():
+    game = ClueGame()
+    game.initialize_game("Miss Scarlet", seed=11)
+    return game
+
+
+def test_speculation_covers_every_roll_without_touching_the_game():
+    game = new_game()
+    seat = next_ai_seat(game)
+    version = game.version
+    speculation = Speculation(game, seat).run(game, CountingPolicy())
+    assert game.version == version
+    assert speculation.complete and set(speculation.valid_moves) == set(range(2, 13))
+    assert speculation.destinations and not speculation.suspicions  # Heuristic suspicions draw from the rng
+    for options, destination in speculation.destinations.items():
+        assert destination in options
+
+
+def test_speculation_only_finds_valid_moves_for_undeclared_decisions():
+    game = new_game()
+    seat = next_ai_seat(game)
+    policy = RandomPolicy(random.Random(0))
+    state = policy.rng.getstate()
+    speculation = Speculation(game, seat).run(game, policy)
+    assert speculation.complete and speculation.valid_moves
+    assert not speculation.destinations and not speculation.suspicions
+    assert policy.rng.getstate() == state
+
+
+def test_ai_turn_answers_from_a_current_speculation():
+    game = new_game()
+    seat = next_ai_seat(game)
+    speculation = Speculation(game, seat).run(game, CountingPolicy())
+    game.next_turn()  # the human passes
+    policy = CountingPolicy()
+    summary = play_turn(game, SpeculativePolicy(policy, game, speculation))
+    assert "move" not in policy.calls
+
+
+def test_speculation_goes_stale_when_the_seat_is_dragged_or_learns():
+    game = new_game()
+    seat = next_ai_seat(game)
+    speculation = Speculation(game, seat)
+    assert speculation.is_current(game)
+    character = game.state.players[seat].character_name
+    game.handle_suspicion(character, "Rope", "Kitchen", game.state.current_player_index)
+    assert not speculation.is_current(game)
@@ -0,0 +1,49 @@
+import numpy as np
+
+from src.clue.deduction import Deduction
+from src.clue.game_logic import CATEGORIES, SUSPECTS, WEAPONS
+from src.clue.strategy import _solution_ids, choose_accusation, choose_suspicion
+
+
+def test_suspicion_is_valid_for_the_room():
+    deduction = Deduction(CATEGORIES, [4, 4, 4, 4])
+    deduction.see_hand(0, ["Miss Scarlet", "Dagger", "Kitchen", "Hall"])
+    choice = choose_suspicion(deduction, 0, "Study", np.random.default_rng(0))
+    assert choice["suspect"] in SUSPECTS
+    assert choice["weapon"] in WEAPONS
+    assert choice["room"] == "Study"
+
+
+def test_same_seed_gives_same_choice():
+    deduction = Deduction(CATEGORIES, [4, 4, 4, 4])
+    deduction.see_hand(0, ["Miss Scarlet", "Dagger", "Kitchen", "Hall"])
+    deduction.observe_suspicion(1, ["Mr. Green", "Rope", "Study"], passed=[2], shower=3)
+    first = choose_suspicion(deduction, 0, "Study", np.random.default_rng(5), time_budget=1.0)
+    second = choose_suspicion(deduction, 0, "Study", np.random.default_rng(5), time_budget=1.0)
+    assert first == second
+
+
+def test_large_decks_keep_solutions_apart():
+    categories = {
+        "suspect": [f"Suspect {i}" for i in range(30)],
+        "weapon": [f"Weapon {i}" for i in range(30)],
+        "room": [f"Room {i}" for i in range(10)],
+    }
+    deduction = Deduction(categories, [20, 20, 20])
+    solution = deduction.solution
+    # Two worlds that only differ in the solution room, whose cards sit past bit 63
+    owners = np.zeros((2, 70), dtype=np.int64)
+    owners[:, [0, 30]] = solution
+    owners[0, 64], owners[1, 69] = solution, solution
+    ids, count = _solution_ids(owners, solution)
+    assert count == 2 and ids[0] != ids[1]
+
+    deduction.see_hand(0, categories["suspect"][1:11] + categories["weapon"][1:11])
+    choice = choose_suspicion(deduction, 0, "Room 9", np.random.default_rng(0))
+    assert choice["suspect"] in categories["suspect"] and choice["room"] == "Room 9"
+
+
+def test_no_accusation_while_cards_can_still_be_found():
+    deduction = Deduction(CATEGORIES, [4, 4, 4, 4])
+    deduction.see_hand(0, ["Miss Scarlet", "Dagger", "Kitchen", "Hall"])
+    assert choose_accusation(deduction, rng=np.random.default_rng(0)) is None
@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from src.clue.game_logic import ClueGame
+from src.clue.models import GamePhase
+from src.clue.policies import RandomPolicy
+from src.clue.turns import plan_moves, play_turn, upcoming_ai_seats
+
+
+class BatchingPolicy(RandomPolicy):
+    """Decides a round of moves together, like ClueAI in "llm" move mode, and remembers what it was asked."""
+
+    batches_moves = True
+
+    def __init__(self):
+        super().__init__(random.Random(0))
+        self.batches = []
+
+    def decide_moves(self, requests, game_state):
+        self.batches.append(requests)
+        return {player.name: valid_moves[-1] for player, valid_moves, _ in requests if valid_moves}
+
+
+def _all_ai_game(seed=2):
+    game = ClueGame()
+    game.initialize_game(None, num_ai_players=4, seed=seed)
+    return game
+
+
+def test_batched_moves_are_decided_on_each_seats_own_knowledge():
+    game = _all_ai_game()
+    policy = BatchingPolicy()
+    seats = upcoming_ai_seats(game)
+    planned = plan_moves(game, seats, policy)
+
+    [requests] = policy.batches
+    assert [knowledge for _, _, knowledge in requests] == [game.deductions[i] for i in seats]
+    for index, (player, valid_moves, _) in zip(seats, requests):
+        assert planned[index]["destination"] == (valid_moves[-1] if valid_moves else None)
+
+
+def test_planned_rolls_are_used_instead_of_rolling_again():
+    game = _all_ai_game()
+    seats = upcoming_ai_seats(game)
+    planned = plan_moves(game, seats, RandomPolicy(random.Random(0)))
+
+    def no_more_rolls():
+        raise AssertionError("rolled again")
+
+    game.roll_dice = no_more_rolls
+    summary = play_turn(game, RandomPolicy(random.Random(0)), planned=planned[seats[0]])
+    assert summary["roll"] == planned[seats[0]]["roll"]
+    if planned[seats[0]]["valid_moves"]:
+        assert summary["destination"] in planned[seats[0]]["valid_moves"]
+
+
+def test_a_turn_left_halfway_is_resumed_not_replayed():
+    game = _all_ai_game()
+    policy = RandomPolicy(random.Random(0))
+    seat = game.state.current_player_index
+
+    class Hung(RandomPolicy):
+        def decide_move(self, *args, **kwargs):
+            raise RuntimeError("timed out")
+
+    def no_more_rolls():
+        raise AssertionError("rolled again")
+
+    # Abandoned after the roll: the resumed turn moves on that roll
+    with pytest.raises(RuntimeError):
+        play_turn(game, Hung(random.Random(0)))
+    offered = list(game.state.available_moves)
+    assert game.state.dice_rolled and offered
+    game.roll_dice = no_more_rolls
+    with pytest.raises(RuntimeError):
+        play_turn(game, policy, on_move=Hung(None).decide_move)
+    assert game.state.players[seat].position in offered
+
+    # Abandoned after the move: the resumed turn goes on to its accusation
+    assert game.state.current_player_index == seat and game.state.phase == GamePhase.PLAYER_TURN_ACTION
+    summary = play_turn(game, policy)
+    assert summary["resumed"] and "suspicion" not in summary
+    assert game.state.current_player_index != seat or game.state.phase == GamePhase.GAME_OVER